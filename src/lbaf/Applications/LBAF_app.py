@@ -106,6 +106,7 @@ class InternalParameters:
     # Load-balancing options
     work_model: Optional[Dict[str, dict]] = None
     algorithm: Dict[str, Any]
+    load_predictor: Optional[dict] = None
 
     def __init__(self, config: dict, base_dir: str, logger: Logger):
         self.__logger = logger
@@ -415,8 +416,8 @@ class LBAFApplication:
 
         if work_model is not None:
             w_stats = lbstats.print_function_statistics(
-                phase.get_ranks(),
-                work_model.compute,
+                work_model.compute_all(phase.get_ranks()).tolist(),
+                lambda x: x,
                 f"{phase_name} rank work",
                 self.__logger)
         else:
@@ -533,12 +534,19 @@ class LBAFApplication:
             # Retrieve n_ranks
             n_ranks = reader.n_ranks
 
+            # Phases only stepped through are populated on demand to bound memory usage
+            deferred = self.__parameters.algorithm.get("name") == "PhaseStepper" and not (
+                self.__parameters.grid_size
+                or self.__parameters.load_predictor
+                or self.__parameters.json_params.get("offline_lb_compatible", False))
+
             # Iterate over phase IDs
             for phase_id in self.__parameters.phase_ids:
-                # Create a phase and populate it
+                # Create a phase and populate it unless deferred
                 phase = Phase(
                     self.__logger, phase_id, reader=reader)
-                phase.populate_from_log(phase_id)
+                if not deferred or phase_id == min(self.__parameters.phase_ids):
+                    phase.populate_from_log(phase_id)
                 phases[phase_id] = phase
         else:
             n_ranks = self.__parameters.n_ranks
@@ -565,46 +573,59 @@ class LBAFApplication:
             phases,
             self.__parameters.work_model,
             self.__parameters.algorithm,
-            self.__logger)
+            self.__logger,
+            self.__parameters.load_predictor)
 
         # Execute runtime for specified phases
         offline_lb_compatible = self.__parameters.json_params.get(
             "offline_lb_compatible", False)
-        rebalanced_phase = runtime.execute(
-            self.__parameters.algorithm.get("phase_id", 0),
-            1 if offline_lb_compatible else 0,
-            self.__parameters.json_params.get("lb_iterations", False))
+        if isinstance(lb_phase_id := self.__parameters.algorithm.get("phase_id", 0), int):
+            rebalanced_phase = runtime.execute(
+                lb_phase_id,
+                1 if offline_lb_compatible else 0)
+            rebalanced_phases = {rebalanced_phase.get_id(): rebalanced_phase} if rebalanced_phase else {}
+        else:
+            # Rebalance all or listed phases independently
+            rebalanced_phases = runtime.execute_batch(
+                None if lb_phase_id == "all" else lb_phase_id,
+                1 if offline_lb_compatible else 0,
+                self.__parameters.algorithm.get("n_batch_workers", 1))
+            rebalanced_phase = rebalanced_phases[max(rebalanced_phases)] if rebalanced_phases else None
 
         # Instantiate phase to VT file writer when requested
         if self.__json_writer:
             if offline_lb_compatible:
-                # Add rebalanced phase when present
-                if not rebalanced_phase:
+                # Add rebalanced phases when present
+                if not rebalanced_phases:
                     self.__logger.warning(
                         "No rebalancing took place for offline load-balancing")
-                else:
+                for p_id, lbp in rebalanced_phases.items():
                     # Determine if a phase with same index was present
-                    if _existing_phase := phases.get(p_id := rebalanced_phase.get_id()):
+                    if _existing_phase := phases.get(p_id):
                         # Apply object timings to rebalanced phase
                         self.__logger.info(
                             f"Phase {p_id} already present, applying its object loads to rebalanced phase")
                         original_loads = {
                             o.get_id(): o.get_load()
                             for o in phases[p_id].get_objects()}
-                        for o in rebalanced_phase.get_objects():
+                        for o in lbp.get_objects():
                             o.set_load(original_loads[o.get_id()])
 
                     # Insert rebalanced phase into dictionary of phases
-                    phases[p_id] = rebalanced_phase
+                    phases[p_id] = lbp
 
                 # Write all phasesOA
                 self.__logger.info(
                     f"Writing all ({len(phases)}) phases for offline load-balancing")
                 self.__json_writer.write(phases)
-            else:
+            elif isinstance(lb_phase_id, int):
                 # Add new phase when load balancing when offline mode not selected
                 self.__logger.info(f"Creating rebalanced phase {phase_id}")
                 self.__json_writer.write({phase_id: rebalanced_phase})
+            else:
+                # Add new phases when batch load balancing when offline mode not selected
+                self.__logger.info(f"Creating rebalanced phases {list(rebalanced_phases)}")
+                self.__json_writer.write(rebalanced_phases)
 
         # Generate meshes and multimedia when requested
         if self.__parameters.grid_size:
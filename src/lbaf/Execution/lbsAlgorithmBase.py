@@ -44,7 +44,6 @@ import abc
 from typing import List
 
 from ..IO.lbsStatistics import compute_function_statistics
-from ..Model.lbsNode import Node
 from ..Model.lbsPhase import Phase
 from ..Model.lbsWorkModelBase import WorkModelBase
 from ..Utils.lbsLogging import Logger
@@ -99,9 +98,8 @@ class AlgorithmBase:
         self.__statistics = {
             ("ranks", lambda x: x.get_load()): {
                 "maximum load": "maximum"},
-            ("ranks", lambda x: self._work_model.compute(x)): {
-                "maximum work": "maximum"},
-            ("ranks", lambda x: self._work_model.compute(x)): {
+            ("works", lambda x: x): {
+                "maximum work": "maximum",
                 "total work": "sum"}}
 
     def get_initial_communications(self):
@@ -130,6 +128,12 @@ class AlgorithmBase:
         from .lbsPrescribedPermutationAlgorithm import PrescribedPermutationAlgorithm
         from .lbsPhaseStepperAlgorithm import PhaseStepperAlgorithm
         from .lbsCentralizedPrefixOptimizerAlgorithm import CentralizedPrefixOptimizerAlgorithm
+        from .lbsEnsembleAlgorithm import EnsembleAlgorithm
+        from .lbsGreedyAlgorithm import GreedyAlgorithm
+        from .lbsLargestDifferencingAlgorithm import LargestDifferencingAlgorithm
+        from .lbsMultilevelAlgorithm import MultilevelAlgorithm
+        from .lbsDiffusionAlgorithm import DiffusionAlgorithm
+        from .lbsHierarchicalAlgorithm import HierarchicalAlgorithm
         # pylint:enable=W0641:possibly-unused-variable,C0415:import-outside-toplevel
 
         # Ensure that algorithm name is valid
@@ -146,12 +150,41 @@ class AlgorithmBase:
         """Compute and update run statistics."""
         # Create or update statistics dictionary entries
         for (support, getter), stat_names in self.__statistics.items():
+            # Rank works are evaluated at once by the work model
+            if support == "works":
+                population = self._work_model.compute_all(
+                    self._rebalanced_phase.get_ranks()).tolist()
+            else:
+                population = getattr(self._rebalanced_phase, f"get_{support}")()
+            stats = compute_function_statistics(population, getter)
             for k, v in stat_names.items():
                 self._logger.debug(f"Updating {k} statistics for {support}")
-                stats = compute_function_statistics(
-                    getattr(self._rebalanced_phase, f"get_{support}")(), getter)
                 statistics.setdefault(k, []).append(getattr(stats, f"get_{v}")())
 
+        # Critical path is only tracked when defined by work model
+        if (w_path := self._work_model.compute_critical_path(
+                self._rebalanced_phase.get_ranks())) is not None:
+            statistics.setdefault("critical path", []).append(w_path)
+
+    def _apply_mapping(self, mapping: dict, statistics: dict):
+        """Transfer objects of rebalanced phase to ranks of given mapping, then update and report statistics."""
+        # Transfer objects whose destination rank differs from current one
+        n_transfers = 0
+        sources = {o: r for r in self._rebalanced_phase.get_ranks() for o in r.get_objects()}
+        for o, r_dst in mapping.items():
+            if (r_src := sources[o]) is not r_dst:
+                self._rebalanced_phase.transfer_object(r_src, o, r_dst)
+                n_transfers += 1
+
+        # Report on object transfers
+        self._logger.info(f"{n_transfers} transfers occurred")
+
+        # Update run statistics
+        self._update_statistics(statistics)
+
+        # Report final mapping in debug mode
+        self._report_final_mapping(self._logger)
+
     def _report_final_mapping(self, logger):
         """Report final rank object mapping in debug mode."""
         for rank in self._rebalanced_phase.get_ranks():
@@ -192,6 +225,7 @@ class AlgorithmBase:
         # Create storage for rebalanced phase
         self._rebalanced_phase = Phase(self._logger, p_id)
         self._rebalanced_phase.copy_ranks(self._initial_phase)
+        self._work_model.set_phase(self._rebalanced_phase)
         self._logger.info(
             f"Processing phase {p_id} "
             f"with {self._rebalanced_phase.get_number_of_objects()} objects "
@@ -205,7 +239,7 @@ class AlgorithmBase:
     def execute(self, p_id, phases, statistics):
         """Execute balancing algorithm on Phase instance.
 
-        :param: p_id: index of phase to be rebalanced (all if equal to _)
+        :param: p_id: index of phase to be rebalanced, see Runtime.execute_batch for multiple phases
         :param: phases: list of Phase instances
         :param: statistics: dictionary of  statistics
         """
@@ -0,0 +1,259 @@
+#
+#@HEADER
+###############################################################################
+#
+#                            lbsBitsetKnownPeers.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+from collections.abc import Mapping
+
+import numpy as np
+
+from ..Model.lbsRank import Rank
+
+
+# Bits of each byte value, most significant first as with numpy.packbits
+BYTE_BITS = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1)
+
+# Number of set bits of each byte value
+BYTE_POPCOUNT = BYTE_BITS.sum(axis=1).astype(np.int64)
+
+# Number of set bits of each 16-bit value
+SHORT_POPCOUNT = (
+    BYTE_POPCOUNT[np.arange(1 << 16) & 0xFF] + BYTE_POPCOUNT[np.arange(1 << 16) >> 8]).astype(np.uint8)
+
+# Position of k-th set bit of each byte value
+BYTE_SELECT = np.zeros((256, 8), dtype=np.int64)
+for b_value in range(256):
+    b_positions = np.flatnonzero(BYTE_BITS[b_value])
+    BYTE_SELECT[b_value, :len(b_positions)] = b_positions
+
+
+class BitsetKnownPeers(Mapping):
+    """A mapping of ranks to their known peers stored as a ranks x ranks bit matrix.
+
+    Each rank initially only knows itself. Information rounds are
+    bulk-synchronous: all messages of a round carry supports as known at
+    its start, and are merged by bitwise OR.
+    """
+
+    def __init__(self, ranks: list, rng: np.random.Generator, max_chunk_bytes: int = 1 << 26):
+        """Class constructor.
+
+        :param ranks: list of Rank instances
+        :param rng: a NumPy random generator used to sample message targets
+        :param max_chunk_bytes: approximate memory bound of temporary arrays
+        """
+        # Index ranks by increasing ID for reproducibility
+        self.__ranks = sorted(ranks, key=lambda r: r.get_id())
+        self.__index = {r: i for i, r in enumerate(self.__ranks)}
+        self.__rng = rng
+
+        # Rows are stored as 64-bit words with only diagonal bits set
+        n_r = len(self.__ranks)
+        self.__words = np.zeros((n_r, (n_r + 63) // 64), dtype=np.uint64)
+        diagonal = np.arange(n_r)
+        self.get_bits()[diagonal, diagonal >> 3] = 0x80 >> (diagonal & 7)
+
+        # Number of rows processed at once in temporary arrays
+        self.__chunk = max(1, max_chunk_bytes // (64 * max(1, self.__words.shape[1])))
+
+    def __getitem__(self, rank: Rank) -> set:
+        """Return set of peers known to rank, including itself."""
+        row = self.get_bits()[self.__index[rank]]
+        return {self.__ranks[i] for i in np.flatnonzero(np.unpackbits(row, count=len(self.__ranks)))}
+
+    def __iter__(self):
+        return iter(self.__ranks)
+
+    def __len__(self):
+        return len(self.__ranks)
+
+    def get_ranks(self) -> list:
+        """Return ranks in matrix row order."""
+        return self.__ranks
+
+    def get_bits(self) -> np.ndarray:
+        """Return packed ranks x ranks knowledge matrix."""
+        return self.__words.view(np.uint8)
+
+    def __count_word_bits(self, words: np.ndarray) -> np.ndarray:
+        """Return numbers of set bits of each word."""
+        shorts = SHORT_POPCOUNT[words.view(np.uint16)]
+        return (shorts[..., 0::4] + shorts[..., 1::4] + shorts[..., 2::4] + shorts[..., 3::4]).astype(np.int64)
+
+    def get_numbers_of_known_peers(self) -> np.ndarray:
+        """Return numbers of peers known to each rank, including itself."""
+        counts = np.zeros(len(self.__ranks), dtype=np.int64)
+        for lo in range(0, len(self.__ranks), self.__chunk):
+            counts[lo:lo + self.__chunk] = self.__count_word_bits(
+                self.__words[lo:lo + self.__chunk]).sum(axis=1)
+        return counts
+
+    def get_kappas(self) -> np.ndarray:
+        """Return knowledge ratios of all ranks."""
+        n_r = len(self.__ranks)
+        return (self.get_numbers_of_known_peers() - 1) / (n_r - 1) if n_r > 1 else np.zeros(n_r)
+
+    def __sample_ordinals(self, counts: np.ndarray, fanout: int) -> np.ndarray:
+        """Sample min(fanout, count) distinct ordinals below count in each row, -1 padded.
+
+        Uses Floyd's algorithm vectorized across rows.
+        """
+        m = np.minimum(counts, fanout)
+        draws = np.full((len(counts), fanout), -1, dtype=np.int64)
+        for s in range(fanout):
+            j = counts - m + s
+            t = np.floor(self.__rng.random(len(counts)) * (j + 1)).astype(np.int64)
+            duplicate = (draws[:, :s] == t[:, None]).any(axis=1)
+            draws[:, s] = np.where(s < m, np.where(duplicate, j, t), -1)
+        return draws
+
+    def __sample_known_peers(self, lo: int, hi: int, fanout: int) -> np.ndarray:
+        """Sample indices of known peers other than self of rows lo to hi, -1 padded."""
+        # Clear self bits in a copy of rows
+        words = self.__words[lo:hi].copy()
+        rows = words.view(np.uint8)
+        i = np.arange(hi - lo)
+        rows[i, (lo + i) >> 3] &= (~(0x80 >> ((lo + i) & 7)) & 0xFF).astype(np.uint8)
+
+        # Sample ordinals of known peers from word bit counts
+        word_counts = self.__count_word_bits(words)
+        ordinals = self.__sample_ordinals(word_counts.sum(axis=1), fanout)
+
+        # Locate word containing each selected bit using row-offset prefix sums
+        n_words = words.shape[1]
+        offsets = i * (len(self.__ranks) + 1)
+        cumulated = (np.cumsum(word_counts, axis=1) + offsets[:, None]).ravel()
+        valid = ordinals >= 0
+        r_i, _ = np.nonzero(valid)
+        k = ordinals[valid]
+        flat = np.searchsorted(cumulated, k + offsets[r_i], side="right")
+        word = flat - r_i * n_words
+        k -= cumulated[flat] - offsets[r_i] - word_counts[r_i, word]
+
+        # Locate byte containing selected bit within its word
+        values = rows[r_i[:, None], word[:, None] * 8 + np.arange(8)]
+        byte_cumulated = np.cumsum(BYTE_POPCOUNT[values], axis=1)
+        byte = (byte_cumulated <= k[:, None]).sum(axis=1)
+        j = np.arange(len(k))
+        k -= byte_cumulated[j, byte] - BYTE_POPCOUNT[values[j, byte]]
+
+        # Locate selected bit within its byte
+        peers = np.full(ordinals.shape, -1, dtype=np.int64)
+        peers[valid] = (word * 8 + byte) * 8 + BYTE_SELECT[values[j, byte], k]
+        return peers
+
+    def sample_targets(self, fanout: int, initial: bool = False):
+        """Return sender and recipient indices of messages of an information round.
+
+        Initial messages are sent to ranks sampled amongst all others,
+        later ones to ranks sampled amongst known peers.
+        """
+        n_r = len(self.__ranks)
+        senders, recipients = [], []
+        for lo in range(0, n_r, self.__chunk):
+            i = np.arange(lo, min(lo + self.__chunk, n_r))
+            if initial:
+                # Skip own index when sampling amongst all other ranks
+                peers = self.__sample_ordinals(np.full(len(i), n_r - 1), fanout)
+                peers = np.where(peers >= i[:, None], peers + 1, peers)
+                peers[peers > n_r - 1] = -1
+            else:
+                # Sample amongst known peers other than self
+                peers = self.__sample_known_peers(lo, lo + len(i), fanout)
+            valid = peers >= 0
+            senders.append(np.broadcast_to(i[:, None], peers.shape)[valid])
+            recipients.append(peers[valid])
+
+        # Return flattened message endpoints
+        return (np.concatenate(senders), np.concatenate(recipients)) if senders else (
+            np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+
+    def merge(self, senders: np.ndarray, recipients: np.ndarray):
+        """Merge supports of senders into those of recipients, as known before merge."""
+        # Rank messages received by each recipient
+        order = np.argsort(recipients, kind="stable")
+        senders, recipients = senders[order], recipients[order]
+        starts = np.flatnonzero(np.r_[True, recipients[1:] != recipients[:-1]])
+        levels = np.arange(len(recipients)) - np.repeat(starts, np.diff(np.r_[starts, len(recipients)]))
+
+        # Merge into scratch rows of recipients only, so that rows of senders remain as known before merge
+        unique, slots = np.unique(recipients, return_inverse=True)
+        merged = self.__words[unique]
+
+        # Merge k-th messages of all recipients at once, recipients being distinct
+        level_order = np.argsort(levels, kind="stable")
+        level_starts = np.searchsorted(levels[level_order], np.arange(levels.max() + 1 if len(levels) else 0))
+        for lo, hi in zip(level_starts, np.r_[level_starts[1:], len(levels)]):
+            messages = level_order[lo:hi]
+            for c_lo in range(0, len(messages), self.__chunk):
+                m = messages[c_lo:c_lo + self.__chunk]
+                merged[slots[m]] |= self.__words[senders[m]]
+
+        # Write back merged rows of recipients
+        self.__words[unique] = merged
+
+    def execute_round(self, fanout: int, initial: bool = False) -> int:
+        """Execute an information round and return number of messages sent."""
+        senders, recipients = self.sample_targets(fanout, initial)
+        self.merge(senders, recipients)
+        return len(senders)
+
+
+class BitsetKnownLoads(Mapping):
+    """A mapping of ranks to loads of their known peers, as given by rows of a bit matrix of known peers."""
+
+    def __init__(self, known_peers: BitsetKnownPeers, loads: dict):
+        """Class constructor.
+
+        :param known_peers: a BitsetKnownPeers instance
+        :param loads: a dictionary of loads of all ranks
+        """
+        self.__known_peers = known_peers
+        self.__loads = loads
+
+    def __getitem__(self, rank: Rank) -> dict:
+        """Return loads of peers known to rank, including itself."""
+        return {r: self.__loads[r] for r in self.__known_peers[rank]}
+
+    def __iter__(self):
+        return iter(self.__known_peers)
+
+    def __len__(self):
+        return len(self.__known_peers)
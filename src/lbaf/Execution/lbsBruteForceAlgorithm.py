@@ -44,8 +44,11 @@
 from logging import Logger
 
 from ..Model.lbsAffineCombinationWorkModel import AffineCombinationWorkModel
+from ..Model.lbsLoadOnlyWorkModel import LoadOnlyWorkModel
 from .lbsAlgorithmBase import AlgorithmBase
-from ..IO.lbsStatistics import compute_min_max_arrangements_work
+from ..IO.lbsStatistics import (
+    compute_min_max_arrangements_work_vectorized, compute_min_max_arrangement_branch_and_bound)
+from ..Utils.lbsForkPool import get_number_of_workers
 
 
 class BruteForceAlgorithm(AlgorithmBase):
@@ -62,6 +65,19 @@ class BruteForceAlgorithm(AlgorithmBase):
 
         # Assign optional parameters
         self.__skip_transfer = parameters.get("skip_transfer", False)
+        self.__branch_and_bound = parameters.get("branch_and_bound", False)
+        self.__branch_and_bound_rtol = parameters.get("branch_and_bound_rtol", 0.0)
+        if self.__branch_and_bound_rtol < 0.0:
+            self._logger.error(
+                f"Incorrect provided branch-and-bound relative tolerance: {self.__branch_and_bound_rtol}")
+            raise SystemExit(1)
+        self.__branch_and_bound_max_nodes = parameters.get("branch_and_bound_max_nodes")
+        if self.__branch_and_bound_max_nodes is not None and (
+                not isinstance(self.__branch_and_bound_max_nodes, int) or self.__branch_and_bound_max_nodes < 1):
+            self._logger.error(
+                f"Incorrect provided branch-and-bound maximum number of nodes: {self.__branch_and_bound_max_nodes}")
+            raise SystemExit(1)
+        self.__n_workers = get_number_of_workers(parameters, self._logger)
         self._logger.info(
             f"Instantiated {'with' if self.__skip_transfer else 'without'} transfer stage skipping")
 
@@ -70,51 +86,38 @@ class BruteForceAlgorithm(AlgorithmBase):
         # Perform pre-execution checks and initializations
         self._initialize(p_id, phases, statistics)
         self._logger.info("Starting brute force optimization")
-        initial_phase = phases[min(phases.keys())]
-        phase_ranks = initial_phase.get_ranks()
-        objects = initial_phase.get_objects()
-        n_ranks = len(phase_ranks)
+        phase_ranks = sorted(self._rebalanced_phase.get_ranks(), key=lambda r: r.get_id())
         affine_combination = isinstance(
             self._work_model, AffineCombinationWorkModel)
-        alpha, beta, gamma, delta = [
-            self._work_model.get_alpha() if affine_combination else 1.0,
+        beta, gamma, delta = [
             self._work_model.get_beta() if affine_combination else 0.0,
             self._work_model.get_gamma() if affine_combination else 0.0,
             self._work_model.get_delta() if affine_combination else 0.0]
-        _n_a, _w_min_max, a_min_max = compute_min_max_arrangements_work(
-            objects, alpha, beta, gamma, delta, n_ranks,
-            logger=self._logger)
+
+        # Search arrangements of migratable objects with branch-and-bound when work only depends on load
+        load_only = isinstance(self._work_model, LoadOnlyWorkModel)
+        if self.__branch_and_bound and (load_only or affine_combination and beta == 0.0 and delta == 0.0):
+            objects = [o for r in phase_ranks for o in sorted(r.get_migratable_objects(), key=lambda o: o.get_id())]
+            _n_nodes, _w_min_max, arrangement = compute_min_max_arrangement_branch_and_bound(
+                [o.get_load() for o in objects],
+                [1.0 if load_only else r.get_alpha() for r in phase_ranks],
+                [sum(o.get_load() for o in r.get_sentinel_objects()) for r in phase_ranks],
+                gamma, self.__branch_and_bound_rtol, self.__branch_and_bound_max_nodes, logger=self._logger)
+
+        # Otherwise evaluate all arrangements of objects by batches
+        else:
+            objects = self._rebalanced_phase.get_objects()
+            _n_a, _w_min_max, a_min_max = compute_min_max_arrangements_work_vectorized(
+                objects, 1.0, beta, gamma, delta, len(phase_ranks),
+                n_workers=self.__n_workers, logger=self._logger)
+            arrangement = a_min_max[0]
 
         # Skip object transfers when requested
         if self.__skip_transfer:
             self._logger.info("Skipping object transfers")
             return
 
-        # Pick first optimal arrangement and reassign objects accordingly
-        n_transfers = 0
-        arrangement = a_min_max[0]
+        # Reassign objects according to optimal arrangement
         self._logger.debug(
             f"Reassigning objects with arrangement {arrangement}")
-        for i, a in enumerate(arrangement):
-            # Skip objects that do not need transfer
-            r_src = phase_ranks[objects[i].get_rank_id()]
-            r_dst = phase_ranks[a]
-            if r_src == r_dst:
-                continue
-
-            # Otherwise locate object on source and transfer to destination
-            object_id = objects[i].get_id()
-            for o in r_src.get_objects():
-                if o.get_id() == object_id:
-                    # Perform transfer
-                    self._rebalanced_phase.transfer_object(r_src, o, r_dst)
-                    n_transfers += 1
-
-        # Report on object transfers
-        self._logger.info(f"{n_transfers} transfers occurred")
-
-        # Update run statistics
-        self._update_statistics(statistics)
-
-        # Report final mapping in debug mode
-        self._report_final_mapping(self._logger)
+        self._apply_mapping({o: phase_ranks[a] for o, a in zip(objects, arrangement)}, statistics)
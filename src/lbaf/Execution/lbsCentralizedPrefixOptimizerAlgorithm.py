@@ -40,10 +40,13 @@
 ###############################################################################
 #@HEADER
 #
-import heapq
+import bisect
+import itertools
+from collections import Counter
 from logging import Logger
 
 from .lbsAlgorithmBase import AlgorithmBase
+from .lbsIndexedHeap import IndexedHeap
 from ..IO.lbsStatistics import print_function_statistics
 
 
@@ -62,6 +65,85 @@ class CentralizedPrefixOptimizerAlgorithm(AlgorithmBase):
         self._phase = None
         self._max_shared_ids = None
 
+        # Rank loads, shared block counts and groupings of migratable objects by shared block
+        self.__loads = {}
+        self.__shared_counts = {}
+        self.__groupings = {}
+        self.__block_ranks = {}
+
+        # Ranks by decreasing load, and ranks which may take a new shared block by increasing load
+        self.__max_heap = None
+        self.__open_heap = None
+
+    def __initialize_rank_data(self, ranks):
+        """Compute rank data structures maintained across transfers."""
+        self.__loads, self.__shared_counts, self.__groupings, self.__block_ranks = {}, {}, {}, {}
+        for rank in ranks:
+            self.__loads[rank] = rank.get_load()
+            self.__shared_counts[rank] = Counter(
+                o.get_shared_id() for o in rank.get_objects() if o.get_shared_id() is not None)
+            for sid in self.__shared_counts[rank]:
+                self.__block_ranks.setdefault(sid, set()).add(rank)
+            self.__groupings[rank] = {}
+            for o in rank.get_migratable_objects():
+                grouping = self.__groupings[rank].setdefault(o.get_shared_id(), [0.0, set()])
+                grouping[0] += o.get_load()
+                grouping[1].add(o)
+        self._max_shared_ids = max((len(c) for c in self.__shared_counts.values()), default=0) + 1
+        self.__max_heap = IndexedHeap((r, (-l, r.get_id())) for r, l in self.__loads.items())
+        self.__open_heap = IndexedHeap(
+            (r, (l, r.get_id())) for r, l in self.__loads.items()
+            if len(self.__shared_counts[r]) < self._max_shared_ids)
+
+    def __set_load(self, rank, load: float):
+        """Update load of rank in heaps."""
+        self.__loads[rank] = load
+        self.__max_heap.update(rank, (-load, rank.get_id()))
+        if rank in self.__open_heap:
+            self.__open_heap.update(rank, (load, rank.get_id()))
+
+    def __transfer(self, r_src, o, r_dst):
+        """Transfer object and incrementally update rank data structures."""
+        self._phase.transfer_object(r_src, o, r_dst)
+        load, sid = o.get_load(), o.get_shared_id()
+        self.__set_load(r_src, self.__loads[r_src] - load)
+        self.__set_load(r_dst, self.__loads[r_dst] + load)
+
+        # Move object between groupings of source and destination
+        grouping = self.__groupings[r_src][sid]
+        grouping[0] -= load
+        grouping[1].discard(o)
+        if not grouping[1]:
+            del self.__groupings[r_src][sid]
+        grouping = self.__groupings[r_dst].setdefault(sid, [0.0, set()])
+        grouping[0] += load
+        grouping[1].add(o)
+        if sid is None:
+            return
+
+        # Update shared blocks of source, which may then take a new one
+        self.__shared_counts[r_src][sid] -= 1
+        if not self.__shared_counts[r_src][sid]:
+            del self.__shared_counts[r_src][sid]
+            self.__block_ranks[sid].discard(r_src)
+            if len(self.__shared_counts[r_src]) < self._max_shared_ids:
+                self.__open_heap.push(r_src, (self.__loads[r_src], r_src.get_id()))
+
+        # Update shared blocks of destination, which may then not take a new one
+        self.__shared_counts[r_dst][sid] += 1
+        if self.__shared_counts[r_dst][sid] == 1:
+            self.__block_ranks.setdefault(sid, set()).add(r_dst)
+            if len(self.__shared_counts[r_dst]) >= self._max_shared_ids and r_dst in self.__open_heap:
+                self.__open_heap.remove(r_dst)
+
+    def __accepts(self, rank, sid) -> bool:
+        """Return whether rank may take objects of shared block under memory constraints."""
+        return sid in self.__shared_counts[rank] or len(self.__shared_counts[rank]) < self._max_shared_ids
+
+    def __get_eligible_ranks(self, sid) -> set:
+        """Return ranks which may take objects of shared block."""
+        return self.__block_ranks.get(sid, set()).union(self.__open_heap)
+
     def execute(self, p_id: int, phases: list, statistics: dict):
         """ Execute centralized prefix memory-constrained optimizer"""
 
@@ -79,78 +161,42 @@ class CentralizedPrefixOptimizerAlgorithm(AlgorithmBase):
         self._logger.info("Starting optimizer")
         phase_ranks = self._phase.get_ranks()
 
-        # Initialize max shared ID
-        max_shared_ids = 0
-        for rank in phase_ranks:
-            max_shared_ids = max(len(rank.get_shared_ids()), max_shared_ids)
-        self._max_shared_ids = max_shared_ids + 1
-
-
-        # Max-heap for rank's load
-        rank_max_heap = []
-
-        # Add the ranks to the list
-        for rank in phase_ranks:
-            rank_max_heap.append(rank)
+        # Initialize rank data structures and max shared ID
+        self.__initialize_rank_data(phase_ranks)
 
         # Iterate until number of assignments reached
-        made_no_assignments = 0
+        made_no_assignments, iteration = 0, 0
         while made_no_assignments < 2:
-            # Make the actual heap
-            heapq._heapify_max(rank_max_heap)
-
             # Get the max rank from the heap
-            max_rank = heapq._heappop_max(rank_max_heap)
+            max_rank, _ = self.__max_heap.peek()
+            iteration += 1
 
             # Amount of load we should remove from the max rank to bring it to average
-            diff = max_rank.get_load() - statistics["average load"]
+            diff = self.__loads[max_rank] - statistics["average load"]
             self._logger.info(f"diff={diff}")
 
-            # Keep track of objects that share memory and the load sums for them
-            shared_map, obj_shared_map = {}, {}
-
-            # Array of loads grouped by shared ID, and prefix array after sorted
-            groupings, groupings_sum = [], []
-
-            # Fill up the data structures
-            for o in max_rank.get_migratable_objects():
-                if not o.get_shared_id() in obj_shared_map:
-                    obj_shared_map[o.get_shared_id()] = []
-                if not o.get_shared_id() in shared_map:
-                    shared_map[o.get_shared_id()] = 0
-                obj_shared_map[o.get_shared_id()].append(o)
-                shared_map[o.get_shared_id()] += o.get_load()
-
-            for sid, value in obj_shared_map.items():
-                value.sort(reverse=True, key=lambda x: x.get_load())
-
-            for sid, value in shared_map.items():
-                groupings.append((value, sid))
-
-            # Sort the groupings so we can compute the prefix sum
-            groupings.sort()
+            # Array of loads grouped by shared ID, sorted to compute prefix sums
+            groupings = sorted(
+                ((load, sid) for sid, (load, _) in self.__groupings[max_rank].items()),
+                key=lambda x: x[0])
+            if not groupings:
+                self._logger.info("No migratable objects on max rank")
+                made_no_assignments += 1
+                continue
 
             # Compute the prefix sum of grouped loads by shared ID
-            for i in range(len(groupings)):
-                groupings_sum.append(0)
-            groupings_sum[0] = groupings[0][0]
-            for i in range(1,len(groupings)):
-                groupings_sum[i] = groupings_sum[i-1] + groupings[i][0]
-
-            for i in range(len(groupings)):
-                self._logger.info(f"i={i} sum={groupings_sum[i]}")
+            groupings_sum = list(itertools.accumulate(load for load, _ in groupings))
+            for i, load_sum in enumerate(groupings_sum):
+                self._logger.debug(f"i={i} sum={load_sum}")
 
             # Pick a bracketed range of grouped loads to consider for migration
             # The range should be sufficiently large enough to get us down to
             # the average
-            pick_upper = 0
-            while groupings_sum[pick_upper] < diff:
-                pick_upper += 1
+            pick_upper = min(bisect.bisect_left(groupings_sum, diff), len(groupings_sum) - 1)
             if pick_upper-1 >= 0 and groupings_sum[pick_upper-1] >= diff * 1.05:
                 pick_upper -= 1
-            pick_lower = pick_upper-1
-            while (pick_lower-1 >= -1 and groupings_sum[pick_upper] - groupings_sum[pick_lower] < diff):
-                pick_lower -= 1
+            pick_lower = bisect.bisect_right(
+                groupings_sum, groupings_sum[pick_upper] - diff, 0, pick_upper) - 1
 
             self._logger.info(f"pick=({pick_lower},{pick_upper}]")
 
@@ -158,37 +204,25 @@ class CentralizedPrefixOptimizerAlgorithm(AlgorithmBase):
 
             if made_no_assignments and self._do_second_stage:
                 for i, (size, sid) in enumerate(groupings):
-                    ret = self._consider_swaps(phase_ranks, max_rank, i, size, sid, diff, obj_shared_map)
+                    ret = self._consider_swaps(max_rank, i, size, sid, diff)
                     made_assignment = made_assignment or ret
                     if ret:
                         break
-                # for i in reversed(range(0,len(groupings))):
-                #     size = groupings[i][0]
-                #     sid = groupings[i][1]
-                #     ret = self._try_bin_fully(phase_ranks, max_rank, i, size, sid, obj_shared_map)
-                #     made_assignment = made_assignment or ret
-                #     if made_assignment:
-                #         made_no_assignments = 0
-                #     if ret:
-                #         break;
             else:
                 for i in range(pick_lower+1,pick_upper+1):
                     size = groupings[i][0]
                     sid = groupings[i][1]
-                    ret = self._try_bin(phase_ranks, max_rank, i, size, sid, obj_shared_map)
+                    ret = self._try_bin(max_rank, i, size, sid)
                     made_assignment = made_assignment or ret
 
-            # Add max rank back to the heap
-            rank_max_heap.append(max_rank)
-
             if not made_assignment:
                 made_no_assignments += 1
             else:
                 # Compute and report iteration work statistics
                 print_function_statistics(
-                    self._phase.get_ranks(),
-                    self._work_model.compute,
-                    f"iteration {i + 1} rank work",
+                    self._work_model.compute_all(self._phase.get_ranks()).tolist(),
+                    lambda x: x,
+                    f"iteration {iteration} rank work",
                     self._logger)
 
                 # Update run statistics
@@ -197,49 +231,28 @@ class CentralizedPrefixOptimizerAlgorithm(AlgorithmBase):
         # Report final mapping in debug mode
         self._report_final_mapping(self._logger)
 
-    def _try_bin(self, ranks, max_rank, tbin, size, sid, objs):
+    def _try_bin(self, max_rank, tbin, size, sid):
         """Try to find a rank to offload a bin (load grouping that shares a common memory ID)"""
 
-        # Min-heap of ranks
-        rank_min_heap = []
-
-        # Add all ranks that could possibly take this load grouping based on memory usage
+        # Pick the rank that is most underloaded (greedy) amongst those that
+        # could possibly take this load grouping based on memory usage
         self._logger.info(f"tryBin size={size}, max={self._max_shared_ids}")
-        for rank in ranks:
-            if sid in rank.get_shared_ids() or len(rank.get_shared_ids()) < self._max_shared_ids:
-                rank_min_heap.append(rank)
-
-        # Create the actual min-heap
-        heapq.heapify(rank_min_heap)
-
-        # The selected rank
-        min_rank = None
+        candidates = [self.__open_heap.peek()[0]] if self.__open_heap else []
+        candidates.extend(self.__block_ranks.get(sid, ()))
+        if not candidates:
+            self._logger.error("Reached condition where no ranks could take the element!")
+            raise SystemExit(1)
+        min_rank = min(candidates, key=lambda r: (self.__loads[r], r.get_id()))
 
         tally_assigned, tally_rejected = 0, 0
 
-        for o in objs[sid]:
-            if len(rank_min_heap) == 0:
-                self._logger.error("Reached condition where no ranks could take the element!")
-                raise SystemExit(1)
-
-            # Pick the rank that is most underloaded (greedy)
-            if min_rank is None:
-                min_rank = heapq.heappop(rank_min_heap)
-
-            selected_load = o.get_load()
-
+        for o in sorted(self.__groupings[max_rank][sid][1], key=lambda x: x.get_load(), reverse=True):
             # If our situation is not made worse and fits under memory constraints, do the transfer
-            if (sid in min_rank.get_shared_ids() or \
-                len(min_rank.get_shared_ids()) < self._max_shared_ids) and \
-                min_rank.get_load() + selected_load < max_rank.get_load():
-                self._phase.transfer_object(max_rank, o, min_rank)
+            if self.__accepts(min_rank, sid) and \
+                self.__loads[min_rank] + o.get_load() < self.__loads[max_rank]:
+                self.__transfer(max_rank, o, min_rank)
                 tally_assigned += 1
             else:
-                # Put the rank back in the heap for selection next round
-                if not(len(min_rank.get_shared_ids()) >= self._max_shared_ids and \
-                   not sid in min_rank.get_shared_ids()):
-                    heapq.heappush(rank_min_heap, min_rank)
-
                 tally_rejected += 1
 
         self._logger.info(
@@ -247,7 +260,7 @@ class CentralizedPrefixOptimizerAlgorithm(AlgorithmBase):
 
         return tally_assigned > 0
 
-    def _try_bin_fully(self, ranks, max_rank, tbin, size, sid, objs):
+    def _try_bin_fully(self, max_rank, tbin, size, sid):
         """Try to find a rank to offload a bin (load grouping that shares a
         common memory ID), but do not give up unless there is absolutely no
         rank that can take it"""
@@ -256,30 +269,14 @@ class CentralizedPrefixOptimizerAlgorithm(AlgorithmBase):
 
         tally_assigned, tally_rejected = 0, 0
 
-        for o in objs[sid]:
-            # Min-heap of ranks
-            rank_min_heap = []
-
-            # Add all ranks that could possibly take this load grouping based on
-            # memory usage
-            for rank in ranks:
-                if sid in rank.get_shared_ids() or len(rank.get_shared_ids()) < self._max_shared_ids:
-                    rank_min_heap.append(rank)
-
-            # Create the actual min-heap
-            heapq.heapify(rank_min_heap)
-
-            while len(rank_min_heap) > 0:
-                # Pick the rank that is most underloaded (greedy)
-                min_rank = heapq.heappop(rank_min_heap)
-
-                selected_load = o.get_load()
-
+        for o in sorted(self.__groupings[max_rank][sid][1], key=lambda x: x.get_load(), reverse=True):
+            # Pick ranks that could possibly take this load grouping based on
+            # memory usage, from most underloaded (greedy)
+            for min_rank in sorted(self.__get_eligible_ranks(sid), key=lambda r: (self.__loads[r], r.get_id())):
                 # If our situation is not made worse and fits under memory constraints, do the transer
-                if (sid in min_rank.get_shared_ids() or \
-                    len(min_rank.get_shared_ids()) < self._max_shared_ids) and \
-                    min_rank.get_load() + selected_load < max_rank.get_load():
-                    self._phase.transfer_object(max_rank, o, min_rank)
+                if self.__accepts(min_rank, sid) and \
+                    self.__loads[min_rank] + o.get_load() < self.__loads[max_rank]:
+                    self.__transfer(max_rank, o, min_rank)
                     tally_assigned += 1
                     break
 
@@ -290,67 +287,43 @@ class CentralizedPrefixOptimizerAlgorithm(AlgorithmBase):
 
         return tally_assigned > 0
 
-    def _consider_swaps(self, ranks, max_rank, tbin, size, sid, diff, objs):
+    def _consider_swaps(self, max_rank, tbin, size, sid, diff):
+        """Try to swap a bin of max rank with a lighter bin of a less loaded rank."""
         if size > diff * 0.3:
             self._logger.info(f"considerSwaps: bin={tbin}, size={size}, diff={diff}")
         else:
             return False
 
-        rank_min_heap = []
-
-        # Add all ranks that could possibly take this load grouping
-        for rank in ranks:
-            rank_min_heap.append(rank)
-
-        # Create the actual min-heap
-        heapq.heapify(rank_min_heap)
-
-        while len(rank_min_heap) > 0:
-            # Pick the rank that is most underloaded (greedy)
-            min_rank = heapq.heappop(rank_min_heap)
-
+        # Consider all ranks from most underloaded (greedy)
+        for min_rank in sorted(self.__loads, key=lambda r: (self.__loads[r], r.get_id())):
             if min_rank == max_rank:
                 continue
 
-            binned = {}
-
-            for o in min_rank.get_migratable_objects():
-                if not o.get_shared_id() in binned:
-                    binned[o.get_shared_id()] = []
-                binned[o.get_shared_id()].append(o)
-
-            pick = -1
-
-            for y, objects in binned.items():
-                load_sum = 0.0
-                for x in objects:
-                    load_sum += x.get_load()
+            pick = None
 
-                cur_max = max_rank.get_load()
+            for y, (load_sum, _) in self.__groupings[min_rank].items():
+                cur_max = self.__loads[max_rank]
+                new_min = self.__loads[min_rank] + size - load_sum
+                new_max = self.__loads[max_rank] - size + load_sum
 
-                if min_rank.get_load() + size - load_sum < cur_max and max_rank.get_load() - size + load_sum < cur_max:
+                if new_min < cur_max and new_max < cur_max:
                     self._logger.info(
-                        f"considerSwaps: continue testing: {cur_max}, "
-                        f"new min={min_rank.get_load() + size - load_sum}, "
-                        f"new max={max_rank.get_load() - size + load_sum}"
-                    )
+                        f"considerSwaps: continue testing: {cur_max}, new min={new_min}, new max={new_max}")
                 else:
                     self._logger.info(
-                        f"considerSwaps: would make situation worse: {cur_max}, "
-                        f"new min={min_rank.get_load() + size - load_sum}, "
-                        f"new max={max_rank.get_load() - size + load_sum}"
-                    )
+                        f"considerSwaps: would make situation worse: {cur_max}, new min={new_min}, new max={new_max}")
                     continue
 
                 if load_sum*1.1 < diff:
-                    pick = y
+                    pick = (y,)
                     break
 
-            if pick != -1:
-                for o in binned[pick]:
-                    self._phase.transfer_object(min_rank, o, max_rank)
-                for o in objs[sid]:
-                    self._phase.transfer_object(max_rank, o, min_rank)
+            if pick is not None:
+                objects = list(self.__groupings[max_rank][sid][1])
+                for o in list(self.__groupings[min_rank][pick[0]][1]):
+                    self.__transfer(min_rank, o, max_rank)
+                for o in objects:
+                    self.__transfer(max_rank, o, min_rank)
                 return True
 
         return False
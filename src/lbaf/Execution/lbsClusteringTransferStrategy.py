@@ -46,11 +46,13 @@ import time
 from itertools import chain, combinations
 from logging import Logger
 
+import numpy as np
 import numpy.random as nr
 
 from .lbsTransferStrategyBase import TransferStrategyBase
 from ..Model.lbsRank import Rank
 from ..Model.lbsPhase import Phase
+from ..Model.lbsRankClustersTracker import RankClustersTracker
 
 
 class ClusteringTransferStrategy(TransferStrategyBase):
@@ -92,35 +94,94 @@ class ClusteringTransferStrategy(TransferStrategyBase):
         self._logger.info(
             f"Maximum number of visited subclusters: {self.__max_subclusters}")
 
+        # Initialize subclustering method and number of load bins of dynamic programming
+        self.__subclustering_method = parameters.get("subclustering_method", "enumeration")
+        if self.__subclustering_method not in ("enumeration", "dynamic_programming"):
+            self._logger.error(f"Incorrect provided subclustering method: {self.__subclustering_method}")
+            raise SystemExit(1)
+        self.__subclustering_n_bins = parameters.get("subclustering_n_bins", 1000)
+        if not isinstance(self.__subclustering_n_bins, int) or self.__subclustering_n_bins < 1:
+            self._logger.error(f"Incorrect provided number of subclustering bins: {self.__subclustering_n_bins}")
+            raise SystemExit(1)
+        self._logger.info(f"Subclustering method: {self.__subclustering_method}")
+
         # Initialize global cluster swapping counters
         self.__n_swaps, self.__n_swap_tries = 0, 0
 
         # Initialize global subclustering counters
         self.__n_sub_skipped, self.__n_sub_transfers, self.__n_sub_tries = 0, 0, 0
 
-    def __build_rank_clusters(self, rank: Rank, with_nullset) -> dict:
+    def __build_rank_clusters(self, rank: Rank, with_nullset, phase: Phase = None) -> dict:
         """Cluster migratiable objects by shared block ID when available."""
-        # Iterate over all migratable objects on rank
         clusters = {None: []} if with_nullset else {}
-        for o in rank.get_migratable_objects():
-            # Retrieve shared block ID and skip object without one
-            sb_id = o.get_shared_id()
-            if sb_id is None:
-                continue
+        if phase is not None:
+            # Snapshot clusters maintained by phase across transfers
+            for sb_id, (objects, _) in phase.get_tracker(RankClustersTracker).get_rank_clusters(rank).items():
+                clusters[sb_id] = list(objects)
+        else:
+            # Iterate over all migratable objects on rank
+            for o in rank.get_migratable_objects():
+                # Retrieve shared block ID and skip object without one
+                sb_id = o.get_shared_id()
+                if sb_id is None:
+                    continue
 
-            # Add current object to its block ID cluster
-            clusters.setdefault(sb_id, []).append(o)
+                # Add current object to its block ID cluster
+                clusters.setdefault(sb_id, []).append(o)
 
         # Return dict of computed object clusters possibly randomized
         return clusters if self._deterministic_transfer else {
             k: clusters[k]
             for k in random.sample(list(clusters.keys()), len(clusters))}
 
-    def __build_rank_subclusters(self, r_src: Rank) -> set:
+    def __build_cluster_subclusters(self, cluster: list, src_load: float) -> dict:
+        """Find subclusters of cluster bringing rank closest and above average load by dynamic programming.
+
+        Object loads are rounded up to multiples of the removable load divided
+        into bins, so that every subset fitting in the bins keeps the rank above
+        the lower load bound; for each reachable number of bins, the subset with
+        fewest objects is retained when within maximum number of transferred objects.
+        """
+        # Load which can be removed from rank without overshooting average within tolerance
+        removable = src_load - (1.0 - self.__cluster_swap_rtol) * self._average_load
+        objects = sorted(
+            (o for o in cluster if 0.0 < o.get_load() <= removable), key=lambda o: o.get_id())
+        if not objects:
+            return {}
+        n_bins = self.__subclustering_n_bins
+        weights = np.maximum(
+            np.ceil(np.array([o.get_load() for o in objects]) * n_bins / removable), 1).astype(np.int64)
+
+        # Compute fewest objects reaching each number of bins and keep track of decisions
+        counts = np.full(n_bins + 1, np.inf)
+        counts[0] = 0.0
+        taken = np.zeros((len(objects), n_bins + 1), dtype=bool)
+        for i, w in enumerate(weights):
+            if w > n_bins:
+                continue
+            candidates = counts[:n_bins + 1 - w] + 1.0
+            better = candidates < counts[w:]
+            counts[w:][better] = candidates[better]
+            taken[i, w:][better] = True
+
+        # Reconstruct non-empty subclusters removing most load first from reachable numbers of bins
+        subclusters = {}
+        reachable = np.flatnonzero(
+            np.isfinite(counts) & (counts <= self._max_objects_per_transfer))[:0:-1]
+        for x in reachable[:self.__max_subclusters] if self.__max_subclusters < math.inf else reachable:
+            subcluster = []
+            for i in range(len(objects) - 1, -1, -1):
+                if taken[i, x]:
+                    subcluster.append(objects[i])
+                    x -= weights[i]
+            subclusters[tuple(subcluster)] = src_load - sum(o.get_load() for o in subcluster)
+        return subclusters
+
+    def __build_rank_subclusters(self, r_src: Rank, phase: Phase = None) -> set:
         """Build subclusters to bring rank closest and above average load."""
 
         # Bail out early if no clusters are available
-        if not (clusters := self.__build_rank_clusters(r_src, False).values()):
+        if not (clusters := self.__build_rank_clusters(r_src, False, phase).values()):
             self._logger.info(f"No migratable clusters on rank {r_src.get_id()}")
             return []
 
@@ -132,29 +193,38 @@ class ClusteringTransferStrategy(TransferStrategyBase):
 
         # Build dict of clusters with their load
         n_inspect, subclusters = 0, {}
-        for v in clusters:
-            # Determine maximum subcluster size
-            n_o = min(self._max_objects_per_transfer, (n_o_sub := len(v)))
-            self._logger.debug(
-                f"\t{n_o_sub} objects on cluster, maximum subcluster size: {n_o}")
-
-            # Use combinatorial exploration or law of large number based subsampling
-            j = 0
-            for j, c in enumerate(chain.from_iterable(
-                    combinations(v, p)
-                    for p in range(1, n_o + 1)) if self._deterministic_transfer else (
-                    tuple(random.sample(v, p))
-                    for p in nr.binomial(n_o, 0.5, min(n_o, self.__max_subclusters)))):
-                # Reject subclusters overshooting within relative tolerance
-                reach_load = src_load - sum(o.get_load() for o in c)
-                if reach_load < (1.0 - self.__cluster_swap_rtol) * self._average_load:
-                    continue
 
-                # Retain subclusters with their respective distance and cluster
-                subclusters[c] = reach_load
+        # Search subclusters by dynamic programming over discretized loads
+        if self.__subclustering_method == "dynamic_programming":
+            for v in clusters:
+                subclusters.update(self.__build_cluster_subclusters(v, src_load))
+                n_inspect += len(v)
+
+        # Otherwise enumerate or sample subclusters
+        else:
+            for v in clusters:
+                # Determine maximum subcluster size
+                n_o = min(self._max_objects_per_transfer, (n_o_sub := len(v)))
+                self._logger.debug(
+                    f"\t{n_o_sub} objects on cluster, maximum subcluster size: {n_o}")
+
+                # Use combinatorial exploration or law of large number based subsampling
+                j = 0
+                for j, c in enumerate(chain.from_iterable(
+                        combinations(v, p)
+                        for p in range(1, n_o + 1)) if self._deterministic_transfer else (
+                        tuple(random.sample(v, p))
+                        for p in nr.binomial(n_o, 0.5, min(n_o, self.__max_subclusters)))):
+                    # Reject subclusters overshooting within relative tolerance
+                    reach_load = src_load - sum(o.get_load() for o in c)
+                    if reach_load < (1.0 - self.__cluster_swap_rtol) * self._average_load:
+                        continue
 
-            # Update number of inspected combinations
-            n_inspect += j + 1
+                    # Retain subclusters with their respective distance and cluster
+                    subclusters[c] = reach_load
+
+                # Update number of inspected combinations
+                n_inspect += j + 1
 
         # Return subclusters and cluster IDs sorted by achievable loads
         self._logger.info(
@@ -167,6 +237,9 @@ class ClusteringTransferStrategy(TransferStrategyBase):
         # Initialize return variable
         n_rank_swaps = 0
 
+        # Retrieve source cluster loads maintained by phase
+        loads_src = {k: l for k, (_, l) in phase.get_tracker(RankClustersTracker).get_rank_clusters(r_src).items()}
+
         # Iterate over targets to identify and perform beneficial cluster swaps
         for r_try in targets if self._deterministic_transfer else random.sample(list(targets), len(targets)):
             # Escape targets loop if at least one swap already occurred
@@ -174,7 +247,7 @@ class ClusteringTransferStrategy(TransferStrategyBase):
                 break
 
             # Cluster migratiable objects on target rank
-            clusters_try = self.__build_rank_clusters(r_try, True)
+            clusters_try = self.__build_rank_clusters(r_try, True, phase)
             self._logger.debug(
                 f"Constructed {len(clusters_try)} migratable clusters on target rank {r_try.get_id()}")
 
@@ -186,8 +259,8 @@ class ClusteringTransferStrategy(TransferStrategyBase):
                     c_try = self._criterion.compute(r_src, o_src, r_try, o_try)
                     self.__n_swap_tries += 1
                     if c_try > 0.0:
-                        # Compute source cluster size only when necessary
-                        sz_src = sum(o.get_load() for o in o_src)
+                        # Retrieve source cluster size only when necessary
+                        sz_src = loads_src.get(k_src, 0.0)
                         if  c_try > self.__cluster_swap_rtol * sz_src:
                             # Perform swap
                             self._logger.debug(
@@ -206,7 +279,7 @@ class ClusteringTransferStrategy(TransferStrategyBase):
     def __transfer_subclusters(self, phase: Phase, r_src: Rank, targets: set, ave_load: float, max_load: float) -> None:
         """Perform feasible subcluster transfers from given rank to possible targets."""
         # Iterate over source subclusters
-        for o_src in self.__build_rank_subclusters(r_src):
+        for o_src in self.__build_rank_subclusters(r_src, phase):
             # Initialize destination information
             r_dst, c_dst = None, -math.inf
 
@@ -250,17 +323,21 @@ class ClusteringTransferStrategy(TransferStrategyBase):
             # Reject subcluster transfer
             self._n_rejects += len(o_src)
 
-    def execute(self, known_peers, phase: Phase, ave_load: float, max_load: float):
+    def execute(self, known_peers, phase: Phase, ave_load: float, max_load: float, known_loads=None):
         """Perform object transfer stage."""
         # Initialize transfer stage
         self._initialize_transfer_stage(ave_load)
-        rank_targets = self._get_ranks_to_traverse(phase.get_ranks(), known_peers)
+        rank_targets = self._get_ranks_to_traverse(phase.get_ranks(), known_peers, known_loads)
 
         # Iterate over ranks
         n_ranks = len(phase.get_ranks())
         for r_src, targets in rank_targets.items():
+            # Stop early when out of time
+            if self._is_past_deadline():
+                break
+
             # Cluster migratable objects on source rank
-            clusters_src = self.__build_rank_clusters(r_src, True)
+            clusters_src = self.__build_rank_clusters(r_src, True, phase)
             self._logger.debug(
                 f"Constructed {len(clusters_src)} migratable clusters on source rank {r_src.get_id()}")
 
@@ -296,12 +373,17 @@ class ClusteringTransferStrategy(TransferStrategyBase):
                 else:
                     # Iterate over ranks
                     for r_src, targets in rank_targets.items():
+                        # Stop early when out of time
+                        if self._is_past_deadline():
+                            break
+
                         # Perform feasible subcluster swaps from given rank to possible targets
                         self.__transfer_subclusters(phase, r_src, targets, ave_load, max_load)
 
                         # Report on new load and exit from rank
                         self._logger.debug(
-                            f"Rank {r_src.get_id()} load: {r_src.get_load()} after {self._n_transfers} object transfers")
+                            f"Rank {r_src.get_id()} load: {r_src.get_load()} "
+                            f"after {self._n_transfers} object transfers")
             else:
                 # Subclustering is skipped altogether for all ranks
                 self.__n_sub_skipped = n_ranks
@@ -75,6 +75,13 @@ class CriterionBase:
         # No phase is initially assigned
         self._phase = None
 
+        # No incremental transfer is initially under evaluation
+        self._incremental_transfer = None
+
+    def get_work_model(self) -> WorkModelBase:
+        """Return work model of criterion."""
+        return self._work_model
+
     def set_phase(self, phase: Phase):
         """Assign phase to criterion to provide access to phase methods."""
 
@@ -84,6 +91,12 @@ class CriterionBase:
             raise SystemExit(1)
         self._phase = phase
 
+    def _compute_max_work(self, r_src, r_dst) -> float:
+        """Return maximum work of pair of ranks, or their critical path when shared."""
+        if (w_path := self._work_model.compute_critical_path([r_src, r_dst])) is not None:
+            return w_path
+        return max(self._work_model.compute(r_src), self._work_model.compute(r_dst))
+
     @staticmethod
     def factory(criterion_name: str, work_model: WorkModelBase, logger: Logger):
         """Produce the necessary concrete criterion."""
@@ -114,3 +127,26 @@ class CriterionBase:
         :param o_dst: optional iterable of objects on destination for swaps.
         """
         # Must be implemented by concrete subclass
+
+    def begin_incremental(self, r_src, o_src, r_dst):
+        """Start incremental evaluation of growing transfer of objects.
+
+        :param r_src: Rank instance
+        :param o_src: iterable of objects initially proposed for transfer
+        :param r_dst: Rank instance
+        """
+        # May be overridden by concrete subclass to avoid re-evaluating from scratch
+        self._incremental_transfer = (r_src, list(o_src), r_dst)
+
+    def compute_incremental(self, o) -> float:
+        """Add object to transfer under evaluation and compute criterion value.
+
+        :param o: object appended to transfer started with begin_incremental
+        """
+        r_src, objects, r_dst = self._incremental_transfer
+        objects.append(o)
+        return self.compute(r_src, objects, r_dst)
+
+    def end_incremental(self):
+        """Terminate incremental evaluation, leaving ranks as they were."""
+        self._incremental_transfer = None
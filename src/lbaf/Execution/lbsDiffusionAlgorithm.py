@@ -0,0 +1,221 @@
+#
+#@HEADER
+###############################################################################
+#
+#                           lbsDiffusionAlgorithm.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+"""lbsDiffusionAlgorithm"""
+import bisect
+import math
+from logging import Logger
+
+import numpy as np
+from scipy import sparse
+
+from .lbsAlgorithmBase import AlgorithmBase
+
+
+class DiffusionAlgorithm(AlgorithmBase):
+    """A concrete class for the diffusion-based balancing algorithm on a rank graph"""
+
+    def __init__(self, work_model, parameters: dict, lgr: Logger):
+        """Class constructor.
+
+        :param work_model: a WorkModelBase instance
+        :param parameters: a dictionary of parameters
+        """
+        # Call superclass init
+        super().__init__(work_model, parameters, lgr)
+
+        # Assign optional parameters
+        self.__topology = parameters.get("topology", "communication")
+        if self.__topology not in ("communication", "torus"):
+            self._logger.error(f"Incorrect provided diffusion topology: {self.__topology}")
+            raise SystemExit(1)
+        self.__torus_dimensions = parameters.get("torus_dimensions")
+        if self.__topology == "torus" and (
+            not isinstance(self.__torus_dimensions, list) or not self.__torus_dimensions
+            or not all(isinstance(d, int) and d > 0 for d in self.__torus_dimensions)):
+            self._logger.error(f"Incorrect provided torus dimensions: {self.__torus_dimensions}")
+            raise SystemExit(1)
+        self.__order = parameters.get("order", 2)
+        if self.__order not in (1, 2):
+            self._logger.error(f"Incorrect provided diffusion order: {self.__order}")
+            raise SystemExit(1)
+        self.__relaxation = parameters.get("relaxation")
+        if self.__relaxation is not None and not 0.0 < self.__relaxation < 2.0:
+            self._logger.error(f"Incorrect provided second order relaxation: {self.__relaxation}")
+            raise SystemExit(1)
+        self.__n_iterations = parameters.get("n_iterations", 1000)
+        if not isinstance(self.__n_iterations, int) or self.__n_iterations < 1:
+            self._logger.error(f"Incorrect provided number of diffusion iterations: {self.__n_iterations}")
+            raise SystemExit(1)
+        self.__rtol = parameters.get("rtol", 1.0e-3)
+        if self.__rtol < 0.0:
+            self._logger.error(f"Incorrect provided diffusion relative tolerance: {self.__rtol}")
+            raise SystemExit(1)
+        self._logger.info(
+            f"Instantiated with order {self.__order} diffusion on {self.__topology} rank graph")
+
+    def __build_torus_edges(self, n_ranks: int) -> set:
+        """Return undirected edges between neighboring ranks of torus in row-major order."""
+        if math.prod(self.__torus_dimensions) != n_ranks:
+            self._logger.error(
+                f"Torus dimensions {self.__torus_dimensions} do not match {n_ranks} ranks")
+            raise SystemExit(1)
+        indices = np.arange(n_ranks).reshape(self.__torus_dimensions)
+        edges = set()
+        for axis, d in enumerate(self.__torus_dimensions):
+            if d < 2:
+                continue
+            neighbors = np.roll(indices, -1, axis=axis)
+            edges.update(
+                (min(i, j), max(i, j)) for i, j in zip(indices.ravel().tolist(), neighbors.ravel().tolist()))
+        return edges
+
+    def __compute_relaxation(self, diffusion: sparse.csr_matrix) -> float:
+        """Return optimal second order relaxation from second largest eigenvalue modulus of diffusion matrix."""
+        n = diffusion.shape[0]
+        if n < 3:
+            return 1.0
+        if n <= 1000:
+            eigenvalues = np.linalg.eigvalsh(diffusion.toarray())
+            gamma = max(abs(eigenvalues[0]), abs(eigenvalues[-2]))
+        else:
+            # Estimate modulus with power iterations orthogonal to constant eigenvector
+            x = np.random.default_rng(n).standard_normal(n)
+            for _ in range(200):
+                x -= x.mean()
+                x /= np.linalg.norm(x)
+                y = diffusion @ x
+                gamma = abs(x @ y)
+                x = y
+        gamma = min(gamma, 1.0 - 1.0e-12)
+        self._logger.info(f"Second largest eigenvalue modulus of diffusion matrix: {gamma}")
+        return 2.0 / (1.0 + math.sqrt(1.0 - gamma * gamma))
+
+    def __compute_flows(self, loads: np.ndarray, incidence: sparse.csr_matrix) -> np.ndarray:
+        """Iterate diffusion scheme and return accumulated load flows along edges."""
+        # Diffusion matrix is identity minus scaled Laplacian
+        laplacian = (incidence.T @ incidence).tocsr()
+        step = 1.0 / (laplacian.diagonal().max(initial=0.0) + 1.0)
+        relaxation = 1.0
+        if self.__order == 2:
+            relaxation = self.__relaxation or self.__compute_relaxation(
+                sparse.identity(loads.size, format="csr") - step * laplacian)
+            self._logger.info(f"Second order relaxation: {relaxation}")
+
+        # Accumulate edge flows until loads are balanced
+        average = loads.mean()
+        flows, increments = np.zeros(incidence.shape[0]), np.zeros(incidence.shape[0])
+        x = loads.astype(float)
+        for k in range(self.__n_iterations):
+            if np.abs(x - average).max(initial=0.0) <= self.__rtol * average:
+                break
+            increments = (1.0 if k == 0 else relaxation) * step * (incidence @ x) + (
+                0.0 if k == 0 else (relaxation - 1.0) * increments)
+            flows += increments
+            x -= incidence.T @ increments
+        self._logger.info(
+            f"Diffusion stopped after {k} iterations with maximum load deviation {np.abs(x - average).max()}")
+        return flows
+
+    def execute(self, p_id: int, phases: list, statistics: dict):
+        """Execute diffusion algorithm on phase with index p_id."""
+        # Perform pre-execution checks and initializations
+        self._initialize(p_id, phases, statistics)
+        self._logger.info("Starting diffusion")
+        phase_ranks = sorted(self._rebalanced_phase.get_ranks(), key=lambda r: r.get_id())
+        n_ranks = len(phase_ranks)
+
+        # Build rank graph edges from communications or torus, ignoring peer ranks outside phase
+        if self.__topology == "torus":
+            edges = sorted(self.__build_torus_edges(n_ranks))
+        else:
+            indices = {r.get_id(): i for i, r in enumerate(phase_ranks)}
+            edges = sorted(
+                (min(i, j), max(i, j)) for i, j in (
+                    [indices.get(r_id) for r_id in ij] for ij in self._rebalanced_phase.get_edges())
+                if i is not None and j is not None)
+        if n_ranks and (n_isolated := n_ranks - len({i for e in edges for i in e})):
+            self._logger.warning(f"{n_isolated} ranks are not connected in diffusion graph")
+        n_edges = len(edges)
+        self._logger.info(f"Diffusing loads over {n_edges} edges between {n_ranks} ranks")
+
+        # Compute flows with signed edge-rank incidence matrix
+        incidence = sparse.csr_matrix((
+            np.tile([1.0, -1.0], n_edges),
+            (np.repeat(np.arange(n_edges), 2), np.array(edges, dtype=np.int64).ravel())),
+            shape=(n_edges, n_ranks))
+        flows = self.__compute_flows(np.array([r.get_load() for r in phase_ranks]), incidence)
+
+        # Available objects on each rank sorted by load
+        available = [
+            sorted((o.get_load(), o.get_id(), o) for o in r.get_migratable_objects()) for r in phase_ranks]
+
+        # Realize largest flows first, twice so that objects received on a rank can be sent further
+        n_transfers = 0
+        pending = sorted(
+            ([i, j, f] if f > 0.0 else [j, i, -f] for (i, j), f in zip(edges, flows)), key=lambda x: -x[2])
+        for _ in range(2):
+            for flow in pending:
+                # Send largest fitting object or smallest exceeding one while it reduces remaining flow
+                i, j, remaining = flow
+                while (objects := available[i]):
+                    k = bisect.bisect_right(objects, (remaining, math.inf))
+                    _, k = min((abs(remaining - objects[c][0]), c) for c in (k - 1, k) if 0 <= c < len(objects))
+                    if not 0.0 < objects[k][0] < 2.0 * remaining:
+                        break
+                    load, o_id, o = objects.pop(k)
+                    bisect.insort(available[j], (load, o_id, o))
+                    self._rebalanced_phase.transfer_object(phase_ranks[i], o, phase_ranks[j])
+                    remaining -= load
+                    n_transfers += 1
+                flow[2] = remaining
+        unrealized = sum(f for _, _, f in pending)
+
+        # Report on object transfers
+        self._logger.info(
+            f"{n_transfers} transfers occurred, leaving {unrealized} of {np.abs(flows).sum()} load flow unrealized")
+
+        # Update run statistics
+        self._update_statistics(statistics)
+
+        # Report final mapping in debug mode
+        self._report_final_mapping(self._logger)
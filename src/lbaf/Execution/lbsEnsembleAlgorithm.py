@@ -0,0 +1,167 @@
+#
+#@HEADER
+###############################################################################
+#
+#                           lbsEnsembleAlgorithm.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import copy
+import random
+from logging import Logger
+
+from numpy import random as nr
+
+from .lbsAlgorithmBase import AlgorithmBase
+from ..IO.lbsStatistics import print_function_statistics
+from ..Utils.lbsForkPool import fork_pool, get_number_of_workers, get_shared_context, reset_object_rank_ids
+
+
+def _execute_run(seed: int) -> tuple:
+    """Execute a run of the ensemble algorithm with given seed.
+
+    :returns: seed, maximum work and mapping of migratable object IDs to rank IDs
+    """
+    context = get_shared_context("ensemble")
+    p_id, phases = context["p_id"], context["phases"]
+    reset_object_rank_ids(phases[p_id].get_ranks())
+
+    # Seed pseudo-random number generators and run algorithm
+    random.seed(seed)
+    nr.seed(seed)
+    algorithm = AlgorithmBase.factory(
+        context["name"],
+        context["parameters"],
+        context["work_model"],
+        context["logger"])
+    statistics = copy.deepcopy(context["statistics"])
+    lb_iterations = phases[p_id].get_lb_iterations()
+    n_lb_iterations = len(lb_iterations)
+    algorithm.execute(p_id, phases, statistics)
+    del lb_iterations[n_lb_iterations:]
+
+    # Return outcome of run
+    return seed, statistics.get("critical path", statistics["maximum work"])[-1], {
+        o.get_id(): r.get_id()
+        for r in algorithm.get_rebalanced_phase().get_ranks()
+        for o in r.get_migratable_objects()}
+
+
+class EnsembleAlgorithm(AlgorithmBase):
+    """A concrete class for multi-start ensembles of a randomized algorithm."""
+
+    def __init__(self, work_model, parameters: dict, lgr: Logger):
+        """Class constructor.
+
+        :param work_model: a WorkModelBase instance
+        :param parameters: a dictionary of parameters
+        :param lgr: logger
+        """
+        # Call superclass init
+        super().__init__(work_model, parameters, lgr)
+
+        # Retrieve mandatory parameters
+        self.__n_runs = parameters.get("n_runs")
+        if not isinstance(self.__n_runs, int) or self.__n_runs < 1:
+            self._logger.error(f"Incorrect provided number of ensemble runs: {self.__n_runs}")
+            raise SystemExit(1)
+        algorithm = parameters.get("algorithm", {})
+        self.__algorithm_name = algorithm.get("name", "InformAndTransfer")
+        if self.__algorithm_name in ("Ensemble", "PhaseStepper"):
+            self._logger.error(f"Algorithm {self.__algorithm_name} cannot be run in an ensemble")
+            raise SystemExit(1)
+        self.__algorithm_parameters = algorithm.get("parameters", {})
+
+        # Retrieve optional parameters
+        self.__n_workers = get_number_of_workers(parameters, self._logger)
+        self.__seed = parameters.get("seed", 146)
+        self._logger.info(
+            f"Instantiated with {self.__n_runs} runs of {self.__algorithm_name} "
+            f"seeded from {self.__seed} on {self.__n_workers} worker(s)")
+
+        # No run outcomes are known initially
+        self.__outcomes = []
+
+    def get_outcomes(self):
+        """Return seed and maximum work of each run."""
+        return self.__outcomes
+
+    def execute(self, p_id: int, phases: list, statistics: dict):
+        """Execute ensemble of algorithm runs on phase with index p_id and keep best mapping."""
+        # Check phases and make sure that initial phase is consistent
+        if not isinstance(phases, dict) or p_id not in phases:
+            self._logger.error(f"No phase with index {p_id} is available for processing")
+            raise SystemExit(1)
+        context = {
+            "p_id": p_id,
+            "phases": phases,
+            "name": self.__algorithm_name,
+            "parameters": self.__algorithm_parameters,
+            "work_model": self._work_model,
+            "logger": self._logger,
+            "statistics": statistics}
+
+        # Execute runs, in parallel when requested
+        seeds = range(self.__seed, self.__seed + self.__n_runs)
+        with fork_pool("ensemble", context, min(self.__n_workers, self.__n_runs)) as pool:
+            results = pool.map(_execute_run, seeds, chunksize=1) if pool else [
+                _execute_run(seed) for seed in seeds]
+        self.__outcomes = [(seed, max_work) for seed, max_work, _ in results]
+
+        # Report spread of ensemble outcomes
+        print_function_statistics(
+            [max_work for _, max_work in self.__outcomes],
+            lambda x: x,
+            "ensemble maximum works",
+            self._logger)
+        best_seed, best_work, best_mapping = min(results, key=lambda x: (x[1], x[0]))
+        self._logger.info(f"Keeping mapping of run with seed {best_seed} and maximum work {best_work:.6g}")
+
+        # Apply best mapping to rebalanced phase
+        reset_object_rank_ids(phases[p_id].get_ranks())
+        self._initialize(p_id, phases, statistics)
+        ranks = {r.get_id(): r for r in self._rebalanced_phase.get_ranks()}
+        for r_src in list(ranks.values()):
+            for o in list(r_src.get_migratable_objects()):
+                if (r_dst := ranks[best_mapping[o.get_id()]]) is not r_src:
+                    self._rebalanced_phase.transfer_object(r_src, o, r_dst)
+
+        # Update run statistics
+        self._update_statistics(statistics)
+
+        # Report final mapping in debug mode
+        self._report_final_mapping(self._logger)
@@ -0,0 +1,96 @@
+#
+#@HEADER
+###############################################################################
+#
+#                              lbsFenwickTree.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+class FenwickTree:
+    """A Fenwick tree of presence flags over positions of a fixed sequence.
+
+    Positions can be removed, restored and selected by rank among remaining
+    ones in O(log n), so that picking from a sequence preserves the relative
+    order of its remaining elements without shifting or copying them.
+    """
+
+    def __init__(self, n: int):
+        """Class constructor.
+
+        :param n: number of positions, all initially present
+        """
+        self.__present = bytearray(b"\x01" * n)
+        self.__tree = [0] + [1] * n
+        for i in range(1, n + 1):
+            if (j := i + (i & -i)) <= n:
+                self.__tree[j] += self.__tree[i]
+        self.__size = n
+        self.__mask = 1 << n.bit_length() if n else 0
+
+    def __len__(self):
+        return self.__size
+
+    def __contains__(self, i: int):
+        return 0 <= i < len(self.__present) and bool(self.__present[i])
+
+    def __update(self, i: int, delta: int):
+        """Add delta to count at position."""
+        i += 1
+        while i < len(self.__tree):
+            self.__tree[i] += delta
+            i += i & -i
+
+    def remove(self, i: int):
+        """Remove present position."""
+        self.__present[i] = 0
+        self.__size -= 1
+        self.__update(i, -1)
+
+    def add(self, i: int):
+        """Restore removed position."""
+        self.__present[i] = 1
+        self.__size += 1
+        self.__update(i, 1)
+
+    def select(self, k: int) -> int:
+        """Return position of k-th present position, counting from zero."""
+        i, step, tree = 0, self.__mask, self.__tree
+        while step:
+            if (j := i + step) < len(tree) and tree[j] <= k:
+                i, k = j, k - tree[j]
+            step >>= 1
+        return i
@@ -0,0 +1,129 @@
+#
+#@HEADER
+###############################################################################
+#
+#                            lbsGreedyAlgorithm.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+"""lbsGreedyAlgorithm"""
+import heapq
+from logging import Logger
+
+from .lbsAlgorithmBase import AlgorithmBase
+
+
+class GreedyAlgorithm(AlgorithmBase):
+    """A concrete class for the greedy longest-processing-time-first algorithm"""
+
+    def __init__(self, work_model, parameters: dict, lgr: Logger):
+        """Class constructor.
+
+        :param work_model: a WorkModelBase instance
+        :param parameters: a dictionary of parameters
+        """
+        # Call superclass init
+        super().__init__(work_model, parameters, lgr)
+
+        # Assign optional parameters
+        self.__bounded_migration = parameters.get("bounded_migration", False)
+        if not isinstance(self.__bounded_migration, bool):
+            self._logger.error(
+                f"Incorrect provided bounded migration flag: {self.__bounded_migration}")
+            raise SystemExit(1)
+        self._logger.info(
+            f"Instantiated {'with' if self.__bounded_migration else 'without'} bounded migration")
+
+    def __pool_overloaded_objects(self, ranks: list, loads: dict) -> list:
+        """Remove objects from ranks whose work exceeds the balanced one and return them."""
+        # Balanced work is reached when loads are inversely proportional to alphas
+        alphas = [r.get_alpha() for r in ranks]
+        total_load = sum(loads.values())
+        target_work = total_load / sum(1.0 / a for a in alphas) if all(alphas) else 0.0
+        self._logger.info(f"Balanced rank work: {target_work}")
+
+        # Remove largest objects fitting within excess load, then the smallest exceeding it
+        objects = []
+        for r, alpha in zip(ranks, alphas):
+            excess = loads[r] - (target_work / alpha if alpha else 0.0)
+            pooled, remaining = [], []
+            for o in sorted(r.get_migratable_objects(), key=lambda x: (-x.get_load(), x.get_id())):
+                if 0.0 < o.get_load() <= excess:
+                    pooled.append(o)
+                    excess -= o.get_load()
+                else:
+                    remaining.append(o)
+            if excess > 0.0 and remaining:
+                pooled.append(remaining[-1])
+            loads[r] -= sum(o.get_load() for o in pooled)
+            objects.extend(pooled)
+        return objects
+
+    def execute(self, p_id: int, phases: list, statistics: dict):
+        """Execute greedy algorithm on phase with index p_id."""
+        # Perform pre-execution checks and initializations
+        self._initialize(p_id, phases, statistics)
+        self._logger.info("Starting greedy assignment")
+        phase_ranks = sorted(self._rebalanced_phase.get_ranks(), key=lambda r: r.get_id())
+
+        # Either pool all migratable objects or only those in excess on overloaded ranks
+        if self.__bounded_migration:
+            loads = {r: r.get_load() for r in phase_ranks}
+            objects = self.__pool_overloaded_objects(phase_ranks, loads)
+        else:
+            loads = {r: r.get_sentinel_load() for r in phase_ranks}
+            objects = [o for r in phase_ranks for o in r.get_migratable_objects()]
+        self._logger.info(f"Assigning {len(objects)} objects onto {len(phase_ranks)} ranks")
+
+        # Keep one min-heap of rank loads per distinct alpha value
+        heaps, ranks = {}, {r.get_id(): r for r in phase_ranks}
+        for r in phase_ranks:
+            heaps.setdefault(r.get_alpha(), []).append((loads[r], r.get_id()))
+        for heap in heaps.values():
+            heapq.heapify(heap)
+
+        # Assign objects by decreasing load to rank on which their work completes first
+        assignment = {}
+        for o in sorted(objects, key=lambda x: (-x.get_load(), x.get_id())):
+            load = o.get_load()
+            _, _, alpha = min((a * (h[0][0] + load), h[0][1], a) for a, h in heaps.items())
+            r_load, r_id = heaps[alpha][0]
+            heapq.heapreplace(heaps[alpha], (r_load + load, r_id))
+            assignment[o] = ranks[r_id]
+
+        # Transfer objects whose assigned rank differs from current one
+        self._apply_mapping(assignment, statistics)
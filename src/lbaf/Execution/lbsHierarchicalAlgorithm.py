@@ -0,0 +1,200 @@
+#
+#@HEADER
+###############################################################################
+#
+#                         lbsHierarchicalAlgorithm.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+"""lbsHierarchicalAlgorithm"""
+from logging import Logger
+
+from .lbsAlgorithmBase import AlgorithmBase
+from ..Model.lbsNode import Node
+from ..Model.lbsPhase import Phase
+from ..Model.lbsRank import Rank
+from ..Utils.lbsForkPool import fork_pool, get_number_of_workers, get_shared_context, reset_object_rank_ids
+
+
+def _execute_inner_algorithm(name: str, parameters: dict, work_model, logger, ranks: set, p_id: int) -> dict:
+    """Execute algorithm on a phase made of given ranks.
+
+    :returns: mapping of migratable object IDs to rank IDs
+    """
+    phase = Phase(logger, p_id)
+    phase.set_ranks(ranks)
+    reset_object_rank_ids(ranks)
+    algorithm = AlgorithmBase.factory(name, parameters, work_model, logger)
+    n_ranks = len(ranks)
+    statistics = {"average load": sum(r.get_load() for r in ranks) / n_ranks if n_ranks else 0.0}
+    algorithm.execute(p_id, {p_id: phase}, statistics)
+    return {
+        o.get_id(): r.get_id()
+        for r in algorithm.get_rebalanced_phase().get_ranks()
+        for o in r.get_migratable_objects()}
+
+
+def _balance_node(n_id: int) -> dict:
+    """Balance ranks of node with given ID.
+
+    :returns: mapping of migratable object IDs to rank IDs
+    """
+    # Attach rank copies to a node of their own so that peers outside it are inter-node
+    context = get_shared_context("hierarchical")
+    ranks = set()
+    node = Node(context["logger"], n_id)
+    for r in context["nodes"][n_id]:
+        ranks.add(r_copy := Rank(context["logger"]))
+        r_copy.copy(r)
+        r_copy.set_node(node)
+        node.add_rank(r_copy)
+    return _execute_inner_algorithm(
+        context["name"],
+        context["parameters"],
+        context["work_model"],
+        context["logger"],
+        ranks,
+        context["p_id"])
+
+
+class HierarchicalAlgorithm(AlgorithmBase):
+    """A concrete class for node-then-rank hierarchical balancing."""
+
+    def __init__(self, work_model, parameters: dict, lgr: Logger):
+        """Class constructor.
+
+        :param work_model: a WorkModelBase instance
+        :param parameters: a dictionary of parameters
+        :param lgr: logger
+        """
+        # Call superclass init
+        super().__init__(work_model, parameters, lgr)
+
+        # Retrieve algorithms balancing nodes and ranks within nodes
+        self.__algorithms = {}
+        for level in ("node", "rank"):
+            algorithm = parameters.get(f"{level}_algorithm", {})
+            name = algorithm.get("name", "Greedy")
+            if name in ("Hierarchical", "PhaseStepper"):
+                self._logger.error(f"Algorithm {name} cannot balance {level}s hierarchically")
+                raise SystemExit(1)
+            self.__algorithms[level] = (name, algorithm.get("parameters", {}))
+
+        # Retrieve optional parameters
+        self.__n_workers = get_number_of_workers(parameters, self._logger)
+        self._logger.info(
+            f"Instantiated with {self.__algorithms['node'][0]} across nodes and "
+            f"{self.__algorithms['rank'][0]} within nodes on {self.__n_workers} worker(s)")
+
+    def __balance_nodes(self, p_id: int, nodes: dict) -> int:
+        """Balance aggregated node loads and move objects between nodes, returning number of transfers."""
+        # Aggregate ranks of each node into a coarse rank on a node of its own whose speed is their total speed
+        coarse_ranks = set()
+        for n_id, ranks in nodes.items():
+            coarse_ranks.add(coarse_rank := Rank(
+                self._logger, n_id,
+                migratable_objects={o for r in ranks for o in r.get_migratable_objects()},
+                sentinel_objects={o for r in ranks for o in r.get_sentinel_objects()}))
+            coarse_rank.set_node(coarse_node := Node(self._logger, n_id))
+            coarse_node.add_rank(coarse_rank)
+            alphas = [r.get_alpha() for r in ranks]
+            coarse_rank.set_alpha(1.0 / sum(1.0 / a for a in alphas) if all(alphas) else 0.0)
+        self._logger.info(f"Balancing {len(coarse_ranks)} nodes")
+        mapping = _execute_inner_algorithm(
+            *self.__algorithms["node"], self._work_model, self._logger, coarse_ranks, p_id)
+
+        # Move objects onto least loaded rank of their destination node
+        n_transfers = 0
+        reset_object_rank_ids(self._rebalanced_phase.get_ranks())
+        loads = {r: r.get_load() for ranks in nodes.values() for r in ranks}
+        for n_id, ranks in nodes.items():
+            for r_src in ranks:
+                for o in list(r_src.get_migratable_objects()):
+                    if (n_dst := mapping[o.get_id()]) == n_id:
+                        continue
+                    r_dst = min(nodes[n_dst], key=lambda r: (loads[r] * r.get_alpha(), r.get_id()))
+                    self._rebalanced_phase.transfer_object(r_src, o, r_dst)
+                    loads[r_src] -= o.get_load()
+                    loads[r_dst] += o.get_load()
+                    n_transfers += 1
+        return n_transfers
+
+    def execute(self, p_id: int, phases: list, statistics: dict):
+        """Execute hierarchical balancing on phase with index p_id."""
+        # Perform pre-execution checks and initializations
+        self._initialize(p_id, phases, statistics)
+        nodes = {}
+        for r in sorted(self._rebalanced_phase.get_ranks(), key=lambda r: r.get_id()):
+            if (node := r.get_node()) is None:
+                self._logger.error(f"Rank {r.get_id()} is not attached to a node")
+                raise SystemExit(1)
+            nodes.setdefault(node.get_id(), []).append(r)
+
+        # Balance nodes first, then ranks within each node
+        n_node_transfers = self.__balance_nodes(p_id, nodes)
+        self._logger.info(f"{n_node_transfers} inter-node transfers occurred")
+        context = {
+            "p_id": p_id,
+            "nodes": nodes,
+            "name": self.__algorithms["rank"][0],
+            "parameters": self.__algorithms["rank"][1],
+            "work_model": self._work_model,
+            "logger": self._logger}
+        n_ids = sorted(nodes)
+        self._logger.info(f"Balancing ranks within {len(n_ids)} nodes")
+        with fork_pool("hierarchical", context, min(self.__n_workers, len(n_ids))) as pool:
+            mappings = pool.map(_balance_node, n_ids, chunksize=1) if pool else [
+                _balance_node(n_id) for n_id in n_ids]
+
+        # Apply intra-node mappings to rebalanced phase
+        n_rank_transfers = 0
+        reset_object_rank_ids(self._rebalanced_phase.get_ranks())
+        for n_id, mapping in zip(n_ids, mappings):
+            ranks = {r.get_id(): r for r in nodes[n_id]}
+            for r_src in nodes[n_id]:
+                for o in list(r_src.get_migratable_objects()):
+                    if (r_dst := ranks[mapping[o.get_id()]]) is not r_src:
+                        self._rebalanced_phase.transfer_object(r_src, o, r_dst)
+                        n_rank_transfers += 1
+        self._logger.info(f"{n_rank_transfers} intra-node transfers occurred")
+
+        # Update run statistics
+        self._work_model.set_phase(self._rebalanced_phase)
+        self._update_statistics(statistics)
+
+        # Report final mapping in debug mode
+        self._report_final_mapping(self._logger)
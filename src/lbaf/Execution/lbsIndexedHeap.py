@@ -0,0 +1,139 @@
+#
+#@HEADER
+###############################################################################
+#
+#                              lbsIndexedHeap.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+from typing import Any, Hashable, Iterable, Tuple
+
+
+class IndexedHeap:
+    """A binary min-heap of hashable items whose keys can be updated in place.
+
+    Item positions are indexed so that updating or removing an item costs
+    O(log n) instead of rebuilding the heap. Keys may be tuples to break
+    ties deterministically.
+    """
+
+    def __init__(self, items: Iterable[Tuple[Hashable, Any]] = ()):
+        """Class constructor.
+
+        :param items: iterable of (item, key) pairs
+        """
+        self.__entries = [[key, item] for item, key in items]
+        self.__entries.sort(key=lambda e: e[0])
+        self.__positions = {e[1]: i for i, e in enumerate(self.__entries)}
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, item: Hashable):
+        return item in self.__positions
+
+    def __iter__(self):
+        return (e[1] for e in self.__entries)
+
+    def get_key(self, item: Hashable):
+        """Return key of item."""
+        return self.__entries[self.__positions[item]][0]
+
+    def peek(self) -> Tuple[Hashable, Any]:
+        """Return item with smallest key and its key."""
+        key, item = self.__entries[0]
+        return item, key
+
+    def push(self, item: Hashable, key):
+        """Insert item with given key, or update its key when present."""
+        if item in self.__positions:
+            self.update(item, key)
+            return
+        self.__entries.append([key, item])
+        self.__positions[item] = len(self.__entries) - 1
+        self.__sift_up(len(self.__entries) - 1)
+
+    def update(self, item: Hashable, key):
+        """Change key of item present in heap."""
+        i = self.__positions[item]
+        old_key = self.__entries[i][0]
+        self.__entries[i][0] = key
+        if key < old_key:
+            self.__sift_up(i)
+        else:
+            self.__sift_down(i)
+
+    def remove(self, item: Hashable):
+        """Remove item from heap."""
+        i = self.__positions.pop(item)
+        last = self.__entries.pop()
+        if i < len(self.__entries):
+            self.__entries[i] = last
+            self.__positions[last[1]] = i
+            self.__sift_up(i)
+            self.__sift_down(self.__positions[last[1]])
+
+    def pop(self) -> Tuple[Hashable, Any]:
+        """Remove and return item with smallest key and its key."""
+        item, key = self.peek()
+        self.remove(item)
+        return item, key
+
+    def __swap(self, i: int, j: int):
+        """Swap entries at given positions."""
+        entries = self.__entries
+        entries[i], entries[j] = entries[j], entries[i]
+        self.__positions[entries[i][1]] = i
+        self.__positions[entries[j][1]] = j
+
+    def __sift_up(self, i: int):
+        """Move entry up until heap order is restored."""
+        entries = self.__entries
+        while i > 0 and entries[i][0] < entries[(parent := (i - 1) >> 1)][0]:
+            self.__swap(i, parent)
+            i = parent
+
+    def __sift_down(self, i: int):
+        """Move entry down until heap order is restored."""
+        entries, n = self.__entries, len(self.__entries)
+        while (child := 2 * i + 1) < n:
+            if child + 1 < n and entries[child + 1][0] < entries[child][0]:
+                child += 1
+            if not entries[child][0] < entries[i][0]:
+                break
+            self.__swap(i, child)
+            i = child
@@ -44,7 +44,10 @@ import random
 import time
 from logging import Logger
 
+import numpy as np
+
 from .lbsAlgorithmBase import AlgorithmBase
+from .lbsBitsetKnownPeers import BitsetKnownLoads, BitsetKnownPeers
 from .lbsCriterionBase import CriterionBase
 from .lbsTransferStrategyBase import TransferStrategyBase
 from ..Model.lbsRank import Rank
@@ -85,6 +88,22 @@ class InformAndTransferAlgorithm(AlgorithmBase):
         self._logger.info(
             f"Instantiated with {self.__n_iterations} iterations, {self.__n_rounds} rounds, fanout {self.__fanout}")
 
+        # Optional adaptive information stage parameters
+        self.__target_kappa = parameters.get("target_kappa")
+        if self.__target_kappa is not None and not 0.0 < self.__target_kappa <= 1.0:
+            self._logger.error(f"Incorrect provided target knowledge ratio: {self.__target_kappa}")
+            raise SystemExit(1)
+        self.__fanout_factor = parameters.get("fanout_factor", 1.0)
+        if self.__fanout_factor <= 0.0:
+            self._logger.error(f"Incorrect provided fanout factor: {self.__fanout_factor}")
+            raise SystemExit(1)
+
+        # Select information stage implementation
+        self.__information_stage = parameters.get("information_stage", "sets")
+        if self.__information_stage not in ("sets", "bitset"):
+            self._logger.error(f"Incorrect provided information stage: {self.__information_stage}")
+            raise SystemExit(1)
+
         # Try to instantiate object transfer criterion
         crit_name = parameters.get("criterion")
         self.__transfer_criterion = CriterionBase.factory(
@@ -108,14 +127,40 @@ class InformAndTransferAlgorithm(AlgorithmBase):
 
         # No information about peers is known initially
         self.__known_peers = {}
+        self.__known_loads = None
+
+        # Optionally gossip loads of peers as of the start of each iteration
+        self.__load_aware_information = parameters.get("load_aware_information", False)
 
         # Optional target imbalance for early termination of iterations
         self.__target_imbalance = parameters.get("target_imbalance", 0.0)
 
+        # Optional stagnation window and tolerance for early termination of iterations
+        self.__stagnation_window = parameters.get("stagnation_window")
+        if self.__stagnation_window is not None and (
+            not isinstance(self.__stagnation_window, int) or self.__stagnation_window < 1):
+            self._logger.error(f"Incorrect provided stagnation window: {self.__stagnation_window}")
+            raise SystemExit(1)
+        self.__stagnation_rtol = parameters.get("stagnation_rtol", 1.0e-3)
+        if self.__stagnation_rtol < 0.0:
+            self._logger.error(f"Incorrect provided stagnation relative tolerance: {self.__stagnation_rtol}")
+            raise SystemExit(1)
+
+        # Optional wall-clock budget for all iterations
+        self.__time_budget = parameters.get("time_budget_seconds")
+        if self.__time_budget is not None and self.__time_budget <= 0.0:
+            self._logger.error(f"Incorrect provided time budget: {self.__time_budget}")
+            raise SystemExit(1)
+        self.__deadline = None
+
     def get_known_peers(self):
         """Return all known peers."""
         return self.__known_peers
 
+    def get_known_loads(self):
+        """Return loads of known peers when gossiped, None otherwise."""
+        return self.__known_loads
+
     def __process_message(self, r_rcv: Rank, m: Message):
         """Process message received by rank."""
         # Make rank aware of itself
@@ -124,6 +169,8 @@ class InformAndTransferAlgorithm(AlgorithmBase):
 
         # Process the message
         self.__known_peers[r_rcv].update(m.get_support())
+        if (loads := m.get_loads()) is not None:
+            self.__known_loads.setdefault(r_rcv, {}).update(loads)
 
     def __forward_message(self, i: int, r_snd: Rank, f: int):
         """Forward information message to rank peers sampled from known ones."""
@@ -132,7 +179,9 @@ class InformAndTransferAlgorithm(AlgorithmBase):
             self.__known_peers[r_snd] = {r_snd}
 
         # Create load message tagged at given information round
-        msg = Message(i, self.__known_peers[r_snd])
+        msg = Message(
+            i, self.__known_peers[r_snd],
+            self.__known_loads.get(r_snd) if self.__load_aware_information else None)
 
         # Compute complement of set of known peers
         complement = self.__known_peers[r_snd].difference({r_snd})
@@ -141,20 +190,40 @@ class InformAndTransferAlgorithm(AlgorithmBase):
         return random.sample(
             list(complement), min(f, len(complement))), msg
 
+    def __get_round_fanout(self, i: int) -> int:
+        """Return fanout of information round, possibly grown or shrunk geometrically."""
+        if self.__fanout_factor == 1.0:
+            return self.__fanout
+        return max(1, int(round(self.__fanout * self.__fanout_factor ** i)))
+
+    def __is_saturated(self, i: int, average_kappa: float) -> bool:
+        """Return whether target knowledge ratio was reached before information round."""
+        if self.__target_kappa is None or average_kappa < self.__target_kappa:
+            return False
+        self._logger.info(
+            f"Reached average knowledge ratio {average_kappa:.4g} >= {self.__target_kappa:.4g} "
+            f"after {i} rounds, saving {self.__n_rounds - i} rounds")
+        return True
+
     def __execute_information_stage(self):
         """Execute information stage."""
         # Build set of all ranks in the phase
         rank_set = set(self._rebalanced_phase.get_ranks())
 
-        # Initialize information messages and known peers
+        # Initialize information messages, known peers and their loads
         messages, self.__known_peers = {}, {}
+        self.__known_loads = {} if self.__load_aware_information else None
         n_r = len(rank_set)
         for r_snd in rank_set:
             # Make rank aware of itself
             self.__known_peers[r_snd] = {r_snd}
 
             # Create initial message spawned from rank
-            msg = Message(0, {r_snd})
+            if self.__load_aware_information:
+                self.__known_loads[r_snd] = {r_snd: r_snd.get_load()}
+                msg = Message(0, {r_snd}, dict(self.__known_loads[r_snd]))
+            else:
+                msg = Message(0, {r_snd})
 
             # Broadcast message to random sample of ranks excluding self
             for r_rcv in random.sample(
@@ -188,6 +257,15 @@ class InformAndTransferAlgorithm(AlgorithmBase):
 
         # Forward messages for as long as necessary and requested
         for i in range(1, self.__n_rounds):
+            # Stop early when out of time
+            if self.__is_past_deadline(i):
+                break
+
+            # Stop early when ranks know enough peers on average
+            if n_r > 1 and self.__target_kappa is not None and self.__is_saturated(
+                    i, (sum(len(p) for p in self.__known_peers.values()) - n_r) / (n_r * (n_r - 1.0))):
+                break
+
             # Initiate next information round
             self._logger.debug(f"Performing message forwarding round {i}")
             messages.clear()
@@ -196,7 +274,7 @@ class InformAndTransferAlgorithm(AlgorithmBase):
             for r_snd in rank_set:
                 # Collect message when destination list is not empty
                 dst, msg = self.__forward_message(
-                    i, r_snd, self.__fanout)
+                    i, r_snd, self.__get_round_fanout(i))
                 for r_rcv in dst:
                     messages.setdefault(r_rcv, []).append(msg)
 
@@ -225,64 +303,194 @@ class InformAndTransferAlgorithm(AlgorithmBase):
         self._logger.info(
             f"Average rank knowledge ratio: {sum_kappa / n_r:.4g}")
 
+    def __execute_bitset_information_stage(self):
+        """Execute information stage with known peers stored in a bit matrix."""
+        # Seed bit matrix generator from standard one for reproducibility
+        ranks = self._rebalanced_phase.get_ranks()
+        n_r = len(ranks)
+        self.__known_peers = BitsetKnownPeers(
+            ranks, np.random.default_rng(random.getrandbits(64)))
+
+        # Loads carried by messages are those at start of stage, restricted to known peers
+        if self.__load_aware_information:
+            self.__known_loads = BitsetKnownLoads(self.__known_peers, {r: r.get_load() for r in ranks})
+        else:
+            self.__known_loads = None
+
+        # Send initial messages to random samples of ranks excluding self
+        n_m = self.__known_peers.execute_round(self.__fanout, initial=True)
+        if n_m != (n_c := n_r * min(self.__fanout, max(n_r - 1, 0))):
+            self._logger.error(
+                f"Incorrect number of initial messages: {n_m} <> {n_c}")
+        self._logger.info(
+            f"Sent {n_m} initial information messages with fanout={self.__fanout}")
+
+        # Forward messages for as long as necessary and requested
+        for i in range(1, self.__n_rounds):
+            # Stop early when out of time
+            if self.__is_past_deadline(i):
+                break
+
+            # Stop early when ranks know enough peers on average
+            if n_r > 1 and self.__target_kappa is not None and self.__is_saturated(
+                    i, float(self.__known_peers.get_kappas().mean())):
+                break
+
+            # Forward messages to peers sampled from known ones
+            self._logger.debug(f"Performing message forwarding round {i}")
+            n_m = self.__known_peers.execute_round(self.__get_round_fanout(i))
+            self._logger.debug(f"Forwarded {n_m} information messages")
+
+        # Compute and report on final known information ratio
+        if n_r > 1:
+            kappas = self.__known_peers.get_kappas()
+            for rank, kappa in zip(self.__known_peers.get_ranks(), kappas.tolist()):
+                rank.set_kappa(kappa)
+            self._logger.info(
+                f"Average rank knowledge ratio: {kappas.mean():.4g}")
+        else:
+            self._logger.warning(
+                f"Cannot compute knowledge ratio with only {n_r} ranks")
+
+    def __get_mapping(self) -> dict:
+        """Return current rank of each migratable object of rebalanced phase."""
+        return {
+            o: r
+            for r in self._rebalanced_phase.get_ranks()
+            for o in r.get_migratable_objects()}
+
+    def __restore_mapping(self, mapping: dict) -> int:
+        """Transfer migratable objects back to ranks of given mapping."""
+        n_transfers = 0
+        for o, r_cur in self.__get_mapping().items():
+            if (r_dst := mapping.get(o, r_cur)) is not r_cur:
+                self._rebalanced_phase.transfer_object(r_cur, o, r_dst)
+                n_transfers += 1
+        return n_transfers
+
+    def __is_past_deadline(self, i: int) -> bool:
+        """Return whether information stage must stop before round i to fit within time budget."""
+        if self.__deadline is None or time.time() < self.__deadline:
+            return False
+        self._logger.info(f"Stopping information stage after {i} rounds at deadline of time budget")
+        return True
+
+    def __is_out_of_time(self, i: int, start_time: float, iteration_time: float) -> bool:
+        """Return whether next iteration would not complete within time budget."""
+        if self.__time_budget is None:
+            return False
+        elapsed = time.time() - start_time
+        if elapsed + iteration_time <= self.__time_budget:
+            return False
+        self._logger.info(
+            f"Stopping after {i} iterations and {elapsed:.3f} seconds "
+            f"within time budget of {self.__time_budget:.6g} seconds")
+        return True
+
     def execute(self, p_id: int, phases: list, statistics: dict):
         """ Execute 2-phase information+transfer algorithm on Phase with index p_id."""
         # Perform pre-execution checks and initializations
         self._initialize(p_id, phases, statistics)
+        execution_start_time = time.time()
 
         # Set phase to be used by transfer criterion
         self.__transfer_criterion.set_phase(self._rebalanced_phase)
 
-        # Perform requested number of load-balancing iterations
-        s_name = "maximum work"
-        for i in range(self.__n_iterations):
-            self._logger.info(f"Starting iteration {i + 1} with {s_name} of {statistics[s_name][-1]:.6g}")
-
-            # Time the duration of each iteration
-            start_time = time.time()
-
-            # Start with information stage
-            self.__execute_information_stage()
-
-            # Execute transfer stage
-            n_ignored, n_transfers, n_rejects = self.__transfer_strategy.execute(
-                self.__known_peers, self._rebalanced_phase, statistics[
-                    "average load"], statistics["maximum load"][-1])
-            if (n_proposed := n_transfers + n_rejects):
+        # Information and transfer stages also stop early at deadline of time budget
+        self.__deadline = execution_start_time + self.__time_budget if self.__time_budget else None
+        self.__transfer_strategy.set_deadline(self.__deadline)
+
+        # Keep track of best mapping and of last significant improvement
+        s_name = "critical path" if "critical path" in statistics else "maximum work"
+        best_work = stagnation_work = statistics[s_name][-1]
+        best_iteration, n_stagnant = 0, 0
+        best_mapping = self.__get_mapping() if (
+            self.__stagnation_window or self.__time_budget) else None
+
+        # Perform requested number of load-balancing iterations within shared transfer stages
+        with self.__transfer_strategy.transfer_stages(self._rebalanced_phase):
+            for i in range(self.__n_iterations):
+                self._logger.info(f"Starting iteration {i + 1} with {s_name} of {statistics[s_name][-1]:.6g}")
+
+                # Time the duration of each iteration
+                start_time = time.time()
+
+                # Start with information stage
+                if self.__information_stage == "bitset":
+                    self.__execute_bitset_information_stage()
+                else:
+                    self.__execute_information_stage()
+
+                # Execute transfer stage
+                n_ignored, n_transfers, n_rejects = self.__transfer_strategy.execute(
+                    self.__known_peers, self._rebalanced_phase, statistics[
+                        "average load"], statistics["maximum load"][-1], self.__known_loads)
+                if (n_proposed := n_transfers + n_rejects):
+                    self._logger.info(
+                        f"Transferred {n_transfers} objects amongst {n_proposed} proposed "
+                        f"({100. * n_rejects / n_proposed:.4}%)")
+                else:
+                    self._logger.info("No proposed object transfers")
+
+                # Report iteration statistics
                 self._logger.info(
-                    f"Transferred {n_transfers} objects amongst {n_proposed} proposed "
-                    f"({100. * n_rejects / n_proposed:.4}%)")
-            else:
-                self._logger.info("No proposed object transfers")
-
-            # Report iteration statistics
+                    f"Iteration {i + 1} completed ({n_ignored} skipped ranks) "
+                    f"in {time.time() - start_time:.3f} seconds")
+
+                # Compute and report iteration load imbalance and maximum work
+                load_imb = compute_function_statistics(
+                    self._rebalanced_phase.get_ranks(),
+                    lambda x: x.get_load()).get_imbalance()
+                self._logger.info(f"\trank load imbalance: {load_imb:.6g}")
+                max_work = compute_function_statistics(
+                    self._work_model.compute_all(self._rebalanced_phase.get_ranks()).tolist(),
+                    lambda x: x).get_maximum()
+                self._logger.info(f"\tmaximum rank work: {max_work:.6g}")
+
+                # Update run statistics and retrieve tracked work
+                self._update_statistics(statistics)
+                work = statistics[s_name][-1]
+
+                # Retain load balancing iteration as a phase with sub-index
+                lb_iteration = Phase(self._logger, p_id, None, i + 1)
+                lb_iteration.copy_ranks(self._rebalanced_phase)
+                lb_iteration.set_communications(self._initial_communications[p_id])
+                self._initial_phase.get_lb_iterations().append(lb_iteration)
+
+                # Retain best mapping when it may have to be restored
+                if work < best_work:
+                    best_work, best_iteration = work, i + 1
+                    if best_mapping is not None:
+                        best_mapping = self.__get_mapping()
+
+                # Check if the current imbalance is within the target_imbalance range
+                if load_imb <= self.__target_imbalance:
+                    self._logger.info(
+                        f"Reached target load imbalance of {self.__target_imbalance:.6g} after {i + 1} iterations.")
+                    break
+
+                # Check whether maximum work stagnated over window of iterations
+                if work < stagnation_work * (1.0 - self.__stagnation_rtol):
+                    stagnation_work, n_stagnant = work, 0
+                else:
+                    n_stagnant += 1
+                if self.__stagnation_window and n_stagnant >= self.__stagnation_window:
+                    self._logger.info(
+                        f"{s_name.capitalize()} stagnated within relative tolerance of {self.__stagnation_rtol:.6g} "
+                        f"for {n_stagnant} iterations, stopping after {i + 1} iterations")
+                    break
+
+                # Check whether another iteration fits within time budget
+                if self.__is_out_of_time(i + 1, execution_start_time, time.time() - start_time):
+                    break
+
+        # Restore best mapping seen when iterations did not end with it
+        if best_mapping is not None and statistics[s_name][-1] > best_work:
+            n_transfers = self.__restore_mapping(best_mapping)
             self._logger.info(
-                f"Iteration {i + 1} completed ({n_ignored} skipped ranks) in {time.time() - start_time:.3f} seconds")
-
-            # Compute and report iteration load imbalance and maximum work
-            load_imb = compute_function_statistics(
-                self._rebalanced_phase.get_ranks(),
-                lambda x: x.get_load()).get_imbalance()
-            self._logger.info(f"\trank load imbalance: {load_imb:.6g}")
-            max_work = compute_function_statistics(
-                self._rebalanced_phase.get_ranks(),
-                self._work_model.compute).get_maximum()
-            self._logger.info(f"\tmaximum rank work: {max_work:.6g}")
-
-            # Update run statistics
+                f"Restored best mapping of iteration {best_iteration} with {s_name} of {best_work:.6g} "
+                f"by transferring {n_transfers} objects")
             self._update_statistics(statistics)
 
-            # Retain load balancing iteration as a phase with sub-index
-            lb_iteration = Phase(self._logger, p_id, None, i + 1)
-            lb_iteration.copy_ranks(self._rebalanced_phase)
-            lb_iteration.set_communications(self._initial_communications[p_id])
-            self._initial_phase.get_lb_iterations().append(lb_iteration)
-
-            # Check if the current imbalance is within the target_imbalance range
-            if load_imb <= self.__target_imbalance:
-                self._logger.info(
-                    f"Reached target load imbalance of {self.__target_imbalance:.6g} after {i + 1} iterations.")
-                break
-
         # Report final mapping in debug mode
         self._report_final_mapping(self._logger)
@@ -0,0 +1,115 @@
+#
+#@HEADER
+###############################################################################
+#
+#                      lbsLargestDifferencingAlgorithm.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+"""lbsLargestDifferencingAlgorithm"""
+from logging import Logger
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+from ..Model.lbsAffineCombinationWorkModel import AffineCombinationWorkModel
+from ..Model.lbsLoadOnlyWorkModel import LoadOnlyWorkModel
+from .lbsAlgorithmBase import AlgorithmBase
+from ..IO.lbsStatistics import compute_largest_differencing_arrangement
+
+
+class LargestDifferencingAlgorithm(AlgorithmBase):
+    """A concrete class for the Karmarkar-Karp largest differencing algorithm"""
+
+    def __init__(self, work_model, parameters: dict, lgr: Logger):
+        """Class constructor.
+
+        :param work_model: a WorkModelBase instance
+        :param parameters: a dictionary of parameters
+        """
+        # Call superclass init
+        super().__init__(work_model, parameters, lgr)
+
+        # Largest differencing only balances loads
+        if not isinstance(work_model, LoadOnlyWorkModel) and not (
+            isinstance(work_model, AffineCombinationWorkModel)
+            and work_model.get_beta() == 0.0 and work_model.get_delta() == 0.0):
+            self._logger.warning(
+                "Largest differencing only balances loads, communications and homing are ignored")
+
+    @staticmethod
+    def __relabel_parts(ranks: list, arrangement: tuple, current: list) -> list:
+        """Label parts of ranks without sentinel objects so as to minimize moved objects."""
+        # Parts combined with sentinel objects are bound to their ranks
+        free = {j: k for k, j in enumerate(j for j, r in enumerate(ranks) if not r.get_sentinel_objects())}
+        if len(free) < 2:
+            return list(arrangement)
+
+        # Count objects of each free part which are already on each free rank
+        kept = np.zeros((len(free), len(free)), dtype=np.int64)
+        for a, j in zip(arrangement, current):
+            if a in free and j in free:
+                kept[free[a], free[j]] += 1
+
+        # Assign free parts to free ranks maximizing kept objects
+        rows, cols = linear_sum_assignment(kept, maximize=True)
+        free_ranks = list(free)
+        labels = {free_ranks[k_part]: free_ranks[k_rank] for k_part, k_rank in zip(rows, cols)}
+        return [labels.get(a, a) for a in arrangement]
+
+    def execute(self, p_id: int, phases: list, statistics: dict):
+        """Execute largest differencing algorithm on phase with index p_id."""
+        # Perform pre-execution checks and initializations
+        self._initialize(p_id, phases, statistics)
+        self._logger.info("Starting largest differencing")
+        phase_ranks = sorted(self._rebalanced_phase.get_ranks(), key=lambda r: r.get_id())
+        if len({r.get_alpha() for r in phase_ranks}) > 1:
+            self._logger.warning("Largest differencing treats ranks with different alpha values as identical")
+
+        # Partition migratable objects with sentinel loads as labeled parts
+        objects, current = [], []
+        for j, r in enumerate(phase_ranks):
+            for o in sorted(r.get_migratable_objects(), key=lambda o: o.get_id()):
+                objects.append(o)
+                current.append(j)
+        arrangement = compute_largest_differencing_arrangement(
+            [o.get_load() for o in objects],
+            [r.get_sentinel_load() for r in phase_ranks])
+        arrangement = self.__relabel_parts(phase_ranks, arrangement, current)
+
+        # Reassign objects according to relabeled arrangement
+        self._apply_mapping({o: phase_ranks[a] for o, a in zip(objects, arrangement)}, statistics)
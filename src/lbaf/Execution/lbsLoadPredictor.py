@@ -0,0 +1,168 @@
+#
+#@HEADER
+###############################################################################
+#
+#                             lbsLoadPredictor.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+from logging import Logger
+
+import numpy as np
+
+from ..Model.lbsPhase import Phase
+
+
+class LoadPredictor:
+    """A class predicting object loads from their history across phases."""
+
+    def __init__(self, name: str, parameters: dict, logger: Logger):
+        """Class constructor.
+
+        :param name: one of LastValue, ExponentialSmoothing or LinearTrend
+        :param parameters: optional smoothing_factor and window parameters
+        :param logger: logger for output messages
+        """
+        # Assign logger to instance variable
+        self.__logger = logger
+
+        # Ensure that predictor name is valid
+        self.__predict = {
+            "LastValue": self.__predict_last_value,
+            "ExponentialSmoothing": self.__predict_exponential_smoothing,
+            "LinearTrend": self.__predict_linear_trend}.get(name)
+        if self.__predict is None:
+            self.__logger.error(f"Could not create a load predictor with name {name}")
+            raise SystemExit(1)
+        self.__name = name
+
+        # Retrieve optional parameters
+        parameters = parameters or {}
+        self.__smoothing_factor = parameters.get("smoothing_factor", 0.5)
+        if not 0.0 < self.__smoothing_factor <= 1.0:
+            self.__logger.error(f"Smoothing factor must be in (0, 1]: {self.__smoothing_factor}")
+            raise SystemExit(1)
+        self.__window = parameters.get("window")
+        self.__logger.info(
+            f"Instantiated {name} load predictor"
+            + (f" over last {self.__window} phases" if self.__window else ""))
+
+    def get_name(self) -> str:
+        """Return predictor name."""
+        return self.__name
+
+    def build_history(self, phases: dict, p_id: int):
+        """Return objects of phase with given ID and their objects x phases load history.
+
+        Loads are matched by object ID across all phases with ID up to p_id,
+        and are NaN in phases where an object does not appear.
+        """
+        # Select phases up to and including the one to be predicted from
+        p_ids = sorted(k for k in phases if k <= p_id)
+        if self.__window:
+            p_ids = p_ids[-self.__window:]
+
+        # Index objects of phase to be balanced
+        objects = list(phases[p_id].get_objects())
+        index = {o.get_id(): i for i, o in enumerate(objects)}
+
+        # Fill history array phase by phase
+        history = np.full((len(objects), len(p_ids)), np.nan)
+        for j, k in enumerate(p_ids):
+            for o in phases[k].get_objects():
+                if (i := index.get(o.get_id())) is not None:
+                    history[i, j] = o.get_load()
+
+        # Return objects with their load history
+        return objects, history
+
+    @staticmethod
+    def __predict_last_value(history: np.ndarray) -> np.ndarray:
+        """Predict that loads persist."""
+        return history[:, -1]
+
+    def __predict_exponential_smoothing(self, history: np.ndarray) -> np.ndarray:
+        """Predict exponentially smoothed loads, skipping phases without data."""
+        a = self.__smoothing_factor
+        smoothed = history[:, 0].copy()
+        for x in history.T[1:]:
+            smoothed = np.where(
+                np.isnan(smoothed), x,
+                np.where(np.isnan(x), smoothed, a * x + (1.0 - a) * smoothed))
+        return smoothed
+
+    @staticmethod
+    def __predict_linear_trend(history: np.ndarray) -> np.ndarray:
+        """Predict loads in next phase by least-squares linear trend."""
+        # Fit a line per object over phases where it appears
+        mask = ~np.isnan(history)
+        t = np.arange(history.shape[1], dtype=float)
+        n = mask.sum(axis=1)
+        t_mean = (mask * t).sum(axis=1) / n
+        x_mean = np.nansum(history, axis=1) / n
+        dt = np.where(mask, t - t_mean[:, None], 0.0)
+        dx = np.where(mask, history - x_mean[:, None], 0.0)
+        var = (dt * dt).sum(axis=1)
+        slope = np.divide((dt * dx).sum(axis=1), var, out=np.zeros_like(var), where=var > 0.0)
+
+        # Extrapolate to next phase and preclude negative loads
+        return np.maximum(x_mean + slope * (history.shape[1] - t_mean), 0.0)
+
+    def predict(self, history: np.ndarray) -> np.ndarray:
+        """Return predicted loads from objects x phases load history."""
+        return self.__predict(history)
+
+    def apply(self, phases: dict, p_id: int) -> dict:
+        """Substitute predicted loads into phase with given ID and return actual ones."""
+        # Ensure that phase to be predicted exists
+        if not isinstance(phases.get(p_id), Phase):
+            self.__logger.error(f"No phase with index {p_id} is available for load prediction")
+            raise SystemExit(1)
+
+        # Predict loads from history
+        objects, history = self.build_history(phases, p_id)
+        predicted = self.predict(history)
+        self.__logger.info(
+            f"Predicted loads of {len(objects)} objects in phase {p_id} "
+            f"from {history.shape[1]} phases with {self.__name} predictor")
+
+        # Substitute predicted loads and keep track of actual ones
+        actual = {}
+        for o, l in zip(objects, predicted.tolist()):
+            actual[o] = o.get_load()
+            o.set_load(l)
+        return actual
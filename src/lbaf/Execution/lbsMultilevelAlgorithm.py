@@ -0,0 +1,302 @@
+#
+#@HEADER
+###############################################################################
+#
+#                          lbsMultilevelAlgorithm.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+"""lbsMultilevelAlgorithm"""
+from logging import Logger
+
+import numpy as np
+from scipy import sparse
+from scipy.optimize import linear_sum_assignment
+
+from .lbsAlgorithmBase import AlgorithmBase
+from .lbsIndexedHeap import IndexedHeap
+
+
+class MultilevelAlgorithm(AlgorithmBase):
+    """A concrete class for the multilevel object communication graph partitioning algorithm"""
+
+    def __init__(self, work_model, parameters: dict, lgr: Logger):
+        """Class constructor.
+
+        :param work_model: a WorkModelBase instance
+        :param parameters: a dictionary of parameters
+        """
+        # Call superclass init
+        super().__init__(work_model, parameters, lgr)
+
+        # Assign optional parameters
+        self.__load_tolerance = parameters.get("load_tolerance", 0.05)
+        if not isinstance(self.__load_tolerance, float) or self.__load_tolerance < 0.0:
+            self._logger.error(f"Incorrect provided load tolerance: {self.__load_tolerance}")
+            raise SystemExit(1)
+        self.__n_refinement_passes = parameters.get("n_refinement_passes", 8)
+        if not isinstance(self.__n_refinement_passes, int) or self.__n_refinement_passes < 0:
+            self._logger.error(f"Incorrect provided number of refinement passes: {self.__n_refinement_passes}")
+            raise SystemExit(1)
+        self.__coarsest_size = parameters.get("coarsest_size_per_rank", 16)
+        if not isinstance(self.__coarsest_size, int) or self.__coarsest_size < 1:
+            self._logger.error(f"Incorrect provided coarsest graph size per rank: {self.__coarsest_size}")
+            raise SystemExit(1)
+        self._logger.info(
+            f"Instantiated with load tolerance {self.__load_tolerance} and "
+            f"{self.__n_refinement_passes} refinement passes")
+
+    @staticmethod
+    def __build_adjacency(objects: list) -> sparse.csr_matrix:
+        """Return symmetric matrix of volumes exchanged between objects."""
+        indices = {o.get_id(): i for i, o in enumerate(objects)}
+        sent, received = ([], [], []), ([], [], [])
+        for i, o in enumerate(objects):
+            if not (comm := o.get_communicator()):
+                continue
+            for edges, neighbors in ((sent, comm.get_sent()), (received, comm.get_received())):
+                for o_neighbor, volume in neighbors.items():
+                    if (j := indices.get(o_neighbor.get_id())) is not None and j != i:
+                        edges[0].append(i)
+                        edges[1].append(j)
+                        edges[2].append(volume)
+
+        # Volumes reported by both sender and receiver must be counted once
+        n = len(objects)
+        sent_matrix = sparse.csr_matrix((sent[2], (sent[0], sent[1])), shape=(n, n))
+        received_matrix = sparse.csr_matrix((received[2], (received[1], received[0])), shape=(n, n))
+        directed = sent_matrix.maximum(received_matrix)
+        return (directed + directed.T).tocsr()
+
+    @staticmethod
+    def __get_heaviest_neighbors(
+            rows: np.ndarray, cols: np.ndarray, weights: np.ndarray, n: int, priorities=None) -> tuple:
+        """Return heaviest neighbor and edge weight of each vertex, or -1 and 0 when none.
+
+        Ties are broken by lowest neighbor priority, or index when not provided.
+        """
+        heaviest, heaviest_weights = np.full(n, -1), np.zeros(n)
+        if rows.size:
+            order = np.lexsort((cols if priorities is None else priorities[cols], -weights, rows))
+            first = order[np.flatnonzero(np.r_[True, rows[order][1:] != rows[order][:-1]])]
+            heaviest[rows[first]] = cols[first]
+            heaviest_weights[rows[first]] = weights[first]
+        return heaviest, heaviest_weights
+
+    def __coarsen(self, adjacency: sparse.csr_matrix, loads: np.ndarray, pins: np.ndarray, max_load: float) -> tuple:
+        """Contract heavy-edge matching of graph and return coarse graph with vertex map."""
+        n = loads.size
+        mates = np.arange(n)
+        coo = adjacency.tocoo()
+        rows, cols, weights = coo.row, coo.col, coo.data
+
+        # Match vertices with mutually heaviest compatible neighbors over a few rounds,
+        # breaking ties randomly so that uniform weights do not favor the same vertices
+        priorities = np.random.default_rng(n).permutation(n)
+        for _ in range(8):
+            unmatched = mates == np.arange(n)
+            keep = unmatched[rows] & unmatched[cols] & (loads[rows] + loads[cols] <= max_load) & (
+                (pins[rows] < 0) | (pins[cols] < 0) | (pins[rows] == pins[cols]))
+            rows, cols, weights = rows[keep], cols[keep], weights[keep]
+            heaviest, _ = self.__get_heaviest_neighbors(rows, cols, weights, n, priorities)
+            candidates = np.flatnonzero(heaviest >= 0)
+            mutual = candidates[heaviest[heaviest[candidates]] == candidates]
+            if not mutual.size:
+                break
+            mates[mutual] = heaviest[mutual]
+
+        # Contract matched pairs into coarse vertices
+        _, vertex_map = np.unique(np.minimum(np.arange(n), mates), return_inverse=True)
+        n_coarse = vertex_map.max() + 1 if n else 0
+        projection = sparse.csr_matrix((np.ones(n), (np.arange(n), vertex_map)), shape=(n, n_coarse))
+        coarse_adjacency = (projection.T @ adjacency @ projection).tolil()
+        coarse_adjacency.setdiag(0.0)
+        coarse_adjacency = coarse_adjacency.tocsr()
+        coarse_adjacency.eliminate_zeros()
+        coarse_pins = np.full(n_coarse, -1)
+        np.maximum.at(coarse_pins, vertex_map, pins)
+        return coarse_adjacency, np.bincount(vertex_map, loads, n_coarse), coarse_pins, vertex_map
+
+    @staticmethod
+    def __partition(adjacency: sparse.csr_matrix, loads: np.ndarray, pins: np.ndarray,
+                    alphas: np.ndarray, max_loads: np.ndarray) -> np.ndarray:
+        """Grow partition from vertices most connected to assigned ones, assigning each to the
+        most connected rank with room, or else to the least loaded one."""
+        parts = pins.copy()
+        rank_loads = np.bincount(pins[pins >= 0], loads[pins >= 0], alphas.size)
+        connected = adjacency @ (pins >= 0).astype(float)
+        heap = IndexedHeap((v, (-connected[v], -loads[v], v)) for v in np.flatnonzero(pins < 0))
+        while heap:
+            v, _ = heap.pop()
+            neighbors = adjacency.indices[adjacency.indptr[v]:adjacency.indptr[v + 1]]
+            weights = adjacency.data[adjacency.indptr[v]:adjacency.indptr[v + 1]]
+            assigned = parts[neighbors] >= 0
+            connections = np.bincount(parts[neighbors[assigned]], weights[assigned], alphas.size)
+            feasible = rank_loads + loads[v] <= max_loads
+            if feasible.any() and connections[feasible].max() > 0.0:
+                r = np.flatnonzero(feasible)[np.argmax(connections[feasible])]
+            else:
+                r = np.argmin(alphas * (rank_loads + loads[v]))
+            parts[v] = r
+            rank_loads[r] += loads[v]
+
+            # Unassigned neighbors become more connected to assigned vertices
+            for u, w in zip(neighbors[~assigned], weights[~assigned]):
+                connected[u] += w
+                heap.update(u, (-connected[u], -loads[u], u))
+        return parts
+
+    def __refine(self, adjacency: sparse.csr_matrix, loads: np.ndarray, pins: np.ndarray,
+                 parts: np.ndarray, max_loads: np.ndarray) -> np.ndarray:
+        """Move boundary vertices to reduce edge cut, then vertices out of overloaded ranks."""
+        n, n_ranks = loads.size, max_loads.size
+        rank_loads = np.bincount(parts, loads, n_ranks)
+        for _ in range(self.__n_refinement_passes):
+            # Compute vertex connections to own rank and to most connected other rank
+            connections = (adjacency @ sparse.csr_matrix(
+                (np.ones(n), (np.arange(n), parts)), shape=(n, n_ranks))).tocoo()
+            own = connections.col == parts[connections.row]
+            internal = np.bincount(connections.row[own], connections.data[own], n)
+            external = ~own
+            targets, target_weights = self.__get_heaviest_neighbors(
+                connections.row[external], connections.col[external], connections.data[external], n)
+            gains = target_weights - internal
+
+            # Move vertices with positive gain when none of their neighbors moved
+            moved = np.zeros(n, dtype=bool)
+            candidates = np.flatnonzero((gains > 0.0) & (pins < 0) & (targets >= 0))
+            for v in candidates[np.argsort(-gains[candidates], kind="stable")]:
+                r = targets[v]
+                if rank_loads[r] + loads[v] > max_loads[r] or moved[
+                        adjacency.indices[adjacency.indptr[v]:adjacency.indptr[v + 1]]].any():
+                    continue
+                rank_loads[parts[v]] -= loads[v]
+                rank_loads[r] += loads[v]
+                parts[v], moved[v] = r, True
+
+            # Move vertices losing the least connection out of overloaded ranks
+            for r in np.flatnonzero(rank_loads > max_loads):
+                vertices = np.flatnonzero((parts == r) & (pins < 0) & ~moved)
+                for v in vertices[np.argsort(internal[vertices] - target_weights[vertices], kind="stable")]:
+                    if rank_loads[r] <= max_loads[r]:
+                        break
+                    room = max_loads - rank_loads - loads[v]
+                    room[r] = -np.inf
+                    if room.max() < 0.0:
+                        continue
+                    r_dst = targets[v] if targets[v] >= 0 and room[targets[v]] >= 0.0 else np.argmax(room)
+                    rank_loads[r] -= loads[v]
+                    rank_loads[r_dst] += loads[v]
+                    parts[v], moved[v] = r_dst, True
+
+            if not moved.any():
+                break
+        return parts
+
+    @staticmethod
+    def __relabel_parts(ranks: list, parts: np.ndarray, current: np.ndarray) -> np.ndarray:
+        """Label parts of interchangeable ranks so as to minimize moved objects."""
+        # Ranks without sentinel objects are interchangeable when they share alpha
+        groups = {}
+        for j, r in enumerate(ranks):
+            if not r.get_sentinel_objects():
+                groups.setdefault(r.get_alpha(), []).append(j)
+        labels = np.arange(len(ranks))
+        for group in groups.values():
+            if len(group) < 2:
+                continue
+
+            # Assign parts to ranks maximizing kept objects
+            in_group = np.isin(parts, group) & np.isin(current, group)
+            kept = np.zeros((len(ranks), len(ranks)), dtype=np.int64)
+            np.add.at(kept, (parts[in_group], current[in_group]), 1)
+            rows, cols = linear_sum_assignment(kept[np.ix_(group, group)], maximize=True)
+            labels[np.array(group)[rows]] = np.array(group)[cols]
+        return labels[parts]
+
+    def execute(self, p_id: int, phases: list, statistics: dict):
+        """Execute multilevel partitioning algorithm on phase with index p_id."""
+        # Perform pre-execution checks and initializations
+        self._initialize(p_id, phases, statistics)
+        self._logger.info("Starting multilevel graph partitioning")
+        phase_ranks = sorted(self._rebalanced_phase.get_ranks(), key=lambda r: r.get_id())
+        alphas = np.array([r.get_alpha() for r in phase_ranks])
+        if (alphas <= 0.0).any():
+            self._logger.error("Multilevel partitioning requires positive rank alpha values")
+            raise SystemExit(1)
+
+        # Create graph of objects with sentinel objects pinned to their ranks
+        objects, current, pins = [], [], []
+        for j, r in enumerate(phase_ranks):
+            for o in sorted(r.get_objects(), key=lambda o: o.get_id()):
+                objects.append(o)
+                current.append(j)
+                pins.append(j if r.is_sentinel(o) else -1)
+        current, pins = np.array(current, dtype=np.int64), np.array(pins, dtype=np.int64)
+        loads = np.array([o.get_load() for o in objects], dtype=float)
+        adjacency = self.__build_adjacency(objects)
+
+        # Balanced loads are inversely proportional to alphas
+        max_loads = (1.0 + self.__load_tolerance) * loads.sum() / (1.0 / alphas).sum() / alphas
+
+        # Coarsen graph until small enough or no longer shrinking
+        levels = []
+        max_vertex_load = max_loads.min() / 2.0
+        while loads.size > self.__coarsest_size * len(phase_ranks):
+            coarse_adjacency, coarse_loads, coarse_pins, vertex_map = self.__coarsen(
+                adjacency, loads, pins, max_vertex_load)
+            if coarse_loads.size > 0.95 * loads.size:
+                break
+            levels.append((adjacency, loads, pins, vertex_map))
+            adjacency, loads, pins = coarse_adjacency, coarse_loads, coarse_pins
+            self._logger.info(
+                f"Coarsening level {len(levels)}: {loads.size} vertices and {adjacency.nnz // 2} edges")
+
+        # Partition coarsest graph, then project and refine partition onto finer graphs
+        parts = self.__refine(
+            adjacency, loads, pins, self.__partition(adjacency, loads, pins, alphas, max_loads), max_loads)
+        while levels:
+            adjacency, loads, pins, vertex_map = levels.pop()
+            parts = self.__refine(adjacency, loads, pins, parts[vertex_map], max_loads)
+        parts = self.__relabel_parts(phase_ranks, parts, current)
+        coo = adjacency.tocoo()
+        self._logger.info(
+            f"Edge cut: {coo.data[parts[coo.row] != parts[coo.col]].sum() / 2.0} "
+            f"(initially {coo.data[current[coo.row] != current[coo.col]].sum() / 2.0})")
+
+        # Transfer objects whose assigned rank differs from current one
+        self._apply_mapping({o: phase_ranks[a] for o, a in zip(objects, parts)}, statistics)
@@ -0,0 +1,221 @@
+#
+#@HEADER
+###############################################################################
+#
+#                        lbsPairwiseTransferStrategy.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import contextlib
+from logging import Logger
+from multiprocessing import get_context
+
+from .lbsTransferStrategyBase import TransferStrategyBase
+from ..Model.lbsPhase import Phase
+from ..Model.lbsRank import Rank
+from ..Utils.lbsForkPool import fork_pool, get_number_of_workers, get_shared_context
+
+
+def _balance_pair(criterion, r_src: Rank, r_dst: Rank, max_objects) -> tuple:
+    """Return objects proposed for transfer from source to destination rank and number of rejected ones.
+
+    Objects are considered by decreasing load and added to the transfer
+    as long as this improves the criterion, hence the work of the pair.
+    """
+    moved, c_max, n_rejects = [], 0.0, 0
+    for o in sorted(r_src.get_migratable_objects(), key=lambda x: (-x.get_load(), x.get_id())):
+        if len(moved) >= max_objects:
+            break
+        if (c_try := criterion.compute(r_src, moved + [o], r_dst)) > c_max:
+            moved.append(o)
+            c_max = c_try
+        else:
+            n_rejects += 1
+    return moved, n_rejects
+
+
+def _evaluate_pairs(task: tuple) -> list:
+    """Return IDs of objects proposed for transfer within each given pair and numbers of rejected ones.
+
+    Transfers applied since the previous sub-round are first replayed onto
+    the phase of the worker, so that all workers evaluate the same arrangement.
+    """
+    transfers, pairs = task
+    context = get_shared_context("pairwise")
+    if (barrier := context["barrier"]) is not None:
+        # Wait until each worker took exactly one task so that all replay transfers
+        barrier.wait()
+    phase, ranks, objects = context["phase"], context["ranks"], context["objects"]
+    for o_id, src_id, dst_id in transfers:
+        phase.transfer_object(ranks[src_id], objects[o_id], ranks[dst_id])
+
+    # Propose transfers within each pair
+    proposals = []
+    for src_id, dst_id in pairs:
+        o_src, n_rejects = _balance_pair(
+            context["criterion"], ranks[src_id], ranks[dst_id], context["max_objects"])
+        proposals.append(([o.get_id() for o in o_src], n_rejects))
+    return proposals
+
+
+class PairwiseTransferStrategy(TransferStrategyBase):
+    """A concrete class for the bulk-synchronous pairwise transfer strategy."""
+
+    def __init__(self, criterion, parameters: dict, logger: Logger):
+        """Class constructor.
+
+        :param criterion: a CriterionBase instance
+        :param parameters: a dictionary of parameters.
+        """
+        # Call superclass init
+        super().__init__(criterion, parameters, logger)
+
+        # Retrieve optional parameters
+        self.__n_sub_rounds = parameters.get("n_sub_rounds", 4)
+        if not isinstance(self.__n_sub_rounds, int) or self.__n_sub_rounds < 1:
+            self._logger.error(f"Incorrect provided number of sub-rounds: {self.__n_sub_rounds}")
+            raise SystemExit(1)
+        self.__n_workers = get_number_of_workers(parameters, self._logger)
+        self._logger.info(
+            f"Selected {self.__n_sub_rounds} sub-rounds of pairwise transfers with {self.__n_workers} worker(s)")
+
+        # No phase is initially shared with workers
+        self.__phase = None
+        self.__pool = None
+        self.__n_pool_workers = 0
+        self.__objects = {}
+        self.__transfers = []
+
+    @contextlib.contextmanager
+    def transfer_stages(self, phase: Phase):
+        """Share phase with a pool of forked workers created once for all transfer stages."""
+        ranks = phase.get_ranks()
+        n_workers = min(self.__n_workers, len(ranks) // 2) if len(ranks) > 3 else 1
+        self.__objects = {o.get_id(): o for r in ranks for o in r.get_objects()}
+        context = {
+            "phase": phase,
+            "criterion": self._criterion,
+            "ranks": {r.get_id(): r for r in ranks},
+            "objects": self.__objects,
+            "max_objects": self._max_objects_per_transfer,
+            "barrier": get_context("fork").Barrier(n_workers) if n_workers > 1 else None}
+        with fork_pool("pairwise", context, n_workers) as pool:
+            self.__phase, self.__pool, self.__n_pool_workers = phase, pool, n_workers
+            try:
+                yield
+            finally:
+                self.__phase, self.__pool, self.__n_pool_workers = None, None, 0
+                self.__objects, self.__transfers = {}, []
+
+    def __match_pairs(self, rank_targets: dict) -> list:
+        """Greedily match sources of highest work with known targets of lowest work, all ranks disjoint."""
+        works = {}
+        work_model = self._criterion.get_work_model()
+        for r_src, targets in rank_targets.items():
+            for r in (r_src, *targets):
+                if r not in works:
+                    works[r] = work_model.compute(r)
+        matched, pairs = set(), []
+        for r_src in sorted(rank_targets, key=lambda r: (-works[r], r.get_id())):
+            if r_src in matched:
+                continue
+            r_dst = min(
+                (r for r in rank_targets[r_src] if r not in matched and works[r] < works[r_src]),
+                key=lambda r: (works[r], r.get_id()), default=None)
+            if r_dst is not None:
+                matched.update((r_src, r_dst))
+                pairs.append((r_src, r_dst))
+        return pairs
+
+    def __evaluate_pairs(self, pairs: list) -> list:
+        """Return IDs of objects proposed for transfer within each pair and numbers of rejected ones."""
+        pair_ids = [(r_src.get_id(), r_dst.get_id()) for r_src, r_dst in pairs]
+
+        # Evaluate sequentially when no pool of workers is available
+        if self.__pool is None:
+            return _evaluate_pairs(((), pair_ids))
+
+        # Otherwise send one chunk of pairs to each worker with transfers since previous sub-round
+        chunk_size = -(-len(pairs) // self.__n_pool_workers)
+        transfers, self.__transfers = self.__transfers, []
+        return [
+            proposal
+            for chunk in self.__pool.map(_evaluate_pairs, [
+                (transfers, pair_ids[j * chunk_size:(j + 1) * chunk_size])
+                for j in range(self.__n_pool_workers)], chunksize=1)
+            for proposal in chunk]
+
+    def execute(self, known_peers, phase: Phase, ave_load: float, _, known_loads=None):
+        """Perform bulk-synchronous transfer stage over disjoint rank pairs."""
+        # Initialize transfer stage
+        self._initialize_transfer_stage(ave_load)
+        ranks = phase.get_ranks()
+        n_ignored = 0
+
+        # Share phase with workers unless already done for all transfer stages
+        with contextlib.nullcontext() if phase is self.__phase else self.transfer_stages(phase):
+            # Perform sub-rounds as long as transfers occur
+            for i in range(self.__n_sub_rounds):
+                # Stop early when out of time
+                if i and self._is_past_deadline():
+                    break
+
+                # Match sources with known targets into disjoint pairs
+                rank_targets = self._get_ranks_to_traverse(ranks, known_peers, known_loads)
+                if not i:
+                    n_ignored = len(ranks) - len(rank_targets)
+                if not (pairs := self.__match_pairs(rank_targets)):
+                    break
+
+                # Apply proposed transfers and record them for replay by workers
+                n_transfers = 0
+                for (r_src, r_dst), (o_ids, n_rejects) in zip(pairs, self.__evaluate_pairs(pairs)):
+                    self._n_rejects += n_rejects
+                    if not o_ids:
+                        continue
+                    o_src = [self.__objects[o_id] for o_id in o_ids]
+                    n_transfers += phase.transfer_objects(r_src, o_src, r_dst)
+                    if self.__pool is not None:
+                        self.__transfers.extend((o_id, r_src.get_id(), r_dst.get_id()) for o_id in o_ids)
+                self._n_transfers += n_transfers
+                self._logger.info(
+                    f"Sub-round {i + 1}: transferred {n_transfers} objects within {len(pairs)} rank pairs")
+                if not n_transfers:
+                    break
+
+        # Return transfer phase counts
+        return n_ignored, self._n_transfers, self._n_rejects
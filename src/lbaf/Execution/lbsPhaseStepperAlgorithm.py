@@ -41,9 +41,26 @@
 #@HEADER
 #
 from logging import Logger
+
 from .lbsAlgorithmBase import AlgorithmBase
 from ..Model.lbsPhase import Phase
 from ..IO.lbsStatistics import print_function_statistics
+from ..Utils.lbsForkPool import fork_pool, get_number_of_workers, get_shared_context
+
+
+def _step_phase(p_id: int) -> tuple:
+    """Summarize phase with given index, populating it first when only a reader is available.
+
+    :returns: phase index, rank works and run statistics of phase
+    """
+    context = get_shared_context("stepper")
+    algorithm, phase = context["algorithm"], context["phases"][p_id]
+    if not phase.get_number_of_ranks() and (reader := phase.get_reader()):
+        # Populate transient phase released once summarized
+        phase = Phase(algorithm._logger, p_id, reader=reader)  # pylint:disable=W0212:protected-access
+        phase.populate_from_log(p_id)
+    return algorithm._summarize_phase(p_id, phase)  # pylint:disable=W0212:protected-access
+
 
 class PhaseStepperAlgorithm(AlgorithmBase):
     """A concrete class for the phase stepper non-optimzing algorithm."""
@@ -58,6 +75,37 @@ class PhaseStepperAlgorithm(AlgorithmBase):
         # Call superclass init
         super().__init__(work_model, parameters, lgr)
 
+        # Retrieve optional parameters
+        self.__n_workers = get_number_of_workers(parameters, self._logger)
+
+    def _summarize_phase(self, p_id: int, phase: Phase) -> tuple:
+        """Compute rank works and run statistics of given phase."""
+        # Step through current phase
+        self._logger.info(f"Stepping through phase {p_id}")
+        self._rebalanced_phase = phase
+        self._work_model.set_phase(phase)
+        works = self._work_model.compute_all(phase.get_ranks()).tolist()
+
+        # Compute run statistics of phase only
+        phase_statistics = {}
+        self._update_statistics(phase_statistics)
+
+        # Report current mapping in debug mode
+        self._report_final_mapping(self._logger)
+        self._rebalanced_phase = None
+        return p_id, works, phase_statistics
+
+    def __merge_summaries(self, summaries, statistics: dict):
+        """Merge phase summaries in phase order as they become available."""
+        for p_id, works, phase_statistics in summaries:
+            # Report phase rank work statistics
+            print_function_statistics(
+                works, lambda x: x, f"phase {p_id} rank works", self._logger)
+
+            # Update run statistics
+            for k, v in phase_statistics.items():
+                statistics.setdefault(k, []).extend(v)
+
     def execute(self, _, phases: list, statistics: dict):
         """Steps through all phases."""
 
@@ -67,23 +115,10 @@ class PhaseStepperAlgorithm(AlgorithmBase):
             self._logger.error("Algorithm execution requires a dictionary of phases")
             raise SystemExit(1)
 
-        # Iterate over all phases
-        for p_id, self._rebalanced_phase in phases.items():
-            # Step through current phase
-            self._logger.info(f"Stepping through phase {p_id}")
-
-            # Compute and report phase rank work statistics
-            print_function_statistics(
-                self._rebalanced_phase.get_ranks(),
-                self._work_model.compute,
-                f"phase {p_id} rank works",
-                self._logger)
-
-            # Update run statistics
-            self._update_statistics(statistics)
-
-            # Report current mapping in debug mode
-            self._report_final_mapping(self._logger)
+        # Step through phases, in parallel when requested
+        context = {"algorithm": self, "phases": phases}
+        with fork_pool("stepper", context, min(self.__n_workers, len(phases))) as pool:
+            self.__merge_summaries((pool.imap if pool else map)(_step_phase, phases.keys()), statistics)
 
         # Indicate that no phase was modified
         self._rebalanced_phase = None
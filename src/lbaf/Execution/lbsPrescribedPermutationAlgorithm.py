@@ -38,8 +38,8 @@ class PrescribedPermutationAlgorithm(AlgorithmBase):
                 f" of objects in phase ({len(self.__permutation)})")
             raise SystemExit(1)
         print_function_statistics(
-            self._rebalanced_phase.get_ranks(),
-            self._work_model.compute,
+            self._work_model.compute_all(self._rebalanced_phase.get_ranks()).tolist(),
+            lambda x: x,
             "initial rank work",
             self._logger)
 
@@ -66,8 +66,8 @@ class PrescribedPermutationAlgorithm(AlgorithmBase):
 
         # Compute and report post-permutation work statistics
         _ = print_function_statistics(
-            self._rebalanced_phase.get_ranks(),
-            self._work_model.compute,
+            self._work_model.compute_all(self._rebalanced_phase.get_ranks()).tolist(),
+            lambda x: x,
             "post-permutation rank work",
             self._logger)
 
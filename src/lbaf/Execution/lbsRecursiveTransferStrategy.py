@@ -47,6 +47,7 @@ from itertools import accumulate
 from logging import Logger
 from typing import Union
 
+from .lbsFenwickTree import FenwickTree
 from .lbsTransferStrategyBase import TransferStrategyBase
 from ..Model.lbsPhase import Phase
 
@@ -79,28 +80,29 @@ class RecursiveTransferStrategy(TransferStrategyBase):
         self.__order_strategy = self.__strategy_mapped[o_s]
         self._logger.info(f"Selected {self.__order_strategy.__name__} object ordering strategy")
 
-    def __recursive_extended_search(self, pick_list, objects, c_fct, n_o, max_n_o):
-        """Recursively extend search to other objects."""
-        # Fail when no more objects available or maximum depth is reached
-        if not pick_list or n_o >= max_n_o:
-            return False
-
-        # Pick one object and move it from one list to the other
-        o = random.choice(pick_list)
-        pick_list.remove(o)
-        objects.append(o)
-        n_o += 1
-
-        # Decide whether criterion allows for transfer
-        if c_fct(objects) < 0.0:
-            # Transfer is not possible, recurse further
-            return self.__recursive_extended_search(
-                pick_list, objects, c_fct, n_o, max_n_o)
-
-        # Succeed when criterion is satisfied
-        return True
-
-    def execute(self, known_peers, phase: Phase, ave_load: float, _):
+    def __extended_search(self, objects: list, remaining: FenwickTree, o_src: list, r_src, r_dst) -> bool:
+        """Iteratively extend search to other remaining objects."""
+        # Evaluate criterion incrementally as objects are added to transfer
+        self._criterion.begin_incremental(r_src, o_src, r_dst)
+        picked = []
+        while remaining and len(o_src) < self._max_objects_per_transfer:
+            # Pick one object and move it from remaining positions to transfer
+            picked.append(i := remaining.select(random.choice(range(len(remaining)))))
+            remaining.remove(i)
+            o_src.append(objects[i])
+
+            # Succeed when criterion allows for transfer
+            if self._criterion.compute_incremental(objects[i]) >= 0.0:
+                self._criterion.end_incremental()
+                return True
+
+        # Fail when no more objects available or maximum size is reached
+        self._criterion.end_incremental()
+        for i in picked:
+            remaining.add(i)
+        return False
+
+    def execute(self, known_peers, phase: Phase, ave_load: float, _, known_loads=None):
         """Perform object transfer stage."""
         # Initialize transfer stage
         self._initialize_transfer_stage(ave_load)
@@ -108,18 +110,24 @@ class RecursiveTransferStrategy(TransferStrategyBase):
 
         # Map rank to targets and ordered migratable objects
         ranks = phase.get_ranks()
-        rank_targets = self._get_ranks_to_traverse(ranks, known_peers)
+        rank_targets = self._get_ranks_to_traverse(ranks, known_peers, known_loads)
 
         # Iterate over traversable ranks
         for r_src, targets in rank_targets.items():
+            # Stop early when out of time
+            if self._is_past_deadline():
+                break
+
             # Try to recursively offload objects from source
             self._logger.debug(
                 f"Trying to offload rank {r_src.get_id()} onto {[r.get_id() for r in targets]}:")
             srt_rank_obj = list(self.__order_strategy(
                 r_src.get_migratable_objects(), r_src.get_id()))
-            while srt_rank_obj:
-                # Pick next object in ordered list
-                o_src = [srt_rank_obj.pop()]
+            remaining = FenwickTree(len(srt_rank_obj))
+            while remaining:
+                # Pick last remaining object in ordered list
+                remaining.remove(i := remaining.select(len(remaining) - 1))
+                o_src = [srt_rank_obj[i]]
                 self._logger.debug(f"\tobject {o_src[0].get_id()}:")
 
                 # Initialize destination information
@@ -144,21 +152,12 @@ class RecursiveTransferStrategy(TransferStrategyBase):
                 # Handle case where object not suitable for transfer
                 if c_dst < 0.0:
                     # Give up if no objects left of no rank is feasible
-                    if not srt_rank_obj or not r_dst:
+                    if not remaining or not r_dst:
                         self._n_rejects += 1
                         continue
 
-                    # Recursively extend search if possible
-                    pick_list = srt_rank_obj[:]
-                    if self.__recursive_extended_search(
-                        pick_list,
-                        o_src,
-                        lambda x, r_src=r_src, r_dst=r_dst: self._criterion.compute(r_src, x, r_dst),
-                        1,
-                        self._max_objects_per_transfer):
-                        # Remove accepted objects from remaining object list
-                        srt_rank_obj = pick_list
-                    else:
+                    # Extend search if possible, accepted objects are no longer remaining
+                    if not self.__extended_search(srt_rank_obj, remaining, o_src, r_src, r_dst):
                         # No transferable list of objects was found
                         self._n_rejects += 1
                         continue
@@ -41,10 +41,46 @@
 #@HEADER
 #
 from logging import Logger
+from typing import Optional
 
+from ..Model.lbsPhase import Phase
 from ..Model.lbsWorkModelBase import WorkModelBase
 from ..Execution.lbsAlgorithmBase import AlgorithmBase
+from ..Execution.lbsLoadPredictor import LoadPredictor
 from ..IO.lbsStatistics import compute_function_statistics, min_Hamming_distance
+from ..Utils.lbsForkPool import fork_pool, get_shared_context
+
+
+def _rebalance_phase(p_id: int) -> tuple:
+    """Rebalance phase with given index using a new instance of the algorithm.
+
+    :returns: phase index, run statistics and possibly null mapping of migratable object IDs to rank IDs
+    """
+    context = get_shared_context("batch")
+    phases, logger = context["phases"], context["logger"]
+    algorithm = AlgorithmBase.factory(
+        context["algorithm"].get("name"),
+        context["algorithm"].get("parameters", {}),
+        context["work_model"],
+        logger)
+    statistics = {"average load": compute_function_statistics(
+        phases[p_id].get_ranks(), lambda x: x.get_load()).get_average()}
+
+    # Balance predicted rather than measured loads when requested
+    load_predictor = context["load_predictor"]
+    actual_loads = load_predictor.apply(phases, p_id) if load_predictor else {}
+    try:
+        algorithm.execute(p_id, phases, statistics)
+    finally:
+        # Restore measured loads of objects even when balancing failed
+        for o, l in actual_loads.items():
+            o.set_load(l)
+
+    # Return outcome of phase rebalancing
+    return p_id, statistics, {
+        o.get_id(): r.get_id()
+        for r in lbp.get_ranks()
+        for o in r.get_migratable_objects()} if (lbp := algorithm.get_rebalanced_phase()) else None
 
 
 class Runtime:
@@ -55,13 +91,15 @@ class Runtime:
             phases: dict,
             work_model: dict,
             algorithm: dict,
-            logger: Logger):
+            logger: Logger,
+            load_predictor: Optional[dict] = None):
         """Class constructor.
 
         :param phases: dictionary of Phase instances
         :param work_model: dictionary with work model name and optional parameters
         :param algorithm: dictionary with algorithm name and parameters
         :param logger: logger for output messages
+        :param load_predictor: optional dictionary with load predictor name and parameters
         """
         # Assign logger to instance variable
         self.__logger = logger
@@ -80,6 +118,7 @@ class Runtime:
             self.__logger)
 
         # Instantiate balancing algorithm
+        self.__algorithm_config = algorithm
         self.__algorithm = AlgorithmBase.factory(
             algorithm.get("name"),
             algorithm.get("parameters", {}),
@@ -90,6 +129,12 @@ class Runtime:
                 f"Could not instantiate an algorithm of type {self.__algorithm}")
             raise SystemExit(1)
 
+        # Instantiate load predictor when requested
+        self.__load_predictor = LoadPredictor(
+            load_predictor.get("name"),
+            load_predictor.get("parameters", {}),
+            self.__logger) if load_predictor else None
+
         # Initialize run statistics
         phase_0 = self.__phases[min(self.__phases.keys())]
         l_stats = compute_function_statistics(
@@ -101,16 +146,26 @@ class Runtime:
         """Return runtime work model."""
         return self.__work_model
 
-    def execute(self, p_id: int, phase_increment: int=0, lb_iterations=False):
+    def execute(self, p_id: int, phase_increment: int=0):
         """Execute runtime for single phase with given ID or multiple phases in selected range."""
         # Execute load balancing algorithm
         self.__logger.info(
             f"Executing {type(self.__algorithm).__name__} for "
             + ("all phases" if p_id < 0 else f"phase {p_id}"))
-        self.__algorithm.execute(
-            p_id,
-            self.__phases,
-            self.__statistics)
+
+        # Balance predicted rather than measured loads when requested
+        actual_loads = {}
+        if self.__load_predictor and p_id >= 0:
+            actual_loads = self.__load_predictor.apply(self.__phases, p_id)
+        try:
+            self.__algorithm.execute(
+                p_id,
+                self.__phases,
+                self.__statistics)
+        finally:
+            # Restore measured loads of objects even when balancing failed
+            for o, l in actual_loads.items():
+                o.set_load(l)
 
         # Retrieve possibly null rebalanced phase and return it
         if (lbp := self.__algorithm.get_rebalanced_phase()):
@@ -129,3 +184,70 @@ class Runtime:
 
         # Return rebalanced phase
         return lbp
+
+    def execute_batch(self, p_ids: Optional[list] = None, phase_increment: int=0, n_workers: int=1) -> dict:
+        """Execute runtime independently for each phase with given ID, all phases when None.
+
+        :param p_ids: optional list of IDs of phases to be rebalanced
+        :param phase_increment: increment of rebalanced phase IDs
+        :param n_workers: number of processes rebalancing phases in parallel
+        :returns: dictionary of rebalanced phases indexed by their IDs
+        """
+        # Ensure that all phases to be rebalanced are available
+        p_ids = sorted(self.__phases.keys()) if p_ids is None else list(p_ids)
+        if (missing := [p_id for p_id in p_ids if p_id not in self.__phases]):
+            self.__logger.error(f"No phases with indices {missing} are available for processing")
+            raise SystemExit(1)
+
+        # Ensure that rebalanced phases do not replace other phases to be rebalanced
+        if phase_increment and (overlap := sorted(set(p_ids).intersection(
+                p_id + phase_increment for p_id in p_ids))):
+            self.__logger.error(
+                f"Rebalanced phases would replace phases {overlap} also to be rebalanced "
+                f"with phase increment {phase_increment}")
+            raise SystemExit(1)
+        self.__logger.info(
+            f"Executing {type(self.__algorithm).__name__} for {len(p_ids)} phases "
+            f"on {n_workers} worker(s)")
+
+        # Keep track of initial phase communications as algorithms do
+        initial_communications = {p_id: self.__phases[p_id].get_communications() for p_id in p_ids}
+
+        # Rebalance phases, in parallel when requested
+        context = {
+            "phases": self.__phases,
+            "algorithm": self.__algorithm_config,
+            "work_model": self.__work_model,
+            "load_predictor": self.__load_predictor,
+            "logger": self.__logger}
+        with fork_pool("batch", context, min(n_workers, len(p_ids))) as pool:
+            results = pool.map(_rebalance_phase, p_ids, chunksize=1) if pool else [
+                _rebalance_phase(p_id) for p_id in p_ids]
+
+        # Create rebalanced phases from mappings computed by workers
+        rebalanced_phases = {}
+        for p_id, statistics, mapping in results:
+            if mapping is None:
+                continue
+            initial_phase = self.__phases[p_id]
+            lbp = Phase(self.__logger, p_id + phase_increment)
+            lbp.copy_ranks(initial_phase)
+            ranks = {r.get_id(): r for r in lbp.get_ranks()}
+            for r_src in list(ranks.values()):
+                for o in list(r_src.get_migratable_objects()):
+                    if (r_dst := ranks[mapping[o.get_id()]]) is not r_src:
+                        lbp.transfer_object(r_src, o, r_dst)
+
+            # Retain lb iterations with initial phase when it is replaced
+            if not phase_increment:
+                lbp.set_lb_iterations(initial_phase.get_lb_iterations())
+
+            # Share communications from original phase with new phase
+            lbp.set_communications(initial_communications[p_id])
+            rebalanced_phases[lbp.get_id()] = lbp
+            if (w_max := statistics.get("maximum work")):
+                self.__logger.info(
+                    f"Created rebalanced phase {lbp.get_id()} with maximum work {w_max[0]:.6g} -> {w_max[-1]:.6g}")
+
+        # Return rebalanced phases
+        return rebalanced_phases
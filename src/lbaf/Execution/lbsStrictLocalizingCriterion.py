@@ -43,7 +43,7 @@
 from typing import List
 
 from .lbsCriterionBase import CriterionBase
-from ..Model.lbsObjectCommunicator import ObjectCommunicator
+from ..Model.lbsLocalPartnersTracker import LocalPartnersTracker
 from ..Model.lbsObject import Object
 from ..Model.lbsRank import Rank
 
@@ -59,29 +59,12 @@ class StrictLocalizingCriterion(CriterionBase):
 
     def compute(self, r_src: Rank, o_src: List[Object], *_args) -> float:
         """A criterion enforcing strict conservation of local communications."""
-        # Keep track source processor ID
-        r_src_id = r_src.get_id()
-
         # Iterate over objects proposed for transfer
+        partners = self._phase.get_tracker(LocalPartnersTracker)
         for o in o_src:
-            # Retrieve object communications
-            comm = o.get_communicator()
-
-            # Ignore object if it does not have a communicator
-            if not isinstance(comm, ObjectCommunicator):
-                continue
-
-            # Iterate over sent messages
-            for i in comm.get_sent().items():
-                if r_src_id == i[0].get_rank_id():
-                    # Bail out as soon as locality is broken by transfer
-                    return -1.
-
-            # Iterate over received messages
-            for i in comm.get_received().items():
-                if r_src_id == i[0].get_rank_id():
-                    # Bail out as soon as locality is broken by transfer
-                    return -1.
+            # Bail out as soon as locality is broken by transfer
+            if partners.get_number_of_local_partners(o):
+                return -1.
 
         # Accept transfer if this point was reached as no locality was broken
         return 1.
@@ -40,6 +40,7 @@
 ###############################################################################
 #@HEADER
 #
+import itertools
 from logging import Logger
 from typing import Optional
 
@@ -57,25 +58,46 @@ class TemperedCriterion(CriterionBase):
         self._logger.info(f"Instantiated {type(self).__name__} concrete criterion")
 
     def compute(self, r_src: Rank, o_src: list, r_dst: Rank, o_dst: Optional[list]=None) -> float:
-        """Tempered work criterion based on L1 norm of works."""
+        """Tempered work criterion based on L1 norm of works, net of migration cost."""
         if o_dst is None:
             o_dst = []
 
         # Compute maximum work of original arrangement
-        w_max_0 = max(
-            self._work_model.compute(r_src),
-            self._work_model.compute(r_dst))
+        w_max_0 = self._compute_max_work(r_src, r_dst)
 
         # Move objects into proposed new arrangement
         self._phase.transfer_objects(r_src, o_src, r_dst, o_dst)
 
         # Compute maximum work of proposed new arrangement
-        w_max_new = max(
-            self._work_model.compute(r_src),
-            self._work_model.compute(r_dst))
+        w_max_new = self._compute_max_work(r_src, r_dst)
 
         # Move objects back into original arrangement
         self._phase.transfer_objects(r_dst, o_src, r_src, o_dst)
 
-        # Return criterion value
-        return w_max_0 - w_max_new
+        # Return criterion value net of the cost of moving objects
+        return w_max_0 - w_max_new - self._work_model.compute_migration_cost(
+            itertools.chain(o_src, o_dst))
+
+    def begin_incremental(self, r_src: Rank, o_src: list, r_dst: Rank):
+        """Move initial objects once and cache work of original arrangement."""
+        w_max_0 = self._compute_max_work(r_src, r_dst)
+        self._incremental_transfer = (r_src, list(o_src), r_dst, w_max_0)
+        self._phase.transfer_objects(r_src, o_src, r_dst)
+
+    def compute_incremental(self, o) -> float:
+        """Tempered work criterion of growing transfer, moving only the added object."""
+        r_src, objects, r_dst, w_max_0 = self._incremental_transfer
+        objects.append(o)
+        self._phase.transfer_object(r_src, o, r_dst)
+
+        # Compute maximum work of proposed new arrangement
+        w_max_new = self._compute_max_work(r_src, r_dst)
+
+        # Return criterion value net of the cost of moving objects
+        return w_max_0 - w_max_new - self._work_model.compute_migration_cost(objects)
+
+    def end_incremental(self):
+        """Move objects back into original arrangement."""
+        r_src, objects, r_dst, _ = self._incremental_transfer
+        self._phase.transfer_objects(r_dst, objects, r_src)  # pylint:disable=W1114:arguments-out-of-order
+        self._incremental_transfer = None
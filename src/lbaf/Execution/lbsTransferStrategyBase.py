@@ -41,9 +41,12 @@
 #@HEADER
 #
 import abc
+import contextlib
 import math
 import random
+import time
 from logging import Logger
+from typing import Optional
 
 from ..IO.lbsStatistics import inverse_transform_sample
 from ..Execution.lbsCriterionBase import CriterionBase
@@ -88,6 +91,25 @@ class TransferStrategyBase:
         self._n_transfers = 0
         self._n_rejects = 0
 
+        # No deadline is initially imposed on transfer stages
+        self._deadline = None
+
+    def set_deadline(self, deadline: Optional[float]):
+        """Set possibly null wall-clock time after which transfer stages stop early."""
+        self._deadline = deadline
+
+    def transfer_stages(self, _):
+        """Return context within which all transfer stages of an algorithm run are executed on phase."""
+        # May be overridden by concrete subclass to set up resources once for all stages
+        return contextlib.nullcontext()
+
+    def _is_past_deadline(self) -> bool:
+        """Return whether deadline of transfer stage has passed, reporting it when so."""
+        if self._deadline is None or time.time() < self._deadline:
+            return False
+        self._logger.info("Stopping transfer stage early at deadline of time budget")
+        return True
+
     def _initialize_transfer_stage(self, ave_load: float):
         """Initialize transfer stage consistently across strategies."""
 
@@ -99,11 +121,16 @@ class TransferStrategyBase:
         self._n_transfers = 0
         self._n_rejects = 0
 
-    def _get_ranks_to_traverse(self, ranks: list, known_peers: dict) -> dict:
-        """Prepare randomized dict of ranks to transfer targets."""
+    def _get_ranks_to_traverse(self, ranks: list, known_peers: dict, known_loads: Optional[dict] = None) -> dict:
+        """Prepare randomized dict of ranks to transfer targets.
+
+        When loads of known peers are provided, targets whose known load
+        is above average are pruned.
+        """
 
         # Initialize dictionary of traversable ranks to targets
         rank_targets = {}
+        n_remaining, n_pruned = 0, 0
 
         # Iterate over all provided ranks
         for r_src in ranks:
@@ -113,12 +140,27 @@ class TransferStrategyBase:
 
             # Retrieve potential targets
             targets = known_peers.get(r_src, set()).difference({r_src})
+
+            # Prune targets known to be overloaded when loads are known
+            if known_loads is not None:
+                loads = known_loads.get(r_src, {})
+                n_targets = len(targets)
+                targets = {
+                    r_dst for r_dst in targets
+                    if loads.get(r_dst, math.inf) <= self._average_load}
+                n_pruned += n_targets - len(targets)
+                n_remaining += len(targets)
             if not targets:
                 continue
 
             # Append rank to be traversed
             rank_targets[r_src] = targets
 
+        # Report on pruned targets
+        if known_loads is not None:
+            self._logger.info(
+                f"Pruned {n_pruned} overloaded targets, {n_remaining} remaining")
+
         # Return randomized dict of rank_targets ranks
         return rank_targets if self._deterministic_transfer else {
             k: rank_targets[k]
@@ -183,6 +225,7 @@ class TransferStrategyBase:
         # pylint:disable=C0415:import-outside-toplevel,W0641:possibly-unused-variable
         from .lbsRecursiveTransferStrategy import RecursiveTransferStrategy
         from .lbsClusteringTransferStrategy import ClusteringTransferStrategy
+        from .lbsPairwiseTransferStrategy import PairwiseTransferStrategy
         # pylint:enable=C0415:import-outside-toplevel,W0641:possibly-unused-variable
 
         # Ensure that strategy name is valid
@@ -196,11 +239,12 @@ class TransferStrategyBase:
             raise SystemExit(1) from error
 
     @abc.abstractmethod
-    def execute(self, known_peers: dict, phase, ave_load: float, max_load: float):
+    def execute(self, known_peers: dict, phase, ave_load: float, max_load: float, known_loads: Optional[dict] = None):
         """Execute transfer strategy on Phase instance
         :param known_peers: a dictionary of sets of known rank peers
         :param phase: a Phase instance
         :param ave_load: average load in current phase.
         :param max_load: maximum load across current phase.
+        :param known_loads: optional dictionary of loads of known rank peers.
         """
         # Must be implemented by concrete subclass
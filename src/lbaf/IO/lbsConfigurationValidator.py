@@ -57,16 +57,33 @@ ALLOWED_ORDER_STRATEGIES = (
     "small_objects")
 ALLOWED_TRANSFER_STRATEGIES = (
     "Recursive",
-    "Clustering")
+    "Clustering",
+    "Pairwise")
+ALLOWED_INFORMATION_STAGES = (
+    "sets",
+    "bitset")
 ALLOWED_WORK_MODELS = (
     "LoadOnly",
-    "AffineCombination")
+    "AffineCombination",
+    "Expression",
+    "TopologyAware",
+    "Subphase")
 ALLOWED_ALGORITHMS = (
     "InformAndTransfer",
     "BruteForce",
     "CentralizedPrefixOptimizer",
     "PrescribedPermutation",
-    "PhaseStepper")
+    "PhaseStepper",
+    "Ensemble",
+    "Greedy",
+    "LargestDifferencing",
+    "Multilevel",
+    "Diffusion",
+    "Hierarchical")
+ALLOWED_LOAD_PREDICTORS = (
+    "LastValue",
+    "ExponentialSmoothing",
+    "LinearTrend")
 ALLOWED_CRITERIA = ("Tempered", "StrictLocalizing")
 ALLOWED_LOGGING_LEVELS = ("info", "debug", "warning", "error")
 ALLOWED_LOAD_VOLUME_SAMPLER = ("uniform", "lognormal")
@@ -82,6 +99,15 @@ class ConfigurationValidator:
 
     def __init__(self, config_to_validate: dict, logger: Logger):
         self.__config_to_validate: Dict[str, Schema] = config_to_validate
+        phase_id = Or(
+            int,
+            And(list, lambda x: len(x) > 0 and all(isinstance(y, int) for y in x),
+                error="Should be of type 'list' of 'int' types"),
+            "all")
+        n_batch_workers = And(
+            int,
+            lambda x: x > 0,
+            error="Should be of type 'int' and > 0")
         self.__skeleton = Schema({
             Or("from_data", "from_samplers", only_one=True): dict,
             "work_model": {
@@ -89,20 +115,29 @@ class ConfigurationValidator:
                     str,
                     lambda c: c in ALLOWED_WORK_MODELS,
                     error=f"{get_error_message(ALLOWED_WORK_MODELS)} must be chosen"),
-                "parameters": {
-                    "beta": float,
-                    "gamma": float,
-                    Optional("delta"): float,
-                    Optional("upper_bounds"): And(
-                        dict,
-                        lambda x: all(isinstance(y, float) for y in x.values()))}},
+                Optional("parameters"): dict},
             "algorithm": {
                 "name": And(
                     str,
                     lambda d: d in ALLOWED_ALGORITHMS,
                     error=f"{get_error_message(ALLOWED_ALGORITHMS)} must be chosen"),
-                Optional("phase_id"): int,
+                Optional("phase_id"): phase_id,
+                Optional("n_batch_workers"): n_batch_workers,
                 Optional("parameters"): dict},
+            Optional("load_predictor"): {
+                "name": And(
+                    str,
+                    lambda p: p in ALLOWED_LOAD_PREDICTORS,
+                    error=f"{get_error_message(ALLOWED_LOAD_PREDICTORS)} must be chosen"),
+                Optional("parameters"): {
+                    Optional("smoothing_factor"): And(
+                        float,
+                        lambda x: 0.0 < x <= 1.0,
+                        error="Should be of type 'float' and in (0, 1]"),
+                    Optional("window"): And(
+                        int,
+                        lambda x: x > 0,
+                        error="Should be of type 'int' and > 0")}},
            "output_file_stem": str,
             Optional("overwrite_validator"): bool,
             Optional("check_schema"): bool,
@@ -184,15 +219,93 @@ class ConfigurationValidator:
                     lambda s: len(s) == 2,
                     error="There should be exactly 2 provided parameters of type 'float'")}
         })
+        upper_bounds = And(
+            dict,
+            lambda x: all(isinstance(y, float) for y in x.values()))
+        load_only_parameters = {
+            "beta": float,
+            "gamma": float,
+            Optional("delta"): float,
+            Optional("upper_bounds"): upper_bounds}
+        affine_combination_parameters = {
+            **load_only_parameters,
+            Optional("migration_cost_per_byte"): And(
+                float,
+                lambda x: x >= 0.0,
+                error="Should be of type 'float' and >= 0.0"),
+            Optional("migration_amortization_phases"): And(
+                int,
+                lambda x: x > 0,
+                error="Should be of type 'int' and > 0")}
+        self.__work_model: Dict[str, Schema] = {
+            "LoadOnly": Schema(
+                {"work_model": {
+                    "name": "LoadOnly",
+                    "parameters": load_only_parameters}}),
+            "AffineCombination": Schema(
+                {"work_model": {
+                    "name": "AffineCombination",
+                    "parameters": affine_combination_parameters}}),
+            "TopologyAware": Schema(
+                {"work_model": {
+                    "name": "TopologyAware",
+                    "parameters": {
+                        "beta_intra": float,
+                        "beta_inter": float,
+                        "gamma": float,
+                        Optional("delta"): float,
+                        Optional("upper_bounds"): upper_bounds}}}),
+            "Subphase": Schema(
+                {"work_model": {
+                    "name": "Subphase",
+                    Optional("parameters"): {
+                        Optional("upper_bounds"): upper_bounds}}}),
+            "Expression": Schema(
+                {"work_model": {
+                    "name": "Expression",
+                    "parameters": {
+                        "expression": And(
+                            str,
+                            lambda x: len(x.strip()) > 0,
+                            error="Should be of type 'str' and not empty"),
+                        Optional("upper_bounds"): upper_bounds,
+                        Optional("node_bounds"): bool,
+                        Optional(str): float}}})}
         self.__algorithm: Dict[str, Schema] = {
             "InformAndTransfer": Schema(
                 {"name": "InformAndTransfer",
-                 "phase_id": int,
+                 "phase_id": phase_id,
+                 Optional("n_batch_workers"): n_batch_workers,
                  "parameters": {
                      "n_iterations": int,
                      Optional("target_imbalance"): float,
+                     Optional("stagnation_window"): And(
+                         int,
+                         lambda x: x > 0,
+                         error="Should be of type 'int' and > 0"),
+                     Optional("stagnation_rtol"): And(
+                         float,
+                         lambda x: x >= 0.0,
+                         error="Should be of type 'float' and >= 0.0"),
+                     Optional("time_budget_seconds"): And(
+                         Or(int, float),
+                         lambda x: x > 0.0,
+                         error="Should be of type 'int' or 'float' and > 0.0"),
                      "n_rounds": int,
                      "fanout": int,
+                     Optional("target_kappa"): And(
+                         float,
+                         lambda x: 0.0 < x <= 1.0,
+                         error="Should be of type 'float' and in (0, 1]"),
+                     Optional("fanout_factor"): And(
+                         float,
+                         lambda x: x > 0.0,
+                         error="Should be of type 'float' and > 0.0"),
+                     Optional("load_aware_information"): bool,
+                     Optional("information_stage"): And(
+                         str,
+                         lambda e: e in ALLOWED_INFORMATION_STAGES,
+                         error=f"{get_error_message(ALLOWED_INFORMATION_STAGES)} must be chosen"),
                      "order_strategy": And(
                          str,
                          Use(str.lower),
@@ -219,6 +332,22 @@ class ConfigurationValidator:
                             lambda x: x >= 0,
                             error="Should be of type 'int' and >= 0"),
                          Optional("separate_subclustering"): bool,
+                         Optional("subclustering_method"): And(
+                            str,
+                            lambda x: x in ("enumeration", "dynamic_programming"),
+                            error="Should be either 'enumeration' or 'dynamic_programming'"),
+                         Optional("subclustering_n_bins"): And(
+                            int,
+                            lambda x: x > 0,
+                            error="Should be of type 'int' and > 0"),
+                         Optional("n_sub_rounds"): And(
+                            int,
+                            lambda x: x > 0,
+                            error="Should be of type 'int' and > 0"),
+                         Optional("n_workers"): And(
+                            int,
+                            lambda x: x > 0,
+                            error="Should be of type 'int' and > 0"),
                      "criterion": And(
                          str,
                          lambda f: f in ALLOWED_CRITERIA,
@@ -227,13 +356,131 @@ class ConfigurationValidator:
                      "deterministic_transfer": bool}}),
             "BruteForce": Schema(
                 {"name": "BruteForce",
-                 "phase_id": int,
-                 Optional("parameters"): {"skip_transfer": bool}}),
+                 "phase_id": phase_id,
+                 Optional("n_batch_workers"): n_batch_workers,
+                 Optional("parameters"): {
+                     "skip_transfer": bool,
+                     Optional("branch_and_bound"): bool,
+                     Optional("branch_and_bound_rtol"): And(
+                         float,
+                         lambda x: x >= 0.0,
+                         error="Should be of type 'float' and >= 0.0"),
+                     Optional("branch_and_bound_max_nodes"): And(
+                         int,
+                         lambda x: x > 0,
+                         error="Should be of type 'int' and > 0"),
+                     Optional("n_workers"): And(
+                         int,
+                         lambda x: x > 0,
+                         error="Should be of type 'int' and > 0")}}),
             "CentralizedPrefixOptimizer": Schema(
                 {"name": "CentralizedPrefixOptimizer",
                  Optional("parameters"): {"do_second_stage": bool}}),
             "PhaseStepper": Schema(
-                {"name": "PhaseStepper"})}
+                {"name": "PhaseStepper",
+                 Optional("parameters"): {
+                     Optional("n_workers"): And(
+                         int,
+                         lambda x: x > 0,
+                         error="Should be of type 'int' and > 0")}}),
+            "Greedy": Schema(
+                {"name": "Greedy",
+                 "phase_id": phase_id,
+                 Optional("n_batch_workers"): n_batch_workers,
+                 Optional("parameters"): {
+                     Optional("bounded_migration"): bool}}),
+            "LargestDifferencing": Schema(
+                {"name": "LargestDifferencing",
+                 "phase_id": phase_id,
+                 Optional("n_batch_workers"): n_batch_workers,
+                 Optional("parameters"): {}}),
+            "Multilevel": Schema(
+                {"name": "Multilevel",
+                 "phase_id": phase_id,
+                 Optional("n_batch_workers"): n_batch_workers,
+                 Optional("parameters"): {
+                     Optional("load_tolerance"): And(
+                         float,
+                         lambda x: x >= 0.0,
+                         error="Should be of type 'float' and >= 0.0"),
+                     Optional("n_refinement_passes"): And(
+                         int,
+                         lambda x: x >= 0,
+                         error="Should be of type 'int' and >= 0"),
+                     Optional("coarsest_size_per_rank"): And(
+                         int,
+                         lambda x: x > 0,
+                         error="Should be of type 'int' and > 0")}}),
+            "Diffusion": Schema(
+                {"name": "Diffusion",
+                 "phase_id": phase_id,
+                 Optional("n_batch_workers"): n_batch_workers,
+                 Optional("parameters"): {
+                     Optional("topology"): And(
+                         str,
+                         lambda x: x in ("communication", "torus"),
+                         error="Should be either 'communication' or 'torus'"),
+                     Optional("torus_dimensions"): And(
+                         [int],
+                         lambda x: len(x) > 0 and all(d > 0 for d in x),
+                         error="Should be a non-empty list of 'int' > 0"),
+                     Optional("order"): And(
+                         int,
+                         lambda x: x in (1, 2),
+                         error="Should be either 1 or 2"),
+                     Optional("relaxation"): And(
+                         float,
+                         lambda x: 0.0 < x < 2.0,
+                         error="Should be of type 'float' in (0, 2)"),
+                     Optional("n_iterations"): And(
+                         int,
+                         lambda x: x > 0,
+                         error="Should be of type 'int' and > 0"),
+                     Optional("rtol"): And(
+                         float,
+                         lambda x: x >= 0.0,
+                         error="Should be of type 'float' and >= 0.0")}}),
+            "Hierarchical": Schema(
+                {"name": "Hierarchical",
+                 "phase_id": phase_id,
+                 Optional("n_batch_workers"): n_batch_workers,
+                 Optional("parameters"): {
+                     Optional("node_algorithm"): {
+                         "name": And(
+                             str,
+                             lambda e: e in ALLOWED_ALGORITHMS and e not in ("Hierarchical", "PhaseStepper"),
+                             error="Should be an allowed algorithm other than Hierarchical or PhaseStepper"),
+                         Optional("parameters"): dict},
+                     Optional("rank_algorithm"): {
+                         "name": And(
+                             str,
+                             lambda e: e in ALLOWED_ALGORITHMS and e not in ("Hierarchical", "PhaseStepper"),
+                             error="Should be an allowed algorithm other than Hierarchical or PhaseStepper"),
+                         Optional("parameters"): dict},
+                     Optional("n_workers"): And(
+                         int,
+                         lambda x: x > 0,
+                         error="Should be of type 'int' and > 0")}}),
+            "Ensemble": Schema(
+                {"name": "Ensemble",
+                 "phase_id": phase_id,
+                 Optional("n_batch_workers"): n_batch_workers,
+                 "parameters": {
+                     "n_runs": And(
+                         int,
+                         lambda x: x > 0,
+                         error="Should be of type 'int' and > 0"),
+                     Optional("n_workers"): And(
+                         int,
+                         lambda x: x > 0,
+                         error="Should be of type 'int' and > 0"),
+                     Optional("seed"): int,
+                     Optional("algorithm"): {
+                         "name": And(
+                             str,
+                             lambda e: e in ALLOWED_ALGORITHMS and e not in ("Ensemble", "PhaseStepper"),
+                             error="Should be an allowed algorithm other than Ensemble or PhaseStepper"),
+                         Optional("parameters"): dict}}})}
         self.__logger = logger
 
     @staticmethod
@@ -253,7 +500,7 @@ class ConfigurationValidator:
         sections = {
             "input": ["from_data", "from_samplers", "check_schema"],
             "work model": ["work_model"],
-            "algorithm": ["algorithm"],
+            "algorithm": ["algorithm", "load_predictor"],
             "output": [
                 "logging_level", "log_to_file", "overwrite_validator", "terminal_background",
                 "generate_multimedia", "output_dir", "output_file_stem",
@@ -292,6 +539,15 @@ class ConfigurationValidator:
             else:
                 self.validate(valid_schema=self.__from_samplers, schema_to_validate=from_samplers)
 
+        # Validate work model parameters
+        if (work_model := self.__config_to_validate.get("work_model")) is not None:
+            work_model_schema = self.__work_model.get(work_model.get("name"))
+            if isinstance(work_model_schema, Schema):
+                if self.is_valid(valid_schema=work_model_schema, schema_to_validate={"work_model": work_model}):
+                    self.__logger.info(f"Work model: {work_model.get('name')} schema is valid")
+                else:
+                    self.validate(valid_schema=work_model_schema, schema_to_validate={"work_model": work_model})
+
         # Validate algorithm
         if (algorithm := self.__config_to_validate.get("algorithm")) is not None:
             algorithm_name = algorithm.get("name", None)
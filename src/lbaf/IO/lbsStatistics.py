@@ -41,14 +41,18 @@
 #@HEADER
 #
 """lbsStatistics"""
+import heapq
 import itertools
 import math
 import random as rnd
 from logging import Logger
 from typing import Optional
 
+import numpy as np
 from numpy import random
 
+from ..Utils.lbsForkPool import fork_pool, get_shared_context
+
 
 class Statistics:
     """A class storing descriptive statistics."""
@@ -201,9 +205,10 @@ def compute_volume(objects: tuple, rank_object_ids: list, direction: str) -> flo
     # Initialize volume
     volume = 0.
 
-    # Iterate over all rank objects
-    for _ in rank_object_ids:
-        volume += sum(v for (k, v) in getattr(objects[0], direction, {}).items() if k not in rank_object_ids)
+    # Iterate over all rank objects and sum volumes exchanged with objects off rank
+    rank_objects = {objects[i] for i in rank_object_ids}
+    for i in rank_object_ids:
+        volume += sum(v for (k, v) in getattr(objects[i], f"get_{direction}")().items() if k not in rank_objects)
 
     # Return computed volume
     return volume
@@ -293,6 +298,328 @@ def compute_min_max_arrangements_work(
     return n_arrangements, works_min_max, arrangements_min_max
 
 
+def _compute_chunk_min_max_arrangements(chunk: tuple) -> tuple:
+    """Return minimax work and indices of optimal arrangements in range of arrangement indices."""
+    start, stop = chunk
+    arrays = get_shared_context("arrangements")
+    loads, n_ranks = arrays["loads"], arrays["n_ranks"]
+    alpha, beta, gamma = arrays["coefficients"]
+    n_objects = loads.size
+    radices = n_ranks ** np.arange(n_objects - 1, -1, -1, dtype=np.int64)
+    w_min_max, i_min_max = math.inf, []
+    for b_start in range(start, stop, arrays["batch_size"]):
+        # Decode block of arrangement indices into object ranks
+        indices = np.arange(b_start, min(b_start + arrays["batch_size"], stop), dtype=np.int64)
+        n_block = indices.size
+        arrangements = (indices[:, None] // radices) % n_ranks
+
+        # Compute rank loads of all arrangements of block as flat arrangement and rank bins
+        bins = (arrangements + n_ranks * np.arange(n_block)[:, None]).ravel()
+        works = alpha * np.bincount(
+            bins, weights=np.broadcast_to(loads, (n_block, n_objects)).ravel(),
+            minlength=n_block * n_ranks).reshape(n_block, n_ranks) + gamma
+
+        # Add communication term from volumes exchanged with objects off rank
+        if beta > 0.0:
+            assignments = (arrangements[:, :, None] == np.arange(n_ranks)).astype(float)
+            rank_volumes = {}
+            for direction in ("received", "sent"):
+                rank_volumes[direction] = assignments.transpose(0, 2, 1) @ arrays[direction] - np.einsum(
+                    "bir,ij,bjr->br", assignments, arrays[f"{direction}_volumes"], assignments,
+                    optimize=True)
+            works += beta * np.maximum(rank_volumes["received"], rank_volumes["sent"])
+
+        # Ignore empty ranks as with enumeration
+        works[np.bincount(bins, minlength=n_block * n_ranks).reshape(n_block, n_ranks) == 0] = -math.inf
+        works_max = works.max(axis=1)
+
+        # Reduce block minimax work and optimal arrangement indices
+        if (w_block := works_max.min()) < w_min_max:
+            w_min_max, i_min_max = w_block, []
+        if w_block == w_min_max:
+            i_min_max.extend(indices[works_max == w_block].tolist())
+    return w_min_max, i_min_max
+
+
+def compute_min_max_arrangements_work_vectorized(
+        objects: tuple,
+        alpha: float, beta: float, gamma: float, delta: float,
+        n_ranks: int,
+        n_workers: int = 1, batch_size: int = 65536, logger: Optional[Logger] = None):
+    """Compute all possible arrangements with repetition and minimax work with array operations.
+
+    Arrangement indices are split into chunks evaluated by batches, in parallel
+    when requested, and reduced in the same order as with enumeration.
+    """
+    # Homing cost not calculated yet
+    if delta > 0.0:
+        if logger is not None:
+            logger.error("Delta homing cost not calculated yet")
+        raise SystemExit(1)
+
+    # Assemble object loads and communication volumes amongst objects
+    n_objects = len(objects)
+    n_arrangements = n_ranks ** n_objects
+    if n_arrangements >= 2 ** 62:
+        if logger is not None:
+            logger.error(f"Too many arrangements of {n_objects} objects onto {n_ranks} ranks")
+        raise SystemExit(1)
+    arrays = {
+        "loads": np.array([o.get_load() for o in objects], dtype=float),
+        "n_ranks": n_ranks,
+        "coefficients": (alpha, beta, gamma),
+        "batch_size": batch_size}
+    indices = {o: i for i, o in enumerate(objects)}
+    for direction in ("received", "sent"):
+        volumes = np.zeros((n_objects, n_objects))
+        for i, o in enumerate(objects):
+            for k, v in getattr(o, f"get_{direction}")().items():
+                if (j := indices.get(k)) is not None:
+                    volumes[i, j] += v
+        arrays[f"{direction}_volumes"] = volumes
+        arrays[direction] = np.array(
+            [sum(getattr(o, f"get_{direction}")().values()) for o in objects], dtype=float)
+
+    # Evaluate chunks of arrangement indices, in parallel when requested
+    chunk_size = max(batch_size, -(-n_arrangements // (4 * n_workers)))
+    chunks = [(i, min(i + chunk_size, n_arrangements)) for i in range(0, n_arrangements, chunk_size)]
+    works_min_max, indices_min_max = math.inf, []
+
+    def reduce_chunks(results):
+        """Reduce minimax work and optimal arrangement indices as chunks are evaluated."""
+        nonlocal works_min_max, indices_min_max
+        for w_chunk, i_chunk in results:
+            if w_chunk < works_min_max:
+                works_min_max, indices_min_max = w_chunk, []
+            if w_chunk == works_min_max:
+                indices_min_max.extend(i_chunk)
+
+    with fork_pool("arrangements", arrays, n_workers if len(chunks) > 1 else 1) as pool:
+        reduce_chunks((pool.imap if pool else map)(_compute_chunk_min_max_arrangements, chunks))
+
+    # Decode optimal arrangements
+    arrangements_min_max = [
+        tuple(int(a) for a in np.unravel_index(i, (n_ranks,) * n_objects)) for i in indices_min_max]
+    if logger is not None:
+        logger.info(
+            f"Minimax work: {works_min_max:.4g} for {len(arrangements_min_max)} optimal arrangements"
+            f" amongst {n_arrangements}")
+
+    # Return quantities of interest
+    return n_arrangements, float(works_min_max), arrangements_min_max
+
+
+def compute_largest_differencing_arrangement(object_loads: list, rank_loads: list) -> tuple:
+    """Compute an arrangement of objects onto identical ranks with the largest differencing method.
+
+    Each object and the initial rank loads are partial partitions; the two
+    partitions with largest differences between their heaviest and lightest
+    parts are repeatedly combined, heaviest with lightest parts.
+    """
+    # Partition parts are tuples of load, merge tree of object indices and rank index if any,
+    # sorted by decreasing load
+    n_ranks = len(rank_loads)
+    empty_parts = [(0., None, None)] * (n_ranks - 1)
+    partitions = [(-l, i, [(l, i, None)] + empty_parts) for i, l in enumerate(object_loads)]
+    partitions.append((
+        min(rank_loads, default=0.) - max(rank_loads, default=0.), len(object_loads),
+        sorted(((l, None, j) for j, l in enumerate(rank_loads)), key=lambda x: -x[0])))
+    heapq.heapify(partitions)
+
+    # Combine partitions with largest differences until one remains
+    counter = len(partitions)
+    while len(partitions) > 1:
+        _, _, p_1 = heapq.heappop(partitions)
+        _, _, p_2 = heapq.heappop(partitions)
+        combined = sorted((
+            (l_1 + l_2, o_1 if o_2 is None else o_2 if o_1 is None else (o_1, o_2), j_1 if j_2 is None else j_2)
+            for (l_1, o_1, j_1), (l_2, o_2, j_2) in zip(p_1, reversed(p_2))), key=lambda x: -x[0])
+        heapq.heappush(partitions, (combined[-1][0] - combined[0][0], counter, combined))
+        counter += 1
+
+    # Assign unlabeled parts to remaining ranks
+    parts = partitions[0][2]
+    free_ranks = iter(sorted(set(range(n_ranks)).difference(j for _, _, j in parts if j is not None)))
+    arrangement = [0] * len(object_loads)
+    for _, o_tree, j in parts:
+        j = next(free_ranks) if j is None else j
+        stack = [o_tree]
+        while stack:
+            if isinstance(node := stack.pop(), tuple):
+                stack.extend(node)
+            elif node is not None:
+                arrangement[node] = j
+    return tuple(arrangement)
+
+
+def compute_min_max_arrangement_branch_and_bound(
+        object_loads: list,
+        rank_alphas: list, rank_loads: list, gamma: float,
+        rtol: float = 0.0, max_nodes: Optional[int] = None, logger: Optional[Logger] = None):
+    """Compute an arrangement minimizing maximum work with a depth-first branch-and-bound.
+
+    Rank work is alpha * load + gamma where rank loads are initialized with
+    loads of objects which cannot be moved. Ranks are filled one at a time by
+    increasing capacity, each with the subsets of remaining objects whose load
+    is below the capacity left to improve the best arrangement found so far by
+    more than the relative tolerance, and above what the ranks left to fill
+    cannot absorb. Identical ranks are filled in the order of their largest
+    objects, so that equivalent arrangements are tried only once. The search is
+    initialized with the best of greedy and largest differencing assignments,
+    and stops as soon as the best arrangement reaches a global lower bound, or
+    when the maximum number of nodes is explored, keeping the best arrangement
+    found so far.
+    """
+    # Assign objects by decreasing load
+    n_ranks, n_objects = len(rank_loads), len(object_loads)
+    order = sorted(range(n_objects), key=lambda i: -object_loads[i])
+    loads = [object_loads[i] for i in order]
+    total = sum(loads)
+
+    # Capacities left for integral loads are integral
+    integral = all(float(l).is_integer() for l in itertools.chain(loads, rank_loads))
+
+    def compute_threshold(w_max: float) -> float:
+        """Return maximum work which must be strictly improved upon."""
+        return w_max - rtol * abs(w_max + gamma)
+
+    def compute_load_limits(w_max: float) -> list:
+        """Return loads which ranks must remain strictly below to improve maximum work."""
+        threshold = compute_threshold(w_max)
+        return [threshold / a if a > 0. else math.inf for a in rank_alphas]
+
+    # Initialize best arrangement with longest processing time first assignment
+    partial_loads = list(rank_loads)
+    best_arrangement = []
+    for l in loads:
+        _, j = min((rank_alphas[r] * (partial_loads[r] + l), r) for r in range(n_ranks))
+        partial_loads[j] += l
+        best_arrangement.append(j)
+    best_work = max(a * l for a, l in zip(rank_alphas, partial_loads)) if n_ranks else 0.
+
+    # Keep largest differencing assignment instead when better on ranks of identical speeds
+    if n_ranks and len(set(rank_alphas)) == 1:
+        partial_loads = list(rank_loads)
+        ld_arrangement = compute_largest_differencing_arrangement(loads, rank_loads)
+        for l, j in zip(loads, ld_arrangement):
+            partial_loads[j] += l
+        if (ld_work := rank_alphas[0] * max(partial_loads)) < best_work:
+            best_work, best_arrangement = ld_work, list(ld_arrangement)
+    limits = compute_load_limits(best_work)
+
+    # Maximum work is bounded below by that of unmovable loads, of evenly spread total
+    # load, of largest object on its best rank, and of two among the n_ranks + 1 largest
+    # objects sharing a rank when ranks have identical speeds
+    lower_bound = max((a * l for a, l in zip(rank_alphas, rank_loads)), default=0.)
+    if n_ranks and n_objects:
+        if all(a > 0. for a in rank_alphas):
+            lower_bound = max(lower_bound, (total + sum(rank_loads)) / sum(1. / a for a in rank_alphas))
+        lower_bound = max(lower_bound, min(a * (l + loads[0]) for a, l in zip(rank_alphas, rank_loads)))
+        if n_objects > n_ranks and len(set(rank_alphas)) == 1:
+            lower_bound = max(
+                lower_bound, rank_alphas[0] * (min(rank_loads) + loads[n_ranks - 1] + loads[n_ranks]))
+
+    # Fill ranks by increasing capacity, identical ranks being consecutive
+    ranks = sorted(range(n_ranks), key=lambda j: (limits[j] - rank_loads[j], rank_alphas[j], rank_loads[j], j))
+    identical = [
+        k > 0 and (rank_alphas[j], rank_loads[j]) == (rank_alphas[ranks[k - 1]], rank_loads[ranks[k - 1]])
+        for k, j in enumerate(ranks)]
+    used = [False] * n_objects
+    first_objects = [n_objects] * n_ranks
+    arrangement = [0] * n_objects
+    n_nodes = 0
+
+    def is_optimal() -> bool:
+        """Return whether best arrangement cannot be improved upon."""
+        return compute_threshold(best_work) <= lower_bound
+
+    def is_done() -> bool:
+        """Return whether search must stop, best arrangement being optimal or out of nodes."""
+        return is_optimal() or max_nodes is not None and n_nodes >= max_nodes
+
+    def fill_rank(k: int, left: float, max_work: float):
+        nonlocal best_work, best_arrangement, limits, n_nodes
+        if max_work >= compute_threshold(best_work) or is_done():
+            return
+        n_nodes += 1
+        j = ranks[k]
+
+        # Last rank receives all remaining objects
+        if k == n_ranks - 1:
+            if left and rank_loads[j] + left >= limits[j]:
+                return
+            if identical[k] and any(not used[i] for i in range(first_objects[k - 1])):
+                return
+            for i in range(n_objects):
+                if not used[i]:
+                    arrangement[i] = j
+            best_work = max(max_work, rank_alphas[j] * (rank_loads[j] + left))
+            best_arrangement, limits = list(arrangement), compute_load_limits(best_work)
+            return
+
+        # Ranks left to fill can absorb a limited load
+        absorbable = 0.
+        for r in ranks[k + 1:]:
+            c = limits[r] - rank_loads[r]
+            absorbable += math.ceil(c) - 1. if integral and c < math.inf else c
+
+        # Largest remaining object goes to rank when all ranks left to fill are identical to it
+        items = [i for i in range(n_objects) if not used[i]]
+        suffix = list(itertools.accumulate(loads[i] for i in reversed(items)))[::-1] + [0.]
+        first_forced = all(identical[k + 1:])
+        first_min = first_objects[k - 1] + 1 if identical[k] else 0
+        chosen = []
+
+        def fill_subset(x: int, s: float):
+            nonlocal n_nodes
+            if is_done():
+                return
+            n_nodes += 1
+
+            # Prune when remaining objects cannot reach what ranks left to fill cannot absorb
+            low = left - absorbable
+            if s + suffix[x] < low or not integral and s + suffix[x] <= low:
+                return
+            c = limits[j] - rank_loads[j]
+            if x == len(items):
+                if s < c and (s >= low if integral else s > low):
+                    for i in chosen:
+                        used[i], arrangement[i] = True, j
+                    first_objects[k] = chosen[0] if chosen else n_objects
+                    fill_rank(k + 1, left - s, max(max_work, rank_alphas[j] * (rank_loads[j] + s)))
+                    for i in chosen:
+                        used[i] = False
+                return
+
+            # Try with then without next object
+            i = items[x]
+            if s + loads[i] < c and (chosen or i >= first_min):
+                chosen.append(i)
+                fill_subset(x + 1, s + loads[i])
+                chosen.pop()
+            if not (first_forced and x == 0):
+                fill_subset(x + 1, s)
+
+        fill_subset(0, 0.)
+
+    if n_ranks and not is_optimal():
+        fill_rank(0, total, max((a * l for a, l in zip(rank_alphas, rank_loads)), default=0.))
+
+    # Map arrangement back to original object order
+    arrangement = [0] * n_objects
+    for i, j in zip(order, best_arrangement):
+        arrangement[i] = j
+    if logger is not None:
+        logger.info(
+            f"Minimax work: {best_work + gamma:.4g} after exploring {n_nodes} branch-and-bound nodes")
+        if not is_optimal() and max_nodes is not None and n_nodes >= max_nodes:
+            logger.warning(
+                f"Stopped branch-and-bound at {max_nodes} nodes, keeping best arrangement found so far")
+
+    # Return quantities of interest
+    return n_nodes, best_work + gamma, tuple(arrangement)
+
+
 def compute_pairwise_reachable_arrangements(
         objects: tuple, arrangement: tuple,
         alpha: float, beta: float, gamma: float, delta: float,
@@ -45,7 +45,6 @@ from logging import Logger
 
 from .lbsWorkModelBase import WorkModelBase
 from .lbsRank import Rank
-from .lbsNode import Node
 
 
 class AffineCombinationWorkModel(WorkModelBase):
@@ -66,11 +65,23 @@ class AffineCombinationWorkModel(WorkModelBase):
         self.__upper_bounds = parameters.get("upper_bounds", {})
         self.__node_bounds = parameters.get("node_bounds", False)
 
+        # Data movement cost per byte, amortized over a number of phases
+        self.__migration_cost_per_byte = parameters.get("migration_cost_per_byte", 0.0)
+        self.__migration_amortization_phases = parameters.get("migration_amortization_phases", 1)
+        if self.__migration_amortization_phases < 1:
+            self.__logger.error(
+                f"Migration amortization phases must be positive: {self.__migration_amortization_phases}")
+            raise SystemExit(1)
+
         # Call superclass init
         super().__init__(parameters)
         self.__logger.info(
             "Instantiated work model with: "
             f"beta={self.__beta}, gamma={self.__gamma}, delta={self.__delta}")
+        if self.__migration_cost_per_byte:
+            self.__logger.info(
+                f"Migration cost per byte: {self.__migration_cost_per_byte} "
+                f"amortized over {self.__migration_amortization_phases} phase(s)")
         for k, v in self.__upper_bounds.items():
             self.__logger.info(
                 f"Upper bound for {'node' if self.__node_bounds else 'rank'} {k}: {v}")
@@ -87,6 +98,14 @@ class AffineCombinationWorkModel(WorkModelBase):
         """Get the delta parameter."""
         return self.__delta
 
+    def get_migration_cost_per_byte(self):
+        """Get the migration cost per byte."""
+        return self.__migration_cost_per_byte
+
+    def get_migration_amortization_phases(self):
+        """Get the number of phases over which migration cost is amortized."""
+        return self.__migration_amortization_phases
+
     def affine_combination(self, a, l, v1, v2, h):
         """Compute affine combination of load, maximum volume, and homing cost."""
         return a * l + self.__beta * max(v1, v2) + self.__gamma + self.__delta * h
@@ -111,3 +130,10 @@ class AffineCombinationWorkModel(WorkModelBase):
             rank.get_received_volume(),
             rank.get_sent_volume(),
             rank.get_homing())
+
+    def compute_migration_cost(self, objects):
+        """Amortized cost of moving the memory footprint of given objects."""
+        if not self.__migration_cost_per_byte:
+            return 0.0
+        return self.__migration_cost_per_byte * sum(
+            o.get_size() for o in objects) / self.__migration_amortization_phases
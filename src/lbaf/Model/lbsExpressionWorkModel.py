@@ -0,0 +1,228 @@
+#
+#@HEADER
+###############################################################################
+#
+#                          lbsExpressionWorkModel.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import ast
+import functools
+import math
+from logging import Logger
+
+import numpy as np
+
+from .lbsWorkModelBase import WorkModelBase
+from .lbsRank import Rank
+
+
+class ExpressionWorkModel(WorkModelBase):
+    """A concrete class for a work model defined by an expression of rank QOIs"""
+
+    # Functions allowed in expressions, with scalar and vectorized implementations
+    __functions = {
+        "max": (max, lambda *args: functools.reduce(np.maximum, args)),
+        "min": (min, lambda *args: functools.reduce(np.minimum, args)),
+        "abs": (abs, np.abs),
+        "sqrt": (math.sqrt, np.sqrt),
+        "log": (math.log, np.log),
+        "exp": (math.exp, np.exp)}
+
+    # Syntax tree nodes allowed in expressions
+    __nodes = (
+        ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load,
+        ast.Constant, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.UAdd, ast.USub)
+
+    def __init__(self, parameters, lgr: Logger):
+        """Class constructor:
+
+        parameters: dictionary with expression, optional upper bounds and
+        any additional named float constants used in the expression.
+        """
+        # Assign logger to instance variable
+        self.__logger = lgr
+
+        # Retrieve expression and optional strict bounds
+        self.__expression = parameters.get("expression")
+        if not isinstance(self.__expression, str):
+            self.__logger.error("An expression string must be provided to the Expression work model")
+            raise SystemExit(1)
+        self.__upper_bounds = parameters.get("upper_bounds", {})
+        self.__node_bounds = parameters.get("node_bounds", False)
+
+        # All other parameters are named constants
+        self.__constants = {}
+        for k, v in parameters.items():
+            if k in ("expression", "upper_bounds", "node_bounds"):
+                continue
+            if isinstance(v, bool) or not isinstance(v, (int, float)):
+                self.__logger.error(f"Expression work model parameter {k} is not a number: {v}")
+                raise SystemExit(1)
+            self.__constants[k] = float(v)
+
+        # Parse expression once and retrieve the QOI getters it uses
+        tree, self.__qois = self.__parse()
+        self.__code = compile(tree, "<expression>", "eval")
+
+        # Build evaluation namespaces without access to builtins
+        self.__scalar_namespace = {"__builtins__": {}, **self.__constants}
+        self.__vector_namespace = {"__builtins__": {}, **self.__constants}
+        for name, (scalar, vector) in self.__functions.items():
+            self.__scalar_namespace[name] = scalar
+            self.__vector_namespace[name] = vector
+
+        # Call superclass init
+        super().__init__(parameters)
+        self.__logger.info(
+            f"Instantiated work model with: expression={self.__expression}, "
+            f"QOIs={sorted(self.__qois)}, constants={self.__constants}")
+        for k, v in self.__upper_bounds.items():
+            self.__logger.info(
+                f"Upper bound for {'node' if self.__node_bounds else 'rank'} {k}: {v}")
+
+    def __parse(self) -> tuple:
+        """Validate expression syntax tree and return it with used QOI getters."""
+        try:
+            tree = ast.parse(self.__expression, mode="eval")
+        except SyntaxError as err:
+            self.__logger.error(f"Could not parse work model expression: {self.__expression}")
+            raise SystemExit(1) from err
+
+        # Rank QOIs are obtained from the @qoi decorated getters
+        rank_qois = {k: v.__func__ for k, v in Rank(self.__logger).get_qois().items()}
+        for k in self.__constants:
+            if k in self.__functions:
+                self.__logger.error(f"Expression work model constant {k} shadows a function")
+                raise SystemExit(1)
+            if k in rank_qois:
+                # Named parameters take precedence over rank QOIs
+                self.__logger.warning(f"Expression work model constant {k} shadows a rank QOI")
+
+        # Only arithmetic on numbers, QOIs, constants and known functions is allowed
+        qois, functions = {}, set()
+        for node in ast.walk(tree):
+            if not isinstance(node, self.__nodes):
+                self.__logger.error(
+                    f"Unsupported {type(node).__name__} in work model expression: {self.__expression}")
+                raise SystemExit(1)
+            if isinstance(node, ast.Call):
+                if not isinstance(node.func, ast.Name) or node.func.id not in self.__functions or node.keywords:
+                    self.__logger.error(
+                        f"Unsupported function call in work model expression: {ast.dump(node.func)}")
+                    raise SystemExit(1)
+                functions.add(id(node.func))
+            elif isinstance(node, ast.Constant):
+                if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+                    self.__logger.error(f"Unsupported constant in work model expression: {node.value}")
+                    raise SystemExit(1)
+
+                # Evaluate in floating point so that large powers overflow instead of hanging
+                node.value = float(node.value)
+            elif isinstance(node, ast.Name) and id(node) not in functions:
+                if node.id in self.__constants:
+                    continue
+                if node.id in rank_qois:
+                    qois[node.id] = rank_qois[node.id]
+                else:
+                    self.__logger.error(
+                        f"Unknown name in work model expression: {node.id} is neither a rank QOI nor a parameter")
+                    raise SystemExit(1)
+
+        # Return syntax tree and getters of QOIs used in expression
+        return tree, qois
+
+    def get_expression(self) -> str:
+        """Get the work model expression."""
+        return self.__expression
+
+    def get_constants(self) -> dict:
+        """Get the named constants of the expression."""
+        return self.__constants
+
+    def __get_bound_values(self, entities: list, k: str) -> np.ndarray:
+        """Return values of bounded quantity for given ranks."""
+        return np.fromiter(
+            (getattr(r.get_node() if self.__node_bounds else r, f"get_{k}")() for r in entities),
+            dtype=float, count=len(entities))
+
+    def compute(self, rank: Rank):
+        """A work model with user-defined expression of rank QOIs,
+        under optional strict upper bounds.
+        """
+        # Check whether strict bounds are satisfied
+        for k, v in self.__upper_bounds.items():
+            if getattr(
+                    rank.get_node() if self.__node_bounds else rank,
+                    f"get_{k}")() > v:
+                return math.inf
+
+        # Evaluate expression with rank QOI values, undefined or non-real results are infinite
+        try:
+            work = eval( # pylint:disable=W0123:eval-used # syntax tree was validated
+                self.__code, self.__scalar_namespace, {k: float(f(rank)) for k, f in self.__qois.items()})
+        except (ArithmeticError, TypeError, ValueError):
+            return math.inf
+        return float(work) if not isinstance(work, complex) and math.isfinite(work) else math.inf
+
+    def compute_all(self, ranks: list):
+        """Vectorized evaluation of expression for all given ranks."""
+        # Gather QOI values of all ranks into arrays
+        n_ranks = len(ranks)
+        values = {
+            k: np.fromiter((f(r) for r in ranks), dtype=float, count=n_ranks)
+            for k, f in self.__qois.items()}
+
+        # Evaluate expression once over arrays, failing constant subexpressions are infinite for all ranks
+        try:
+            with np.errstate(all="ignore"):
+                work = np.broadcast_to(
+                    eval( # pylint:disable=W0123:eval-used # syntax tree was validated
+                        self.__code, self.__vector_namespace, values), (n_ranks,))
+        except (ArithmeticError, TypeError, ValueError):
+            work = np.full(n_ranks, math.inf)
+
+        # Undefined or non-real results are infinite
+        if np.iscomplexobj(work):
+            work = np.where(work.imag == 0.0, work.real, math.inf)
+        work = np.array(work, dtype=float)
+        work[~np.isfinite(work)] = math.inf
+
+        # Apply strict bounds
+        for k, v in self.__upper_bounds.items():
+            work[self.__get_bound_values(ranks, k) > v] = math.inf
+        return work
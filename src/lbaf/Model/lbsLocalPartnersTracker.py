@@ -0,0 +1,139 @@
+#
+#@HEADER
+###############################################################################
+#
+#                          lbsLocalPartnersTracker.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+from ..IO.lbsStatistics import print_subset_statistics
+from .lbsObject import Object
+from .lbsObjectCommunicator import ObjectCommunicator
+from .lbsPhaseTracker import PhaseTracker
+from .lbsRank import Rank
+
+
+class LocalPartnersTracker(PhaseTracker):
+    """A concrete class counting rank-local communication partners of objects of a phase."""
+
+    def __init__(self, phase, lgr):
+        """Class constructor."""
+        # Call superclass init
+        super().__init__(phase, lgr)
+
+        # Start with null counts of rank-local communication partners
+        self.__local_partners = None
+
+    def reset(self):
+        """Discard counts when ranks of phase change."""
+        self.__local_partners = None
+
+    def compute_local_partners(self):
+        """Compute number of rank-local communication partners of all objects."""
+        # Compute or re-compute counts from scratch
+        self._logger.info("Computing rank-local communication partners")
+        self.__local_partners = {}
+
+        # Iterate over all objects of all ranks
+        n_local = 0
+        for rank in self._phase.get_ranks():
+            r_id = rank.get_id()
+            for o in rank.get_objects():
+                # Count sent and received entries with endpoint on same rank
+                n_o = sum(
+                    k.get_rank_id() == r_id
+                    for k in o.get_sent()) + sum(
+                    k.get_rank_id() == r_id
+                    for k in o.get_received())
+                self.__local_partners[o] = n_o
+                n_local += n_o > 0
+
+        # Report on computed counts
+        print_subset_statistics(
+            "Objects with rank-local communication partners",
+            n_local,
+            "objects",
+            len(self.__local_partners),
+            self._logger)
+
+    def get_number_of_local_partners(self, o: Object) -> int:
+        """Return number of communication entries of object with endpoint on its rank."""
+        # Compute counts when not available
+        if self.__local_partners is None:
+            self.compute_local_partners()
+
+        # Return count for object, which is null when it has no communicator
+        return self.__local_partners.get(o, 0)
+
+    def update(self, o: Object, r_src: Rank, r_dst: Rank):
+        """Update counts of rank-local communication partners before object transfer."""
+        # Counts are computed lazily hence nothing to update when not available
+        if self.__local_partners is None:
+            return
+
+        # Break out early when object has no communicator
+        comm = o.get_communicator()
+        if not isinstance(comm, ObjectCommunicator):
+            return
+
+        # Keep track of indices related to src and dst
+        src_id, dst_id = r_src.get_id(), r_dst.get_id()
+
+        # Update counts of object and of its partners on either endpoint rank
+        n_o = 0
+        for k in set(comm.get_sent()).union(comm.get_received()):
+            # Number of entries of object to partner and of partner to object
+            n_o_k = (k in comm.get_sent()) + (k in comm.get_received())
+
+            # Self-communications remain rank-local wherever object goes
+            if k is o:
+                n_o += n_o_k
+                continue
+            n_k_o = (o in k.get_sent()) + (o in k.get_received())
+
+            # Distinguish between possible cases for other communication endpoint
+            oth_id = k.get_rank_id()
+            if oth_id == src_id:
+                # Rank-local communication becomes off-rank
+                self.__local_partners[k] = self.__local_partners.get(k, 0) - n_k_o
+            elif oth_id == dst_id:
+                # Off-rank communication becomes rank-local
+                self.__local_partners[k] = self.__local_partners.get(k, 0) + n_k_o
+                n_o += n_o_k
+
+        # Reset count of transferred object
+        self.__local_partners[o] = n_o
@@ -43,11 +43,14 @@
 class Message:
     """A class representing information sent between ranks."""
 
-    def __init__(self, r: int, s: set):
+    def __init__(self, r: int, s: set, loads: dict = None):
         # Member variables passed by constructor
         self.__round = r
         self.__support = s
 
+        # Optional loads of support ranks
+        self.__loads = loads
+
     def __repr__(self):
         return f"Message at round: {self.__round}, support: {self.__support}"
 
@@ -58,3 +61,7 @@ class Message:
     def get_support(self):
         """Return message support."""
         return self.__support
+
+    def get_loads(self):
+        """Return loads of support ranks when carried by message."""
+        return self.__loads
@@ -0,0 +1,168 @@
+#
+#@HEADER
+###############################################################################
+#
+#                           lbsNodeVolumesTracker.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+from typing import Optional
+
+from ..IO.lbsStatistics import print_subset_statistics
+from .lbsObject import Object
+from .lbsObjectCommunicator import ObjectCommunicator
+from .lbsPhaseTracker import PhaseTracker
+from .lbsRank import Rank
+
+
+class NodeVolumesTracker(PhaseTracker):
+    """A concrete class tallying intra-node and inter-node volumes of ranks of a phase."""
+
+    def __init__(self, phase, lgr):
+        """Class constructor."""
+        # Call superclass init
+        super().__init__(phase, lgr)
+
+        # Start with null intra-node and inter-node rank volumes
+        self.__node_volumes = None
+        self.__rank_nodes = None
+        self.__node_rank_ids = None
+
+    def reset(self):
+        """Discard volumes when ranks of phase change."""
+        self.__node_volumes = None
+
+    def __tally_node_volume(self, i: int, j: int, v: float):
+        """Convenience method to tally volume sent by rank i to rank j."""
+        # Rank-local communications are not tallied
+        if i == j:
+            return
+
+        # Communications between ranks of a same node are intra-node,
+        # including those with peer ranks that do not belong to phase
+        n_i = self.__rank_nodes.get(i, (None, None))[1]
+        n_j = self.__rank_nodes.get(j, (None, None))[1]
+        offset = 0 if (
+            n_i is not None and j in self.__node_rank_ids[n_i]) or (
+            n_j is not None and i in self.__node_rank_ids[n_j]) else 2
+
+        # Only tally volumes of ranks belonging to phase
+        if i in self.__node_volumes:
+            self.__node_volumes[i][offset] += v
+        if j in self.__node_volumes:
+            self.__node_volumes[j][offset + 1] += v
+
+    def compute_node_volumes(self):
+        """Compute intra-node and inter-node sent and received volumes of all ranks."""
+        # Compute or re-compute volumes from scratch
+        self._logger.info("Computing intra-node and inter-node rank volumes")
+        self.__rank_nodes = {
+            r.get_id(): (r, n.get_id() if (n := r.get_node()) is not None else None)
+            for r in self._phase.get_ranks()}
+        self.__node_rank_ids = {
+            n.get_id(): {r.get_id() for r in n.get_ranks()}
+            for r in self._phase.get_ranks() if (n := r.get_node()) is not None}
+        self.__node_volumes = {r_id: [0., 0., 0., 0.] for r_id in self.__rank_nodes}
+
+        # Iterate over sent volumes of all objects of all ranks
+        for rank in self._phase.get_ranks():
+            i = rank.get_id()
+            for o in rank.get_objects():
+                for k, v in o.get_sent().items():
+                    self.__tally_node_volume(i, k.get_rank_id(), v)
+
+                # Volumes sent by ranks not belonging to phase are tallied at receipt
+                for k, v in o.get_received().items():
+                    if (s_id := k.get_rank_id()) not in self.__node_volumes:
+                        self.__tally_node_volume(s_id, i, v)
+
+        # Report on computed volumes
+        v_intra = sum(v[0] for v in self.__node_volumes.values())
+        print_subset_statistics(
+            "Intra-node communication volume",
+            v_intra,
+            "inter-rank volume",
+            v_intra + sum(v[2] for v in self.__node_volumes.values()),
+            self._logger)
+
+    def __get_node_volumes(self, r: Rank) -> Optional[list]:
+        """Return node volumes of rank when it belongs to phase."""
+        # Compute volumes when not available
+        if self.__node_volumes is None:
+            self.compute_node_volumes()
+
+        # Ranks that do not belong to phase have no volumes
+        r_id = r.get_id()
+        if self.__rank_nodes.get(r_id, (None,))[0] is not r:
+            return None
+        return self.__node_volumes[r_id]
+
+    def get_intra_node_volumes(self, r: Rank) -> Optional[tuple]:
+        """Return volumes sent and received by rank to and from other ranks on its node."""
+        if (volumes := self.__get_node_volumes(r)) is None:
+            return None
+        return volumes[0], volumes[1]
+
+    def get_inter_node_volumes(self, r: Rank) -> Optional[tuple]:
+        """Return volumes sent and received by rank to and from ranks on other nodes."""
+        if (volumes := self.__get_node_volumes(r)) is None:
+            return None
+        return volumes[2], volumes[3]
+
+    def update(self, o: Object, r_src: Rank, r_dst: Rank):
+        """Update intra-node and inter-node rank volumes before object transfer."""
+        # Volumes are computed lazily hence nothing to update when not available
+        if self.__node_volumes is None:
+            return
+
+        # Break out early when object has no communicator
+        comm = o.get_communicator()
+        if not isinstance(comm, ObjectCommunicator):
+            return
+
+        # Move communications of object from source to destination rank
+        src_id, dst_id = r_src.get_id(), r_dst.get_id()
+        for k, v in comm.get_sent().items():
+            if k is not o:
+                oth_id = k.get_rank_id()
+                self.__tally_node_volume(src_id, oth_id, -v)
+                self.__tally_node_volume(dst_id, oth_id, v)
+        for k, v in comm.get_received().items():
+            if k is not o:
+                oth_id = k.get_rank_id()
+                self.__tally_node_volume(oth_id, src_id, -v)
+                self.__tally_node_volume(oth_id, dst_id, v)
@@ -101,6 +101,9 @@ class Phase:
         # Start with null set of edges
         self.__edges = None
 
+        # Start with no trackers of quantities maintained across object transfers
+        self.__trackers = {}
+
         # VT Data Reader
         self.__reader = reader
 
@@ -124,6 +127,10 @@ class Phase:
         """Retrieve sub-index of this phase."""
         return self.__phase_sub_id
 
+    def get_reader(self):
+        """Retrieve possibly null reader used to populate this phase."""
+        return self.__reader
+
     def get_number_of_ranks(self):
         """Retrieve number of ranks belonging to phase."""
         return len(self.__ranks)
@@ -132,10 +139,24 @@ class Phase:
         """ Set list of ranks for this phase."""
         self.__ranks = ranks
 
+        # Invalidate quantities derived from previous ranks
+        self.__reset_trackers()
+
     def get_ranks(self):
         """Retrieve all ranks belonging to phase."""
         return self.__ranks
 
+    def get_tracker(self, tracker_type: type):
+        """Return tracker of given type notified of object transfers, registering it when needed."""
+        if (tracker := self.__trackers.get(tracker_type)) is None:
+            tracker = self.__trackers[tracker_type] = tracker_type(self, self.__logger)
+        return tracker
+
+    def __reset_trackers(self):
+        """Discard quantities maintained by registered trackers."""
+        for tracker in self.__trackers.values():
+            tracker.reset()
+
     def get_nodes(self):
         """Retrieve all nodes belonging to phase."""
         nodes: Set[Node] = set()
@@ -157,6 +178,7 @@ class Phase:
             for n in phase.get_nodes()}
 
         # Copy all ranks of phase
+        self.__reset_trackers()
         self.__ranks: Set[Rank] = set()
         for r in phase.get_ranks():
             # Minimally instantiate rank and copy
@@ -677,6 +699,10 @@ class Phase:
         # Update inter-rank edges before moving objects
         self.update_edges(o, r_src, r_dst)
 
+        # Update quantities maintained by registered trackers as well
+        for tracker in self.__trackers.values():
+            tracker.update(o, r_src, r_dst)
+
         # Remove object from migratable ones on source
         r_src.remove_migratable_object(o)
 
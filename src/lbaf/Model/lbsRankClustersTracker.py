@@ -0,0 +1,123 @@
+#
+#@HEADER
+###############################################################################
+#
+#                          lbsRankClustersTracker.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import math
+
+from .lbsObject import Object
+from .lbsPhaseTracker import PhaseTracker
+from .lbsRank import Rank
+
+
+class RankClustersTracker(PhaseTracker):
+    """A concrete class maintaining clusters of migratable objects of ranks of a phase by shared block ID."""
+
+    def __init__(self, phase, lgr):
+        """Class constructor."""
+        # Call superclass init
+        super().__init__(phase, lgr)
+
+        # Start with null clusters of migratable objects by shared block ID
+        self.__rank_clusters = None
+
+    def reset(self):
+        """Discard clusters when ranks of phase change."""
+        self.__rank_clusters = None
+
+    @staticmethod
+    def __sum_cluster_load(cluster: list):
+        """Recompute total load of cluster from its objects so that it does not drift."""
+        cluster[1] = math.fsum(o.get_load() for o in cluster[0])
+
+    @staticmethod
+    def __cluster_rank_objects(r: Rank) -> dict:
+        """Return clusters of migratable objects of rank by shared block ID with their loads."""
+        clusters = {}
+        for o in r.get_migratable_objects():
+            if (sb_id := o.get_shared_id()) is not None:
+                clusters.setdefault(sb_id, [{}, 0.0])[0][o] = None
+        for cluster in clusters.values():
+            RankClustersTracker.__sum_cluster_load(cluster)
+        return clusters
+
+    def compute_rank_clusters(self):
+        """Compute clusters of migratable objects of each rank by shared block ID."""
+        # Compute or re-compute clusters from scratch
+        self._logger.info("Computing rank clusters of migratable objects")
+        self.__rank_clusters = {r: self.__cluster_rank_objects(r) for r in self._phase.get_ranks()}
+
+    def get_rank_clusters(self, r: Rank) -> dict:
+        """Return clusters of migratable objects of rank by shared block ID.
+
+        Clusters map shared block IDs to pairs of insertion-ordered dicts of objects
+        and their total load, which are maintained across object transfers; callers
+        must therefore neither modify them nor iterate over them while transferring.
+        """
+        # Compute clusters when not available
+        if self.__rank_clusters is None:
+            self.compute_rank_clusters()
+
+        # Clusters of ranks not belonging to phase are computed on demand
+        if (clusters := self.__rank_clusters.get(r)) is None:
+            clusters = self.__rank_clusters[r] = self.__cluster_rank_objects(r)
+        return clusters
+
+    def update(self, o: Object, r_src: Rank, r_dst: Rank):
+        """Update clusters of migratable objects before object transfer."""
+        # Clusters are computed lazily hence nothing to update when not available
+        if self.__rank_clusters is None or (sb_id := o.get_shared_id()) is None:
+            return
+
+        # Invalidate clusters when object was not accounted for
+        if not (cluster := self.__rank_clusters.get(r_src, {}).get(sb_id)) or o not in cluster[0]:
+            self.__rank_clusters = None
+            return
+
+        # Move object from source to destination cluster and recompute their loads
+        del cluster[0][o]
+        if cluster[0]:
+            self.__sum_cluster_load(cluster)
+        else:
+            del self.__rank_clusters[r_src][sb_id]
+        if (clusters := self.__rank_clusters.get(r_dst)) is not None:
+            cluster = clusters.setdefault(sb_id, [{}, 0.0])
+            cluster[0][o] = None
+            self.__sum_cluster_load(cluster)
@@ -0,0 +1,157 @@
+#
+#@HEADER
+###############################################################################
+#
+#                          lbsSubphaseLoadsTracker.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+from typing import Optional
+
+import numpy as np
+
+from .lbsObject import Object
+from .lbsPhaseTracker import PhaseTracker
+from .lbsRank import Rank
+
+
+class SubphaseLoadsTracker(PhaseTracker):
+    """A concrete class maintaining the ranks x subphases matrix of loads of a phase."""
+
+    def __init__(self, phase, lgr):
+        """Class constructor."""
+        # Call superclass init
+        super().__init__(phase, lgr)
+
+        # Start with null ranks x subphases load matrix
+        self.__subphase_loads = None
+        self.__subphase_maxima = None
+        self.__subphase_rows = None
+        self.__object_subphase_loads = None
+
+    def reset(self):
+        """Discard matrix when ranks of phase change."""
+        self.__subphase_loads = None
+
+    def compute_subphase_loads(self):
+        """Compute ranks x subphases matrix of loads."""
+        # Compute or re-compute matrix from scratch
+        self._logger.info("Computing rank subphase loads")
+        objects = [(r, o) for r in self._phase.get_ranks() for o in r.get_objects()]
+
+        # Loads of objects without subphases are assigned to subphase 0
+        sp_ids = set()
+        for _, o in objects:
+            if o.get_subphases():
+                sp_ids.update(sp.get("id") for sp in o.get_subphases())
+            else:
+                sp_ids.add(0)
+        columns = {sp_id: j for j, sp_id in enumerate(sorted(sp_ids))}
+
+        # Tally subphase load vectors of objects into their rank row
+        self.__subphase_rows = {r.get_id(): (r, i) for i, r in enumerate(self._phase.get_ranks())}
+        self.__subphase_loads = np.zeros((len(self.__subphase_rows), max(len(columns), 1)))
+        self.__object_subphase_loads = {}
+        for r, o in objects:
+            o_loads = np.zeros(self.__subphase_loads.shape[1])
+            if o.get_subphases():
+                for sp in o.get_subphases():
+                    o_loads[columns[sp.get("id")]] += sp.get("time", 0.0)
+            else:
+                o_loads[columns[0]] = o.get_load()
+            self.__object_subphase_loads[o] = o_loads
+            self.__subphase_loads[self.__subphase_rows[r.get_id()][1]] += o_loads
+        self.__subphase_maxima = np.max(self.__subphase_loads, axis=0, initial=0.0)
+
+        # Report on computed loads
+        self._logger.info(
+            f"Subphase critical path: {self.__subphase_maxima.sum()} "
+            f"across {len(columns)} subphases")
+
+    def get_subphase_loads(self) -> np.ndarray:
+        """Return ranks x subphases matrix of loads."""
+        # Compute matrix when not available
+        if self.__subphase_loads is None:
+            self.compute_subphase_loads()
+
+        # Return matrix
+        return self.__subphase_loads
+
+    def get_subphase_maxima(self) -> np.ndarray:
+        """Return maximum rank load of each subphase."""
+        # Compute matrix when not available
+        if self.__subphase_loads is None:
+            self.compute_subphase_loads()
+
+        # Recompute maxima when a maximally loaded rank lost load
+        if self.__subphase_maxima is None:
+            self.__subphase_maxima = np.max(self.__subphase_loads, axis=0, initial=0.0)
+        return self.__subphase_maxima
+
+    def get_subphase_row(self, r: Rank) -> Optional[int]:
+        """Return row of rank in subphase load matrix when it belongs to phase."""
+        # Compute matrix when not available
+        if self.__subphase_loads is None:
+            self.compute_subphase_loads()
+
+        # Ranks that do not belong to phase have no row
+        r_phase, i = self.__subphase_rows.get(r.get_id(), (None, None))
+        return i if r_phase is r else None
+
+    def update(self, o: Object, r_src: Rank, r_dst: Rank):
+        """Update ranks x subphases matrix of loads before object transfer."""
+        # Matrix is computed lazily hence nothing to update when not available
+        if self.__subphase_loads is None:
+            return
+
+        # Invalidate matrix when object was not accounted for
+        if (o_loads := self.__object_subphase_loads.get(o)) is None:
+            self.__subphase_loads = None
+            return
+
+        # Move subphase load vector of object from source to destination row
+        src_loads = self.__subphase_loads[self.__subphase_rows[r_src.get_id()][1]]
+        dst_loads = self.__subphase_loads[self.__subphase_rows[r_dst.get_id()][1]]
+        if self.__subphase_maxima is not None and (
+                (o_loads > 0.0) & (src_loads >= self.__subphase_maxima)).any():
+            self.__subphase_maxima = None
+        src_loads -= o_loads
+        dst_loads += o_loads
+
+        # Maxima can only increase on destination row otherwise
+        if self.__subphase_maxima is not None:
+            np.maximum(self.__subphase_maxima, dst_loads, out=self.__subphase_maxima)
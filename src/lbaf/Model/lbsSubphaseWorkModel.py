@@ -0,0 +1,163 @@
+#
+#@HEADER
+###############################################################################
+#
+#                           lbsSubphaseWorkModel.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import math
+from logging import Logger
+from typing import Optional
+
+import numpy as np
+
+from .lbsSubphaseLoadsTracker import SubphaseLoadsTracker
+from .lbsWorkModelBase import WorkModelBase
+from .lbsRank import Rank
+
+
+class SubphaseWorkModel(WorkModelBase):
+    """A concrete class for a work model bound by subphase synchronizations"""
+
+    def __init__(self, parameters, lgr: Logger):
+        """Class constructor:
+
+        parameters: dictionary with optional upper bounds.
+        """
+        # Assign logger to instance variable
+        self.__logger = lgr
+
+        # Use default values if parameters not provided
+        self.__upper_bounds = parameters.get("upper_bounds", {})
+        self.__node_bounds = parameters.get("node_bounds", False)
+
+        # Subphase loads are maintained by phase once bound
+        self.__tracker = None
+
+        # Call superclass init
+        super().__init__(parameters)
+        self.__logger.info("Instantiated subphase work model")
+        for k, v in self.__upper_bounds.items():
+            self.__logger.info(
+                f"Upper bound for {'node' if self.__node_bounds else 'rank'} {k}: {v}")
+
+    def set_phase(self, phase):
+        """Use subphase loads incrementally maintained by phase."""
+        self.__tracker = phase.get_tracker(SubphaseLoadsTracker) if phase is not None else None
+
+    @staticmethod
+    def compute_subphase_total(rank: Rank):
+        """Compute sum of subphase loads of rank from scratch."""
+        return sum(
+            sum(sp.get("time", 0.0) for sp in o.get_subphases())
+            if o.get_subphases() else o.get_load()
+            for o in rank.get_objects())
+
+    @staticmethod
+    def compute_subphase_maxima(ranks: list) -> dict:
+        """Compute maximum rank load of each subphase from scratch."""
+        maxima = {}
+        for rank in ranks:
+            loads = {}
+            for o in rank.get_objects():
+                for sp in o.get_subphases() or ({"id": 0, "time": o.get_load()},):
+                    loads[sp.get("id")] = loads.get(sp.get("id"), 0.0) + sp.get("time", 0.0)
+            for k, v in loads.items():
+                maxima[k] = max(maxima.get(k, 0.0), v)
+        return maxima
+
+    def __satisfies_bounds(self, rank: Rank) -> bool:
+        """Check whether strict bounds are satisfied by rank."""
+        return all(
+            getattr(rank.get_node() if self.__node_bounds else rank, f"get_{k}")() <= v
+            for k, v in self.__upper_bounds.items())
+
+    def __get_phase_rows(self, ranks: list) -> Optional[list]:
+        """Return rows of ranks in subphase load matrix when they all belong to bound phase."""
+        if self.__tracker is None:
+            return None
+        rows = [self.__tracker.get_subphase_row(r) for r in ranks]
+        return None if None in rows else rows
+
+    def compute(self, rank: Rank):
+        """A work model summing rank loads over synchronized subphases,
+        under optional strict upper bounds.
+        """
+        # Check whether strict bounds are satisfied
+        if not self.__satisfies_bounds(rank):
+            return math.inf
+
+        # Retrieve row of rank when it belongs to bound phase
+        if (rows := self.__get_phase_rows([rank])) is not None:
+            return float(self.__tracker.get_subphase_loads()[rows[0]].sum())
+
+        # Otherwise compute it from scratch
+        return float(self.compute_subphase_total(rank))
+
+    def compute_all(self, ranks: list):
+        """Vectorized evaluation of subphase load sums for all given ranks."""
+        # Sum rows of subphase load matrix when ranks belong to bound phase
+        if (rows := self.__get_phase_rows(ranks)) is not None:
+            work = self.__tracker.get_subphase_loads()[rows].sum(axis=1)
+
+        # Otherwise compute them from scratch
+        else:
+            work = np.array([self.compute_subphase_total(r) for r in ranks], dtype=float)
+
+        # Apply strict bounds
+        for i, r in enumerate(ranks):
+            if not self.__satisfies_bounds(r):
+                work[i] = math.inf
+        return work
+
+    def compute_critical_path(self, ranks: list):
+        """Sum over subphases of the maximum rank subphase load.
+
+        Ranks of bound phase share the critical path of all its ranks,
+        other ranks are synchronized among themselves only.
+        """
+        # Critical path is unbounded when any rank violates strict bounds
+        if not all(self.__satisfies_bounds(r) for r in ranks):
+            return math.inf
+
+        # Retrieve critical path of phase when ranks belong to it
+        if self.__get_phase_rows(ranks) is not None:
+            return float(self.__tracker.get_subphase_maxima().sum())
+
+        # Otherwise compute it from scratch
+        return float(sum(self.compute_subphase_maxima(ranks).values()))
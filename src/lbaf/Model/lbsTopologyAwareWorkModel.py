@@ -0,0 +1,150 @@
+#
+#@HEADER
+###############################################################################
+#
+#                         lbsTopologyAwareWorkModel.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import math
+from logging import Logger
+
+from .lbsNodeVolumesTracker import NodeVolumesTracker
+from .lbsWorkModelBase import WorkModelBase
+from .lbsRank import Rank
+
+
+class TopologyAwareWorkModel(WorkModelBase):
+    """A concrete class for a work model distinguishing intra-node and inter-node communications"""
+
+    def __init__(self, parameters, lgr: Logger):
+        """Class constructor:
+
+        parameters: dictionary with beta_intra, beta_inter, gamma and delta values.
+        """
+        # Assign logger to instance variable
+        self.__logger = lgr
+
+        # Use default values if parameters not provided
+        self.__beta_intra = parameters.get("beta_intra", 0.0)
+        self.__beta_inter = parameters.get("beta_inter", 0.0)
+        self.__gamma = parameters.get("gamma", 0.0)
+        self.__delta = parameters.get("delta", 0.0)
+        self.__upper_bounds = parameters.get("upper_bounds", {})
+        self.__node_bounds = parameters.get("node_bounds", False)
+
+        # Node volumes are maintained by phase once bound
+        self.__phase = None
+
+        # Call superclass init
+        super().__init__(parameters)
+        self.__logger.info(
+            "Instantiated work model with: "
+            f"beta_intra={self.__beta_intra}, beta_inter={self.__beta_inter}, "
+            f"gamma={self.__gamma}, delta={self.__delta}")
+        for k, v in self.__upper_bounds.items():
+            self.__logger.info(
+                f"Upper bound for {'node' if self.__node_bounds else 'rank'} {k}: {v}")
+
+    def get_beta_intra(self):
+        """Get the intra-node communication parameter."""
+        return self.__beta_intra
+
+    def get_beta_inter(self):
+        """Get the inter-node communication parameter."""
+        return self.__beta_inter
+
+    def get_gamma(self):
+        """Get the gamma parameter."""
+        return self.__gamma
+
+    def get_delta(self):
+        """Get the delta parameter."""
+        return self.__delta
+
+    def set_phase(self, phase):
+        """Use node volumes incrementally maintained by phase."""
+        self.__phase = phase
+
+    @staticmethod
+    def compute_node_volumes(rank: Rank):
+        """Compute intra-node and inter-node sent and received volumes of rank from scratch."""
+        # Ranks not attached to a node only have inter-node communications
+        r_id = rank.get_id()
+        node = rank.get_node()
+        node_rank_ids = {r.get_id() for r in node.get_ranks()} if node is not None else {r_id}
+
+        # Tally volumes of all objects by endpoint rank
+        volumes = [0., 0., 0., 0.]
+        for o in rank.get_objects():
+            for offset, items in ((0, o.get_sent().items()), (1, o.get_received().items())):
+                for k, v in items:
+                    if (oth_id := k.get_rank_id()) != r_id:
+                        volumes[offset + (0 if oth_id in node_rank_ids else 2)] += v
+
+        # Return intra-node and inter-node volumes
+        return (volumes[0], volumes[1]), (volumes[2], volumes[3])
+
+    def compute(self, rank: Rank):
+        """A work model with affine combination of load and node-aware communication.
+
+        alpha * load + beta_intra * max(intra-node sent, received)
+        + beta_inter * max(inter-node sent, received) + gamma + delta * homing,
+        under optional strict upper bounds.
+        """
+        # Check whether strict bounds are satisfied
+        for k, v in self.__upper_bounds.items():
+            if getattr(
+                    rank.get_node() if self.__node_bounds else rank,
+                    f"get_{k}")() > v:
+                return math.inf
+
+        # Retrieve node volumes from phase when available
+        intra = None
+        if self.__phase is not None:
+            tracker = self.__phase.get_tracker(NodeVolumesTracker)
+            intra = tracker.get_intra_node_volumes(rank)
+        if intra is not None:
+            inter = tracker.get_inter_node_volumes(rank)
+        else:
+            intra, inter = self.compute_node_volumes(rank)
+
+        # Return combination of load and node volumes
+        return rank.get_alpha() * rank.get_load() \
+            + self.__beta_intra * max(intra) \
+            + self.__beta_inter * max(inter) \
+            + self.__gamma + self.__delta * rank.get_homing()
@@ -43,6 +43,8 @@
 import abc
 from logging import Logger
 
+import numpy as np
+
 from ..Utils.lbsLogging import get_logger
 
 
@@ -64,7 +66,10 @@ class WorkModelBase:
         """Produce the necessary concrete work model."""
         # pylint:disable=W0641:possibly-unused-variable,C0415:import-outside-toplevel
         from .lbsAffineCombinationWorkModel import AffineCombinationWorkModel
+        from .lbsExpressionWorkModel import ExpressionWorkModel
         from .lbsLoadOnlyWorkModel import LoadOnlyWorkModel
+        from .lbsTopologyAwareWorkModel import TopologyAwareWorkModel
+        from .lbsSubphaseWorkModel import SubphaseWorkModel
 
         # pylint:enable=W0641:possibly-unused-variable,C0415:import-outside-toplevel
         # Ensure that work name is valid
@@ -81,3 +86,22 @@ class WorkModelBase:
     def compute(self, rank):
         """Return value of work for given rank."""
         # Must be implemented by concrete subclass
+
+    def set_phase(self, phase): # pylint:disable=W0613:unused-argument # might be used in child class
+        """Bind work model to phase whose ranks are being balanced."""
+        # Only needed by concrete subclasses using quantities maintained by phase
+
+    def compute_migration_cost(self, objects): # pylint:disable=W0613:unused-argument # might be used in child class
+        """Return cost of migrating given objects, expressed in work units."""
+        # Migrations are free unless a concrete subclass charges for them
+        return 0.0
+
+    def compute_all(self, ranks: list):
+        """Return array of work values for given ranks."""
+        # May be overridden by concrete subclass with vectorized evaluation
+        return np.array([self.compute(r) for r in ranks], dtype=float)
+
+    def compute_critical_path(self, ranks: list): # pylint:disable=W0613:unused-argument # might be used in child class
+        """Return possibly null work of the critical path shared by given ranks."""
+        # Ranks do not share a critical path unless a concrete subclass synchronizes them
+        return None
@@ -0,0 +1,95 @@
+#
+#@HEADER
+###############################################################################
+#
+#                                lbsForkPool.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import contextlib
+from logging import Logger
+from multiprocessing import get_context
+from multiprocessing.pool import Pool
+
+
+# Contexts shared by name with workers, inherited by forked workers
+_shared_contexts = {}
+
+
+def get_shared_context(name: str) -> dict:
+    """Return context shared under given name by enclosing fork pool."""
+    return _shared_contexts[name]
+
+
+def get_number_of_workers(parameters: dict, logger: Logger) -> int:
+    """Return validated number of workers of given parameters, 1 by default."""
+    n_workers = parameters.get("n_workers", 1)
+    if not isinstance(n_workers, int) or n_workers < 1:
+        logger.error(f"Incorrect provided number of workers: {n_workers}")
+        raise SystemExit(1)
+    return n_workers
+
+
+@contextlib.contextmanager
+def fork_pool(name: str, context: dict, n_workers: int):
+    """Share context under given name, with a pool of forked workers when more than one is requested.
+
+    Context is shared before workers are forked so that they inherit it,
+    and any context previously shared under the same name is restored on exit.
+
+    :yields: a Pool of forked workers, or None when work is to be performed in process
+    """
+    previous = _shared_contexts.get(name)
+    _shared_contexts[name] = context
+    try:
+        if n_workers > 1:
+            with Pool(n_workers, context=get_context("fork")) as pool:
+                yield pool
+        else:
+            yield None
+    finally:
+        if previous is None:
+            del _shared_contexts[name]
+        else:
+            _shared_contexts[name] = previous
+
+
+def reset_object_rank_ids(ranks):
+    """Make objects of ranks point back to them, e.g. after runs on copies or in forked workers."""
+    for r in ranks:
+        for o in r.get_objects():
+            o.set_rank_id(r.get_id())
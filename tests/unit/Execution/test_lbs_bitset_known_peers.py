@@ -0,0 +1,100 @@
+#
+#@HEADER
+###############################################################################
+#
+#                        test_lbs_bitset_known_peers.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import logging
+import unittest
+
+import numpy as np
+
+from src.lbaf.Model.lbsRank import Rank
+from src.lbaf.Execution.lbsBitsetKnownPeers import BitsetKnownPeers
+
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger()
+        self.ranks = [Rank(self.logger, i) for i in range(77)]
+
+    def test_lbs_bitset_known_peers_initial(self):
+        known_peers = BitsetKnownPeers(self.ranks, np.random.default_rng(0))
+        self.assertEqual(len(known_peers), 77)
+        self.assertEqual(known_peers[self.ranks[5]], {self.ranks[5]})
+        self.assertEqual(list(known_peers.get_numbers_of_known_peers()), [1] * 77)
+        self.assertIsNone(known_peers.get(Rank(self.logger, 100)))
+
+        # Initial targets are distinct ranks other than sender
+        senders, recipients = known_peers.sample_targets(4, initial=True)
+        self.assertEqual(len(senders), 77 * 4)
+        self.assertFalse(np.any(senders == recipients))
+        self.assertEqual(len(set(zip(senders.tolist(), recipients.tolist()))), 77 * 4)
+
+    def test_lbs_bitset_known_peers_rounds(self):
+        # Use small chunks to exercise chunked processing
+        known_peers = BitsetKnownPeers(self.ranks, np.random.default_rng(1), max_chunk_bytes=1024)
+        reference = {i: {i} for i in range(77)}
+        for i in range(4):
+            senders, recipients = known_peers.sample_targets(3, initial=not i)
+
+            # Later targets are distinct known peers other than sender
+            if i:
+                for s in range(77):
+                    targets = recipients[senders == s].tolist()
+                    self.assertEqual(len(targets), min(3, len(reference[s]) - 1))
+                    self.assertEqual(len(set(targets)), len(targets))
+                    self.assertTrue(set(targets) <= reference[s] - {s})
+
+            # Merged supports are those known at start of round
+            snapshot = {k: set(v) for k, v in reference.items()}
+            for s, r in zip(senders.tolist(), recipients.tolist()):
+                reference[r] |= snapshot[s]
+            known_peers.merge(senders, recipients)
+            for r in self.ranks:
+                self.assertEqual({p.get_id() for p in known_peers[r]}, reference[r.get_id()])
+
+        # Knowledge ratios are consistent with known peers
+        self.assertEqual(
+            list(known_peers.get_kappas()),
+            [(len(reference[i]) - 1) / 76 for i in range(77)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -48,6 +48,7 @@ from unittest.mock import patch
 from src.lbaf.Model.lbsMessage import Message
 from src.lbaf.Model.lbsObject import Object
 from src.lbaf.Model.lbsRank import Rank
+from src.lbaf.Model.lbsPhase import Phase
 from src.lbaf.Execution.lbsBruteForceAlgorithm import BruteForceAlgorithm
 from src.lbaf.Model.lbsWorkModelBase import WorkModelBase
 
@@ -87,7 +88,85 @@ class TestConfig(unittest.TestCase):
   def test_lbs_brute_force_skip_transfer(self):
     assert self.brute_force_skip_transfer._BruteForceAlgorithm__skip_transfer is True
 
-  # Test execute function
+  def test_lbs_brute_force_branch_and_bound_execute(self):
+    # Create phase with objects on first of 3 ranks and a sentinel object on last one
+    ranks = [Rank(r_id=i, logger=self.logger) for i in range(3)]
+    for i, load in enumerate([5.0, 4.0, 3.0, 3.0, 2.0, 1.0]):
+      ranks[0].add_migratable_object(o := Object(seq_id=i, load=load))
+      o.set_rank_id(0)
+    ranks[2].add_sentinel_object(o := Object(seq_id=6, load=2.0))
+    o.set_rank_id(2)
+    phase = Phase(self.logger, 0)
+    phase.set_ranks(ranks)
+
+    # Optimal arrangement must be applied to rebalanced phase
+    brute_force = BruteForceAlgorithm(
+        work_model=WorkModelBase.factory("AffineCombination", {}, self.logger),
+        parameters={"branch_and_bound": True, "branch_and_bound_max_nodes": 100000},
+        lgr=self.logger)
+    statistics = {"average load": 20.0 / 3}
+    brute_force.execute(0, {0: phase}, statistics)
+    rebalanced_ranks = brute_force.get_rebalanced_phase().get_ranks()
+    self.assertEqual(sorted(r.get_load() for r in rebalanced_ranks), [6.0, 7.0, 7.0])
+    self.assertEqual(statistics["maximum load"][-1], 7.0)
+    for r in rebalanced_ranks:
+      self.assertEqual(len(r.get_sentinel_objects()), 1 if r.get_id() == 2 else 0)
+      for o in r.get_objects():
+        self.assertEqual(o.get_rank_id(), r.get_id())
+
+  def test_lbs_brute_force_enumeration_execute(self):
+    # Create phase with all objects on first of 3 ranks
+    ranks = [Rank(r_id=i, logger=self.logger) for i in range(3)]
+    for i, load in enumerate([5.0, 4.0, 3.0, 3.0, 2.0, 1.0]):
+      ranks[0].add_migratable_object(o := Object(seq_id=i, load=load))
+      o.set_rank_id(0)
+    phase = Phase(self.logger, 0)
+    phase.set_ranks(ranks)
+
+    # Enumerating arrangements by batches in parallel must find optimum
+    brute_force = BruteForceAlgorithm(
+        work_model=WorkModelBase.factory("AffineCombination", {"gamma": 1.0}, self.logger),
+        parameters={"branch_and_bound": False, "n_workers": 2},
+        lgr=self.logger)
+    statistics = {"average load": 6.0}
+    brute_force.execute(0, {0: phase}, statistics)
+    self.assertEqual(
+      sorted(r.get_load() for r in brute_force.get_rebalanced_phase().get_ranks()), [6.0, 6.0, 6.0])
+
+  def test_lbs_brute_force_branch_and_bound_work_models(self):
+    # Create phase with all objects on first of 3 ranks
+    ranks = [Rank(r_id=i, logger=self.logger) for i in range(3)]
+    for i, load in enumerate([5.0, 4.0, 3.0, 3.0, 2.0, 1.0]):
+      ranks[0].add_migratable_object(o := Object(seq_id=i, load=load))
+      o.set_rank_id(0)
+    phase = Phase(self.logger, 0)
+    phase.set_ranks(ranks)
+
+    # Branch-and-bound must only be used when requested for work models depending solely on load
+    for name, parameters, branch_and_bound, expected in (
+        ("LoadOnly", {}, True, True),
+        ("LoadOnly", {}, False, False),
+        ("AffineCombination", {"beta": 0.0, "gamma": 1.0}, True, True),
+        ("AffineCombination", {"beta": 1.0}, True, False),
+        ("TopologyAware", {}, True, False)):
+      brute_force = BruteForceAlgorithm(
+          work_model=WorkModelBase.factory(name, parameters, self.logger),
+          parameters={"skip_transfer": True, "branch_and_bound": branch_and_bound},
+          lgr=self.logger)
+      with patch(
+          "src.lbaf.Execution.lbsBruteForceAlgorithm.compute_min_max_arrangement_branch_and_bound",
+          return_value=(0, 6.0, (0, 1, 2, 2, 1, 0))) as branch_and_bound:
+        brute_force.execute(0, {0: phase}, {"average load": 6.0})
+      self.assertEqual(branch_and_bound.called, expected)
+
+    # Incorrect maximum numbers of nodes must be rejected
+    for max_nodes in (0, 1.5):
+      with self.assertRaises(SystemExit):
+        BruteForceAlgorithm(
+            work_model=WorkModelBase.factory("LoadOnly", {}, self.logger),
+            parameters={"branch_and_bound": True, "branch_and_bound_max_nodes": max_nodes},
+            lgr=self.logger)
+
 
 if __name__ == "__main__":
     unittest.main()
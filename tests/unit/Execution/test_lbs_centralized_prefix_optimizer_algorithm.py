@@ -103,6 +103,33 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(
             new_phase.get_id(),
             self.phase.get_id())
+    def test_lbs_cpoa_execute_memory_constraint(self):
+        # Place two shared blocks per rank, with most objects on the first rank
+        random.seed(11)
+        ranks = [Rank(r_id=i, logger=self.logger) for i in range(4)]
+        seq_id = 0
+        for r in ranks:
+            for b_id in (2 * r.get_id(), 2 * r.get_id() + 1):
+                block = Block(b_id=b_id, h_id=r.get_id())
+                for _ in range(12 if r.get_id() == 0 else 1):
+                    o = Object(seq_id=seq_id, load=random.uniform(0.5, 2.0))
+                    o.set_shared_block(block)
+                    r.add_migratable_object(o)
+                    seq_id += 1
+        phase = Phase(lgr=self.logger, p_id=0)
+        phase.set_ranks(ranks)
+        total_load = sum(r.get_load() for r in ranks)
+        max_load = max(r.get_load() for r in ranks)
+        statistics = {"average load": total_load / len(ranks)}
+
+        self.cpoa.execute(phase.get_id(), {phase.get_id(): phase}, statistics)
+        new_ranks = self.cpoa.get_rebalanced_phase().get_ranks()
+
+        # Load must be conserved and decreased on heaviest rank within shared block bound
+        self.assertAlmostEqual(sum(r.get_load() for r in new_ranks), total_load)
+        self.assertLess(max(r.get_load() for r in new_ranks), max_load)
+        for r in new_ranks:
+            self.assertLessEqual(len(r.get_shared_ids()), 3)
 
 if __name__ == "__main__":
     unittest.main()
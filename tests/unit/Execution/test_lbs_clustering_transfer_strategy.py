@@ -41,10 +41,12 @@
 #@HEADER
 #
 import logging
+import math
 import unittest
 
 from src.lbaf.Model.lbsRank import Rank
 from src.lbaf.Model.lbsPhase import Phase
+from src.lbaf.Model.lbsRankClustersTracker import RankClustersTracker
 from src.lbaf.Model.lbsBlock import Block
 from src.lbaf.Model.lbsObject import Object
 from src.lbaf.Model.lbsWorkModelBase import WorkModelBase
@@ -245,6 +247,122 @@ class TestConfig(unittest.TestCase):
                 max_load=101)[1],
             1)
 
+    def test_lbs_clustering_transfer_strategy_dynamic_programming_subclusters(self):
+        # Create rank with a cluster of objects of integral loads
+        block = Block(b_id=0, h_id=0)
+        objects = {Object(seq_id=i, load=float(i + 1)) for i in range(5)}
+        for o in objects:
+            o.set_shared_block(block)
+        rank = Rank(r_id=0, migratable_objects=objects, logger=self.logger)
+
+        # Best subclusters must bring rank load of 15 closest and above 5.7
+        for max_objects, reach_load in ((8, 6.0), (1, 10.0)):
+            subclusters = {}
+            for method in ("enumeration", "dynamic_programming"):
+                strategy = ClusteringTransferStrategy(
+                    criterion=self.criterion,
+                    parameters={
+                        "deterministic_transfer": True,
+                        "max_objects_per_transfer": max_objects,
+                        "subclustering_method": method},
+                    lgr=self.logger)
+                strategy._initialize_transfer_stage(6.0)
+                subclusters[method] = strategy._ClusteringTransferStrategy__build_rank_subclusters(rank)
+                self.assertEqual(15.0 - sum(o.get_load() for o in subclusters[method][0]), reach_load)
+                for c in subclusters[method]:
+                    self.assertLessEqual(len(c), max_objects)
+                    self.assertGreaterEqual(15.0 - sum(o.get_load() for o in c), 5.7)
+            self.assertLessEqual(len(subclusters["dynamic_programming"]), len(subclusters["enumeration"]))
+
+    def test_lbs_clustering_transfer_strategy_dynamic_programming_unreachable_bins(self):
+        # Create rank with a cluster of few objects leaving most bins unreachable
+        block = Block(b_id=0, h_id=0)
+        objects = {Object(seq_id=i, load=float(i + 1)) for i in range(3)}
+        for o in objects:
+            o.set_shared_block(block)
+        rank = Rank(r_id=0, migratable_objects=objects, logger=self.logger)
+
+        # Default maximum number of transferred objects must not yield empty subclusters
+        strategy = ClusteringTransferStrategy(
+            criterion=self.criterion,
+            parameters={
+                "deterministic_transfer": True,
+                "max_subclusters": 4,
+                "subclustering_method": "dynamic_programming"},
+            lgr=self.logger)
+        strategy._initialize_transfer_stage(1.0)
+        subclusters = strategy._ClusteringTransferStrategy__build_rank_subclusters(rank)
+        self.assertEqual(len(subclusters), 4)
+        for c in subclusters:
+            self.assertTrue(c)
+        self.assertEqual(6.0 - sum(o.get_load() for o in subclusters[0]), 1.0)
+
+    def test_lbs_clustering_transfer_strategy_phase_rank_clusters(self):
+        # Create two ranks with objects spread over several memory blocks
+        blocks = [Block(b_id=b_id, h_id=b_id % 2) for b_id in range(4)]
+        objects = [Object(seq_id=i, load=float(i % 5 + 1)) for i in range(16)]
+        for o in objects:
+            o.set_shared_block(blocks[o.get_id() % 4])
+        ranks = [
+            Rank(r_id=r_id, migratable_objects=set(objects[8 * r_id:8 * r_id + 8]), logger=self.logger)
+            for r_id in range(2)]
+        phase = Phase(lgr=self.logger, p_id=0)
+        phase.set_ranks(ranks)
+        self.criterion.set_phase(phase)
+
+        def assert_rank_clusters():
+            for r in ranks:
+                expected = {}
+                for o in r.get_migratable_objects():
+                    expected.setdefault(o.get_shared_id(), set()).add(o)
+                clusters = phase.get_tracker(RankClustersTracker).get_rank_clusters(r)
+                self.assertEqual({k: set(c) for k, (c, _) in clusters.items()}, expected)
+                for c, load in clusters.values():
+                    self.assertAlmostEqual(load, sum(o.get_load() for o in c))
+
+        # Cluster maps must be maintained across object transfers
+        assert_rank_clusters()
+        phase.transfer_object(ranks[0], objects[0], ranks[1])
+        assert_rank_clusters()
+        phase.transfer_objects(ranks[1], objects[8:12], ranks[0], objects[4:5])
+        assert_rank_clusters()
+
+        # Cluster maps must remain consistent after transfer stage
+        strategy = ClusteringTransferStrategy(
+            criterion=self.criterion, parameters={"deterministic_transfer": True}, lgr=self.logger)
+        strategy.execute(
+            known_peers={r: set(ranks) for r in ranks}, phase=phase, ave_load=25.0, max_load=30.0)
+        assert_rank_clusters()
+        self.assertEqual(
+            strategy._ClusteringTransferStrategy__build_rank_clusters(ranks[0], False, phase).keys(),
+            phase.get_tracker(RankClustersTracker).get_rank_clusters(ranks[0]).keys())
+
+        # Cluster loads must not drift across many swaps of objects with inexact loads
+        blocks = [Block(b_id=b_id, h_id=0) for b_id in range(3)]
+        objects = [Object(seq_id=i, load=0.1 * (i + 1) + (1.0e8 if i % 7 == 0 else 0.0)) for i in range(24)]
+        for o in objects:
+            o.set_shared_block(blocks[o.get_id() % 3])
+        ranks = [
+            Rank(r_id=r_id, migratable_objects=set(objects[12 * r_id:12 * r_id + 12]), logger=self.logger)
+            for r_id in range(2)]
+        phase = Phase(lgr=self.logger, p_id=1)
+        phase.set_ranks(ranks)
+        tracker = phase.get_tracker(RankClustersTracker)
+        tracker.compute_rank_clusters()
+        for i in range(500):
+            src, dst = (ranks[0], ranks[1]) if i % 2 else (ranks[1], ranks[0])
+            phase.transfer_objects(
+                src, sorted(src.get_migratable_objects(), key=Object.get_id)[i % 5:i % 5 + 3], dst,
+                sorted(dst.get_migratable_objects(), key=Object.get_id)[i % 3:i % 3 + 2])
+        for r in ranks:
+            for c, load in tracker.get_rank_clusters(r).values():
+                self.assertEqual(load, math.fsum(o.get_load() for o in c))
+
+        # Incorrect subclustering method must be rejected
+        with self.assertRaises(SystemExit):
+            ClusteringTransferStrategy(
+                criterion=self.criterion, parameters={"subclustering_method": "sampling"}, lgr=self.logger)
+
 
 if __name__ == "__main__":
     unittest.main()
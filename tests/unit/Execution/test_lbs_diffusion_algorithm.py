@@ -0,0 +1,129 @@
+#
+#@HEADER
+###############################################################################
+#
+#                       test_lbs_diffusion_algorithm.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import logging
+import unittest
+
+from src.lbaf.Model.lbsObject import Object
+from src.lbaf.Model.lbsObjectCommunicator import ObjectCommunicator
+from src.lbaf.Model.lbsRank import Rank
+from src.lbaf.Model.lbsPhase import Phase
+from src.lbaf.Model.lbsWorkModelBase import WorkModelBase
+from src.lbaf.Execution.lbsAlgorithmBase import AlgorithmBase
+from src.lbaf.Execution.lbsDiffusionAlgorithm import DiffusionAlgorithm
+
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger()
+        self.work_model = WorkModelBase.factory("AffineCombination", {}, self.logger)
+
+    def build_phase(self, rank_loads: list) -> Phase:
+        """Create phase with migratable objects of given loads on each rank."""
+        ranks = [Rank(r_id=i, logger=self.logger) for i in range(len(rank_loads))]
+        seq_id = 0
+        for r, loads in zip(ranks, rank_loads):
+            for load in loads:
+                r.add_migratable_object(o := Object(seq_id=seq_id, load=load))
+                o.set_rank_id(r.get_id())
+                seq_id += 1
+        phase = Phase(self.logger, 0)
+        phase.set_ranks(ranks)
+        return phase
+
+    def execute(self, phase: Phase, parameters: dict) -> list:
+        """Execute algorithm on phase and return rebalanced rank loads sorted by rank ID."""
+        algorithm = AlgorithmBase.factory("Diffusion", parameters, self.work_model, self.logger)
+        self.assertIsInstance(algorithm, DiffusionAlgorithm)
+        statistics = {}
+        algorithm.execute(0, {0: phase}, statistics)
+        ranks = sorted(algorithm.get_rebalanced_phase().get_ranks(), key=lambda r: r.get_id())
+        for r in ranks:
+            for o in r.get_objects():
+                self.assertEqual(o.get_rank_id(), r.get_id())
+        self.assertEqual(statistics["maximum load"][-1], max(r.get_load() for r in ranks))
+        return [r.get_load() for r in ranks]
+
+    def test_lbs_diffusion_parameters(self):
+        for parameters in ({"topology": "mesh"}, {"topology": "torus"}, {"order": 3}, {"relaxation": 2.0}):
+            with self.assertRaises(SystemExit):
+                DiffusionAlgorithm(self.work_model, parameters, self.logger)
+        with self.assertRaises(SystemExit):
+            self.execute(self.build_phase([[1.0], [], []]), {"topology": "torus", "torus_dimensions": [2, 2]})
+
+    def test_lbs_diffusion_execute_torus(self):
+        # Flows through neighbors of overloaded rank must also reach opposite rank of ring
+        for order in (1, 2):
+            loads = self.execute(
+                self.build_phase([[1.0] * 8, [], [], []]), {"topology": "torus", "torus_dimensions": [4], "order": order})
+            self.assertEqual(loads, [2.0, 2.0, 2.0, 2.0])
+
+    def test_lbs_diffusion_execute_torus_2d(self):
+        loads = self.execute(
+            self.build_phase([[1.0] * 18] + [[] for _ in range(8)]), {"topology": "torus", "torus_dimensions": [3, 3]})
+        self.assertEqual(sum(loads), 18.0)
+        self.assertLessEqual(max(loads), 3.0)
+
+    def test_lbs_diffusion_execute_communication(self):
+        # Only ranks exchanging messages are neighbors
+        phase = self.build_phase([[1.0] * 5, [1.0], [2.0]])
+        objects = sorted(phase.get_objects(), key=lambda o: o.get_id())
+        objects[0].set_communicator(ObjectCommunicator(0, self.logger, s={objects[5]: 1.0}))
+        objects[5].set_communicator(ObjectCommunicator(5, self.logger, r={objects[0]: 1.0}))
+        loads = self.execute(phase, {"order": 1})
+        self.assertEqual(loads, [3.0, 3.0, 2.0])
+
+    def test_lbs_diffusion_execute_outside_peers(self):
+        # Messages with objects on ranks outside phase must not create edges
+        phase = self.build_phase([[1.0] * 5, [1.0], [2.0]])
+        objects = sorted(phase.get_objects(), key=lambda o: o.get_id())
+        outside = Object(seq_id=7, load=1.0)
+        outside.set_rank_id(7)
+        objects[0].set_communicator(ObjectCommunicator(0, self.logger, s={objects[5]: 1.0, outside: 2.0}))
+        objects[5].set_communicator(ObjectCommunicator(5, self.logger, r={objects[0]: 1.0}))
+        outside.set_communicator(ObjectCommunicator(7, self.logger, r={objects[0]: 2.0}))
+        loads = self.execute(phase, {"order": 1})
+        self.assertEqual(loads, [3.0, 3.0, 2.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
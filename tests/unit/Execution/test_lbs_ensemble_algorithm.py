@@ -0,0 +1,112 @@
+#
+#@HEADER
+###############################################################################
+#
+#                        test_lbs_ensemble_algorithm.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import logging
+import unittest
+
+from src.lbaf.Model.lbsRank import Rank
+from src.lbaf.Model.lbsPhase import Phase
+from src.lbaf.Model.lbsObject import Object
+from src.lbaf.Model.lbsWorkModelBase import WorkModelBase
+from src.lbaf.Execution.lbsAlgorithmBase import AlgorithmBase
+from src.lbaf.Execution.lbsEnsembleAlgorithm import EnsembleAlgorithm
+
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger()
+        self.work_model = WorkModelBase.factory("LoadOnly", {}, self.logger)
+        self.parameters = {
+            "n_runs": 4,
+            "algorithm": {
+                "name": "InformAndTransfer",
+                "parameters": {
+                    "n_iterations": 2,
+                    "n_rounds": 2,
+                    "fanout": 1,
+                    "order_strategy": "element_id",
+                    "transfer_strategy": "Recursive",
+                    "criterion": "Tempered",
+                    "max_objects_per_transfer": 8,
+                    "deterministic_transfer": False}}}
+
+    def build_phase(self):
+        # Create phase with all objects on first of 8 ranks
+        ranks = [Rank(r_id=i, logger=self.logger) for i in range(8)]
+        for i in range(17):
+            ranks[0].add_migratable_object(o := Object(seq_id=i, load=1.0 + i % 3))
+            o.set_rank_id(0)
+        phase = Phase(self.logger, 0)
+        phase.set_ranks(ranks)
+        return phase
+
+    def test_lbs_ensemble_algorithm_factory(self):
+        algorithm = AlgorithmBase.factory("Ensemble", self.parameters, self.work_model, self.logger)
+        self.assertIsInstance(algorithm, EnsembleAlgorithm)
+
+    def test_lbs_ensemble_algorithm_invalid_parameters(self):
+        for parameters in ({"n_runs": 0}, {"n_runs": 2, "n_workers": 0}, {"n_runs": 2, "algorithm": {"name": "Ensemble"}}):
+            with self.assertRaises(SystemExit):
+                EnsembleAlgorithm(self.work_model, parameters, self.logger)
+
+    def test_lbs_ensemble_algorithm_execute(self):
+        for n_workers in (1, 2):
+            phase = self.build_phase()
+            ensemble = EnsembleAlgorithm(self.work_model, {**self.parameters, "n_workers": n_workers}, self.logger)
+            statistics = {"average load": 33.0 / 8}
+            ensemble.execute(0, {0: phase}, statistics)
+
+            # Best mapping of all runs must have been applied
+            self.assertEqual(len(ensemble.get_outcomes()), 4)
+            best_work = min(w for _, w in ensemble.get_outcomes())
+            rebalanced_ranks = ensemble.get_rebalanced_phase().get_ranks()
+            self.assertEqual(max(r.get_load() for r in rebalanced_ranks), best_work)
+            self.assertEqual(statistics["maximum work"][-1], best_work)
+            self.assertEqual(sum(r.get_load() for r in rebalanced_ranks), 33.0)
+
+            # Iterations of individual runs must not be retained
+            self.assertEqual(phase.get_lb_iterations(), [])
+            self.assertEqual([seed for seed, _ in ensemble.get_outcomes()], [146, 147, 148, 149])
+
+
+if __name__ == "__main__":
+    unittest.main()
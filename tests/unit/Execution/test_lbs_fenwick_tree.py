@@ -0,0 +1,79 @@
+#
+#@HEADER
+###############################################################################
+#
+#                           test_lbs_fenwick_tree.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import random
+import unittest
+
+from src.lbaf.Execution.lbsFenwickTree import FenwickTree
+
+
+class TestConfig(unittest.TestCase):
+    def test_fenwick_tree_select(self):
+        tree = FenwickTree(5)
+        self.assertEqual(len(tree), 5)
+        self.assertEqual([tree.select(k) for k in range(5)], [0, 1, 2, 3, 4])
+        tree.remove(1)
+        tree.remove(3)
+        self.assertNotIn(3, tree)
+        self.assertEqual([tree.select(k) for k in range(len(tree))], [0, 2, 4])
+        tree.add(3)
+        self.assertIn(3, tree)
+        self.assertEqual([tree.select(k) for k in range(len(tree))], [0, 2, 3, 4])
+        self.assertEqual(len(FenwickTree(0)), 0)
+
+    def test_fenwick_tree_matches_list_removal(self):
+        random.seed(3)
+        for n in (1, 2, 7, 64, 100):
+            tree, remaining = FenwickTree(n), list(range(n))
+            while remaining:
+                k = random.randrange(len(remaining))
+                self.assertEqual(tree.select(k), remaining[k])
+                tree.remove(remaining.pop(k))
+                if remaining and random.random() < 0.2:
+                    i = random.choice([i for i in range(n) if i not in tree])
+                    tree.add(i)
+                    remaining = sorted(remaining + [i])
+                self.assertEqual(len(tree), len(remaining))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+#
+#@HEADER
+###############################################################################
+#
+#                         test_lbs_greedy_algorithm.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import logging
+import unittest
+
+from src.lbaf.Model.lbsObject import Object
+from src.lbaf.Model.lbsRank import Rank
+from src.lbaf.Model.lbsPhase import Phase
+from src.lbaf.Model.lbsWorkModelBase import WorkModelBase
+from src.lbaf.Execution.lbsAlgorithmBase import AlgorithmBase
+from src.lbaf.Execution.lbsGreedyAlgorithm import GreedyAlgorithm
+
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger()
+        self.work_model = WorkModelBase.factory("AffineCombination", {}, self.logger)
+
+    def build_phase(self, rank_loads: list, sentinel_loads: dict = None) -> Phase:
+        """Create phase with migratable objects of given loads on each rank."""
+        ranks = [Rank(r_id=i, logger=self.logger) for i in range(len(rank_loads))]
+        seq_id = 0
+        for r, loads in zip(ranks, rank_loads):
+            for load in loads:
+                r.add_migratable_object(o := Object(seq_id=seq_id, load=load))
+                o.set_rank_id(r.get_id())
+                seq_id += 1
+        for r_id, load in (sentinel_loads or {}).items():
+            ranks[r_id].add_sentinel_object(o := Object(seq_id=seq_id, load=load))
+            o.set_rank_id(r_id)
+            seq_id += 1
+        phase = Phase(self.logger, 0)
+        phase.set_ranks(ranks)
+        return phase
+
+    def test_lbs_greedy_factory(self):
+        greedy = AlgorithmBase.factory("Greedy", {"bounded_migration": True}, self.work_model, self.logger)
+        self.assertIsInstance(greedy, GreedyAlgorithm)
+        with self.assertRaises(SystemExit):
+            GreedyAlgorithm(self.work_model, {"bounded_migration": 1}, self.logger)
+
+    def test_lbs_greedy_execute(self):
+        # Assign objects onto ranks with sentinel load as offset
+        phase = self.build_phase([[5.0, 4.0, 3.0, 3.0, 2.0, 1.0], [], []], {2: 2.0})
+        greedy = GreedyAlgorithm(self.work_model, {}, self.logger)
+        statistics = {}
+        greedy.execute(0, {0: phase}, statistics)
+        rebalanced_ranks = sorted(greedy.get_rebalanced_phase().get_ranks(), key=lambda r: r.get_id())
+        self.assertEqual([r.get_load() for r in rebalanced_ranks], [7.0, 7.0, 6.0])
+        self.assertEqual(statistics["maximum load"][-1], 7.0)
+        for r in rebalanced_ranks:
+            self.assertEqual(len(r.get_sentinel_objects()), 1 if r.get_id() == 2 else 0)
+            for o in r.get_objects():
+                self.assertEqual(o.get_rank_id(), r.get_id())
+
+    def test_lbs_greedy_execute_heterogeneous_alphas(self):
+        # Slower rank must receive proportionally less load
+        phase = self.build_phase([[1.0] * 6, []])
+        phase.get_ranks()[1].set_alpha(2.0)
+        greedy = GreedyAlgorithm(self.work_model, {}, self.logger)
+        greedy.execute(0, {0: phase}, {})
+        self.assertEqual(
+            {r.get_id(): r.get_load() for r in greedy.get_rebalanced_phase().get_ranks()}, {0: 4.0, 1: 2.0})
+
+    def test_lbs_greedy_execute_bounded_migration(self):
+        # Only objects in excess on overloaded rank may move
+        phase = self.build_phase([[4.0, 3.0, 2.0, 1.0], [1.0, 1.0], []])
+        greedy = GreedyAlgorithm(self.work_model, {"bounded_migration": True}, self.logger)
+        greedy.execute(0, {0: phase}, {})
+        rebalanced_ranks = sorted(greedy.get_rebalanced_phase().get_ranks(), key=lambda r: r.get_id())
+        self.assertEqual([r.get_load() for r in rebalanced_ranks], [4.0, 4.0, 4.0])
+        self.assertEqual(sorted(o.get_id() for o in rebalanced_ranks[0].get_objects()), [1, 3])
+        self.assertEqual(sorted(o.get_id() for o in rebalanced_ranks[1].get_objects()), [2, 4, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
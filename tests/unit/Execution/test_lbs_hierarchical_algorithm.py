@@ -0,0 +1,167 @@
+#
+#@HEADER
+###############################################################################
+#
+#                      test_lbs_hierarchical_algorithm.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import logging
+import unittest
+from unittest.mock import patch
+
+from src.lbaf.Model.lbsNode import Node
+from src.lbaf.Model.lbsNodeVolumesTracker import NodeVolumesTracker
+from src.lbaf.Model.lbsObject import Object
+from src.lbaf.Model.lbsObjectCommunicator import ObjectCommunicator
+from src.lbaf.Model.lbsRank import Rank
+from src.lbaf.Model.lbsPhase import Phase
+from src.lbaf.Model.lbsWorkModelBase import WorkModelBase
+from src.lbaf.Execution.lbsAlgorithmBase import AlgorithmBase
+from src.lbaf.Execution.lbsHierarchicalAlgorithm import HierarchicalAlgorithm, _execute_inner_algorithm
+
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger()
+        self.work_model = WorkModelBase.factory("AffineCombination", {}, self.logger)
+
+    def build_phase(self, n_nodes: int, ranks_per_node: int, loads: list) -> Phase:
+        """Create phase with objects of given loads on first rank of first node."""
+        ranks = set()
+        for n_id in range(n_nodes):
+            node = Node(self.logger, n_id)
+            for i in range(ranks_per_node):
+                r = Rank(self.logger, n_id * ranks_per_node + i)
+                r.set_node(node)
+                node.add_rank(r)
+                ranks.add(r)
+        r_0 = min(ranks, key=lambda r: r.get_id())
+        for i, load in enumerate(loads):
+            r_0.add_migratable_object(o := Object(seq_id=i, load=load))
+            o.set_rank_id(0)
+        phase = Phase(self.logger, 0)
+        phase.set_ranks(ranks)
+        return phase
+
+    def test_lbs_hierarchical_parameters(self):
+        with self.assertRaises(SystemExit):
+            HierarchicalAlgorithm(self.work_model, {"node_algorithm": {"name": "Hierarchical"}}, self.logger)
+        with self.assertRaises(SystemExit):
+            HierarchicalAlgorithm(self.work_model, {"n_workers": 0}, self.logger)
+        phase = Phase(self.logger, 0)
+        phase.set_ranks({Rank(self.logger, 0)})
+        with self.assertRaises(SystemExit):
+            HierarchicalAlgorithm(self.work_model, {}, self.logger).execute(0, {0: phase}, {})
+
+    def test_lbs_hierarchical_execute(self):
+        for n_workers in (1, 2):
+            algorithm = AlgorithmBase.factory(
+                "Hierarchical",
+                {"node_algorithm": {"name": "LargestDifferencing"}, "n_workers": n_workers},
+                self.work_model, self.logger)
+            statistics = {}
+            algorithm.execute(0, {0: self.build_phase(2, 3, [1.0] * 12)}, statistics)
+            ranks = sorted(algorithm.get_rebalanced_phase().get_ranks(), key=lambda r: r.get_id())
+            self.assertEqual([r.get_load() for r in ranks], [2.0] * 6)
+            self.assertEqual(statistics["maximum load"][-1], 2.0)
+            for r in ranks:
+                for o in r.get_objects():
+                    self.assertEqual(o.get_rank_id(), r.get_id())
+
+    def test_lbs_hierarchical_execute_node_speeds(self):
+        # Node of slower ranks must receive proportionally less load
+        phase = self.build_phase(2, 2, [1.0] * 12)
+        for r in phase.get_ranks():
+            if r.get_node().get_id() == 1:
+                r.set_alpha(2.0)
+        algorithm = HierarchicalAlgorithm(self.work_model, {}, self.logger)
+        algorithm.execute(0, {0: phase}, {})
+        ranks = sorted(algorithm.get_rebalanced_phase().get_ranks(), key=lambda r: r.get_id())
+        self.assertEqual([r.get_load() for r in ranks], [4.0, 4.0, 2.0, 2.0])
+
+    def test_lbs_hierarchical_execute_topology_aware(self):
+        # Sentinel object on rank 0 communicates with rank 1 on its node and rank 2 on the other node
+        phase = self.build_phase(2, 2, [1.0] * 8)
+        ranks = sorted(phase.get_ranks(), key=lambda r: r.get_id())
+        sentinels = [Object(seq_id=8 + i, load=1.0) for i in range(3)]
+        sentinels[0].set_communicator(ObjectCommunicator(
+            i=8, logger=self.logger, s={sentinels[1]: 1.0, sentinels[2]: 2.0}))
+        sentinels[1].set_communicator(ObjectCommunicator(i=9, logger=self.logger, r={sentinels[0]: 1.0}))
+        sentinels[2].set_communicator(ObjectCommunicator(i=10, logger=self.logger, r={sentinels[0]: 2.0}))
+        for o, r in zip(sentinels, ranks):
+            r.add_sentinel_object(o)
+            o.set_rank_id(r.get_id())
+        phase.set_ranks(set(ranks))
+
+        # Intra-node phases must tally volumes against ranks outside of them
+        volumes = {}
+        def record_volumes(name, parameters, work_model, logger, sub_ranks, p_id):
+            sub_phase = Phase(logger, p_id)
+            sub_phase.set_ranks(sub_ranks)
+            if record_volumes.n_calls:
+                tracker = sub_phase.get_tracker(NodeVolumesTracker)
+                volumes.update({
+                    r.get_id(): (tracker.get_intra_node_volumes(r), tracker.get_inter_node_volumes(r))
+                    for r in sub_ranks})
+            record_volumes.n_calls += 1
+            return _execute_inner_algorithm(name, parameters, work_model, logger, sub_ranks, p_id)
+        record_volumes.n_calls = 0
+        work_model = WorkModelBase.factory(
+            "TopologyAware", {"beta_intra": 1.0, "beta_inter": 10.0}, self.logger)
+        algorithm = HierarchicalAlgorithm(work_model, {}, self.logger)
+        statistics = {}
+        with patch(
+                "src.lbaf.Execution.lbsHierarchicalAlgorithm._execute_inner_algorithm",
+                side_effect=record_volumes):
+            algorithm.execute(0, {0: phase}, statistics)
+        self.assertEqual(volumes, {
+            0: ((1.0, 0.0), (2.0, 0.0)),
+            1: ((0.0, 1.0), (0.0, 0.0)),
+            2: ((0.0, 0.0), (0.0, 2.0)),
+            3: ((0.0, 0.0), (0.0, 0.0))})
+
+        # Final work must account for both intra-node and inter-node communications
+        rebalanced_ranks = algorithm.get_rebalanced_phase().get_ranks()
+        self.assertEqual(sorted(r.get_load() for r in rebalanced_ranks), [2.0, 3.0, 3.0, 3.0])
+        self.assertEqual(statistics["maximum work"][-1], max(
+            WorkModelBase.factory("TopologyAware", {"beta_intra": 1.0, "beta_inter": 10.0}, self.logger).compute(r)
+            for r in rebalanced_ranks))
+
+
+if __name__ == "__main__":
+    unittest.main()
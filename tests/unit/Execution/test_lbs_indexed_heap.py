@@ -0,0 +1,86 @@
+#
+#@HEADER
+###############################################################################
+#
+#                           test_lbs_indexed_heap.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import random
+import unittest
+
+from src.lbaf.Execution.lbsIndexedHeap import IndexedHeap
+
+
+class TestConfig(unittest.TestCase):
+    def test_indexed_heap_order(self):
+        heap = IndexedHeap((i, (k, i)) for i, k in enumerate([5.0, 1.0, 3.0, 1.0]))
+        self.assertEqual(len(heap), 4)
+        self.assertEqual(heap.peek(), (1, (1.0, 1)))
+        self.assertEqual([heap.pop()[0] for _ in range(4)], [1, 3, 2, 0])
+        self.assertEqual(len(heap), 0)
+
+    def test_indexed_heap_update_and_remove(self):
+        heap = IndexedHeap([("a", 3), ("b", 2), ("c", 1)])
+        heap.update("a", 0)
+        self.assertEqual(heap.peek(), ("a", 0))
+        heap.push("c", -1)
+        self.assertEqual(heap.get_key("c"), -1)
+        heap.remove("c")
+        self.assertNotIn("c", heap)
+        heap.push("d", 1)
+        self.assertEqual(sorted(heap), ["a", "b", "d"])
+        self.assertEqual([heap.pop()[0] for _ in range(3)], ["a", "d", "b"])
+
+    def test_indexed_heap_random_operations(self):
+        random.seed(7)
+        heap, keys = IndexedHeap(), {}
+        for _ in range(2000):
+            item = random.randrange(50)
+            if item in keys and random.random() < 0.3:
+                heap.remove(item)
+                del keys[item]
+            else:
+                keys[item] = random.random()
+                heap.push(item, keys[item])
+            if keys:
+                self.assertEqual(heap.peek()[1], min(keys.values()))
+        self.assertEqual([heap.pop()[1] for _ in range(len(keys))], sorted(keys.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -48,6 +48,7 @@ from unittest.mock import patch
 from src.lbaf.Model.lbsMessage import Message
 from src.lbaf.Model.lbsObject import Object
 from src.lbaf.Model.lbsRank import Rank
+from src.lbaf.Model.lbsPhase import Phase
 from src.lbaf.Execution.lbsInformAndTransferAlgorithm import InformAndTransferAlgorithm
 from src.lbaf.Model.lbsWorkModelBase import WorkModelBase
 
@@ -111,5 +112,165 @@ class TestConfig(unittest.TestCase):
         known_peers = self.inform_and_transfer.get_known_peers()
         self.assertEqual(known_peers, {self.rank: {self.rank, temp_rank_1}})
 
+    def test_lbs_inform_and_transfer_load_aware_information_stage(self):
+        # Create phase with all objects on first of 4 ranks
+        ranks = [Rank(r_id=i, logger=self.logger) for i in range(4)]
+        for i in range(8):
+            ranks[0].add_migratable_object(o := Object(seq_id=i, load=1.0))
+            o.set_rank_id(0)
+        phase = Phase(self.logger, 0)
+        phase.set_ranks(ranks)
+
+        # Known loads must be those of known peers at start of last iteration in both stages
+        for information_stage in ("sets", "bitset"):
+            random.seed(146)
+            inform_and_transfer = InformAndTransferAlgorithm(
+                work_model=self.work_model,
+                parameters={
+                    "n_iterations": 1,
+                    "n_rounds": 1,
+                    "fanout": 1,
+                    "information_stage": information_stage,
+                    "load_aware_information": True,
+                    "order_strategy": "element_id",
+                    "transfer_strategy": "Recursive",
+                    "criterion": "Tempered",
+                    "max_objects_per_transfer": 8,
+                    "deterministic_transfer": True
+                },
+                lgr=self.logger)
+            inform_and_transfer.execute(0, {0: phase}, {"average load": 2.0})
+            known_loads = inform_and_transfer.get_known_loads()
+            self.assertLess(min(len(known_loads[r]) for r in known_loads), 4)
+            for r in inform_and_transfer.get_rebalanced_phase().get_ranks():
+                self.assertEqual(set(known_loads[r]), inform_and_transfer.get_known_peers()[r])
+                for p in inform_and_transfer.get_known_peers()[r]:
+                    self.assertEqual(known_loads[r][p], 8.0 if p.get_id() == 0 else 0.0)
+
+    def test_lbs_inform_and_transfer_adaptive_information_stage(self):
+        # Create phase with 10 ranks
+        ranks = [Rank(r_id=i, logger=self.logger) for i in range(10)]
+        for i in range(20):
+            ranks[i % 3].add_migratable_object(o := Object(seq_id=i, load=1.0))
+            o.set_rank_id(i % 3)
+        phase = Phase(self.logger, 0)
+        phase.set_ranks(ranks)
+
+        # Rounds must stop once all peers are known in both stages
+        for information_stage in ("sets", "bitset"):
+            random.seed(146)
+            inform_and_transfer = InformAndTransferAlgorithm(
+                work_model=self.work_model,
+                parameters={
+                    "n_iterations": 1,
+                    "n_rounds": 50,
+                    "fanout": 2,
+                    "target_kappa": 1.0,
+                    "fanout_factor": 1.5,
+                    "information_stage": information_stage,
+                    "order_strategy": "element_id",
+                    "transfer_strategy": "Recursive",
+                    "criterion": "Tempered",
+                    "max_objects_per_transfer": 8,
+                    "deterministic_transfer": True
+                },
+                lgr=self.logger)
+            self.assertEqual(
+                [inform_and_transfer._InformAndTransferAlgorithm__get_round_fanout(i) for i in range(4)],
+                [2, 3, 4, 7])
+            with self.assertLogs(self.logger, logging.INFO) as logs:
+                inform_and_transfer.execute(0, {0: phase}, {"average load": 2.0})
+            self.assertTrue(any("saving" in line for line in logs.output))
+            for r in inform_and_transfer.get_rebalanced_phase().get_ranks():
+                self.assertEqual(r.get_kappa(), 1.0)
+
+    def test_lbs_inform_and_transfer_bitset_information_stage(self):
+        # Create phase with all objects on first of 4 ranks
+        ranks = [Rank(r_id=i, logger=self.logger) for i in range(4)]
+        for i in range(8):
+            ranks[0].add_migratable_object(o := Object(seq_id=i, load=1.0))
+            o.set_rank_id(0)
+        phase = Phase(self.logger, 0)
+        phase.set_ranks(ranks)
+
+        # Execute algorithm with bit matrix information stage
+        random.seed(146)
+        inform_and_transfer = InformAndTransferAlgorithm(
+            work_model=self.work_model,
+            parameters={
+                "n_iterations": 4,
+                "n_rounds": 3,
+                "fanout": 2,
+                "information_stage": "bitset",
+                "order_strategy": "element_id",
+                "transfer_strategy": "Recursive",
+                "criterion": "Tempered",
+                "max_objects_per_transfer": 8,
+                "deterministic_transfer": True
+            },
+            lgr=self.logger)
+        statistics = {"average load": 2.0}
+        inform_and_transfer.execute(0, {0: phase}, statistics)
+        rebalanced_ranks = inform_and_transfer.get_rebalanced_phase().get_ranks()
+        self.assertEqual(sum(r.get_load() for r in rebalanced_ranks), 8.0)
+        self.assertLess(statistics["maximum load"][-1], 8.0)
+        for r in rebalanced_ranks:
+            known_peers = inform_and_transfer.get_known_peers()[r]
+            self.assertIn(r, known_peers)
+            self.assertEqual(r.get_kappa(), (len(known_peers) - 1) / 3)
+
+    def test_lbs_inform_and_transfer_early_termination(self):
+        for parameters, message in (
+            ({"stagnation_window": 2}, "stagnated"),
+            ({"time_budget_seconds": 1.0e-9}, "time budget"),
+            ({"time_budget_seconds": 1.0e-9}, "Stopping information stage after 1 rounds"),
+            ({"time_budget_seconds": 1.0e-9}, "Stopping transfer stage early")):
+            # Create phase with all objects on first of 4 ranks, which cannot be perfectly balanced
+            ranks = [Rank(r_id=i, logger=self.logger) for i in range(4)]
+            for i in range(9):
+                ranks[0].add_migratable_object(o := Object(seq_id=i, load=1.0))
+                o.set_rank_id(0)
+            phase = Phase(self.logger, 0)
+            phase.set_ranks(ranks)
+
+            # Iterations must stop early and end with best mapping seen
+            random.seed(146)
+            inform_and_transfer = InformAndTransferAlgorithm(
+                work_model=self.work_model,
+                parameters={
+                    "n_iterations": 50,
+                    "n_rounds": 3,
+                    "fanout": 2,
+                    "order_strategy": "element_id",
+                    "transfer_strategy": "Recursive",
+                    "criterion": "Tempered",
+                    "max_objects_per_transfer": 8,
+                    "deterministic_transfer": True,
+                    **parameters
+                },
+                lgr=self.logger)
+            statistics = {"average load": 2.25}
+            with self.assertLogs(self.logger, logging.INFO) as logs:
+                inform_and_transfer.execute(0, {0: phase}, statistics)
+            self.assertTrue(any(message in line for line in logs.output))
+            self.assertLess(len(phase.get_lb_iterations()), 50)
+            self.assertEqual(statistics["maximum work"][-1], min(statistics["maximum work"]))
+            self.assertEqual(sum(r.get_load() for r in inform_and_transfer.get_rebalanced_phase().get_ranks()), 9.0)
+
+    def test_lbs_inform_and_transfer_restore_best_mapping(self):
+        # Move object away from and back to best rank
+        ranks = [Rank(r_id=i, logger=self.logger) for i in range(2)]
+        ranks[0].add_migratable_object(o := Object(seq_id=0, load=1.0))
+        phase = Phase(self.logger, 0)
+        phase.set_ranks(ranks)
+        self.inform_and_transfer._initialize(0, {0: phase}, {})
+        rebalanced_phase = self.inform_and_transfer.get_rebalanced_phase()
+        r_0, r_1 = sorted(rebalanced_phase.get_ranks(), key=lambda r: r.get_id())
+        mapping = self.inform_and_transfer._InformAndTransferAlgorithm__get_mapping()
+        rebalanced_phase.transfer_object(r_0, o, r_1)
+        self.assertEqual(self.inform_and_transfer._InformAndTransferAlgorithm__restore_mapping(mapping), 1)
+        self.assertEqual(r_0.get_migratable_objects(), {o})
+        self.assertEqual(r_1.get_migratable_objects(), set())
+
 if __name__ == "__main__":
     unittest.main()
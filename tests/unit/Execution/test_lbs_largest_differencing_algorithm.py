@@ -0,0 +1,110 @@
+#
+#@HEADER
+###############################################################################
+#
+#                  test_lbs_largest_differencing_algorithm.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import logging
+import unittest
+
+from src.lbaf.Model.lbsObject import Object
+from src.lbaf.Model.lbsRank import Rank
+from src.lbaf.Model.lbsPhase import Phase
+from src.lbaf.Model.lbsWorkModelBase import WorkModelBase
+from src.lbaf.Execution.lbsAlgorithmBase import AlgorithmBase
+from src.lbaf.Execution.lbsLargestDifferencingAlgorithm import LargestDifferencingAlgorithm
+
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger()
+        self.work_model = WorkModelBase.factory("LoadOnly", {}, self.logger)
+
+    def build_phase(self, rank_loads: list, sentinel_loads: dict = None) -> Phase:
+        """Create phase with migratable objects of given loads on each rank."""
+        ranks = [Rank(r_id=i, logger=self.logger) for i in range(len(rank_loads))]
+        seq_id = 0
+        for r, loads in zip(ranks, rank_loads):
+            for load in loads:
+                r.add_migratable_object(o := Object(seq_id=seq_id, load=load))
+                o.set_rank_id(r.get_id())
+                seq_id += 1
+        for r_id, load in (sentinel_loads or {}).items():
+            ranks[r_id].add_sentinel_object(o := Object(seq_id=seq_id, load=load))
+            o.set_rank_id(r_id)
+            seq_id += 1
+        phase = Phase(self.logger, 0)
+        phase.set_ranks(ranks)
+        return phase
+
+    def execute(self, phase: Phase) -> list:
+        """Execute algorithm on phase and return rebalanced ranks sorted by ID."""
+        algorithm = AlgorithmBase.factory("LargestDifferencing", {}, self.work_model, self.logger)
+        self.assertIsInstance(algorithm, LargestDifferencingAlgorithm)
+        statistics = {}
+        algorithm.execute(0, {0: phase}, statistics)
+        self.assertEqual(
+            statistics["maximum load"][-1], max(r.get_load() for r in algorithm.get_rebalanced_phase().get_ranks()))
+        return sorted(algorithm.get_rebalanced_phase().get_ranks(), key=lambda r: r.get_id())
+
+    def test_lbs_largest_differencing_execute(self):
+        # Largest differencing improves on greedy 17 / 13 split
+        ranks = self.execute(self.build_phase([[8.0, 7.0, 6.0, 5.0, 4.0], []]))
+        self.assertEqual(sorted(r.get_load() for r in ranks), [14.0, 16.0])
+        for r in ranks:
+            for o in r.get_objects():
+                self.assertEqual(o.get_rank_id(), r.get_id())
+
+    def test_lbs_largest_differencing_execute_minimal_transfers(self):
+        # A part with most objects must remain on their rank
+        ranks = self.execute(self.build_phase([[6.0] + [1.0] * 6, [], []]))
+        self.assertEqual(ranks[0].get_load(), 3.0)
+        self.assertEqual(len(ranks[0].get_objects()), 3)
+        self.assertEqual(sorted(r.get_load() for r in ranks), [3.0, 3.0, 6.0])
+
+    def test_lbs_largest_differencing_execute_sentinels(self):
+        # Sentinel loads must be accounted for and sentinel objects remain in place
+        ranks = self.execute(self.build_phase([[5.0, 4.0, 3.0, 3.0, 2.0, 1.0], [], []], {2: 2.0}))
+        self.assertEqual(max(r.get_load() for r in ranks), 7.0)
+        self.assertEqual([len(r.get_sentinel_objects()) for r in ranks], [0, 0, 1])
+        self.assertEqual(sum(r.get_load() for r in ranks), 20.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+#
+#@HEADER
+###############################################################################
+#
+#                          test_lbs_load_predictor.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import logging
+import unittest
+
+import numpy as np
+
+from src.lbaf.Model.lbsRank import Rank
+from src.lbaf.Model.lbsPhase import Phase
+from src.lbaf.Model.lbsObject import Object
+from src.lbaf.Execution.lbsLoadPredictor import LoadPredictor
+from src.lbaf.Execution.lbsRuntime import Runtime
+
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger()
+
+        # Object 0 grows linearly, object 1 is constant, object 2 only appears in last two phases
+        loads = {
+            0: {0: 1.0, 1: 1.0},
+            1: {0: 2.0, 1: 1.0},
+            2: {0: 3.0, 1: 1.0, 2: 4.0},
+            3: {0: 4.0, 1: 1.0, 2: 6.0}}
+        self.phases = {}
+        for p_id, p_loads in loads.items():
+            phase = Phase(self.logger, p_id)
+            phase.set_ranks([Rank(
+                self.logger, 0,
+                migratable_objects={Object(seq_id=o_id, load=l) for o_id, l in p_loads.items()})])
+            self.phases[p_id] = phase
+
+    def __predicted_loads(self, name: str, parameters: dict=None):
+        predictor = LoadPredictor(name, parameters, self.logger)
+        objects, history = predictor.build_history(self.phases, 3)
+        return dict(zip([o.get_id() for o in objects], predictor.predict(history).tolist())), history
+
+    def test_lbs_load_predictor_history(self):
+        _, history = self.__predicted_loads("LastValue")
+        self.assertEqual(history.shape, (3, 4))
+        self.assertEqual(int(np.isnan(history).sum()), 2)
+
+        # Window restricts history to last phases
+        predictor = LoadPredictor("LastValue", {"window": 2}, self.logger)
+        self.assertEqual(predictor.build_history(self.phases, 3)[1].shape, (3, 2))
+
+    def test_lbs_load_predictor_last_value(self):
+        predicted, _ = self.__predicted_loads("LastValue")
+        self.assertEqual(predicted, {0: 4.0, 1: 1.0, 2: 6.0})
+
+    def test_lbs_load_predictor_exponential_smoothing(self):
+        predicted, _ = self.__predicted_loads("ExponentialSmoothing", {"smoothing_factor": 0.5})
+        self.assertEqual(predicted, {0: 3.125, 1: 1.0, 2: 5.0})
+
+    def test_lbs_load_predictor_linear_trend(self):
+        predicted, _ = self.__predicted_loads("LinearTrend")
+        for o_id, l in {0: 5.0, 1: 1.0, 2: 8.0}.items():
+            self.assertAlmostEqual(predicted[o_id], l)
+
+    def test_lbs_load_predictor_apply(self):
+        predictor = LoadPredictor("LinearTrend", {}, self.logger)
+        actual = predictor.apply(self.phases, 3)
+        self.assertEqual(sorted(actual.values()), [1.0, 4.0, 6.0])
+        self.assertAlmostEqual(self.phases[3].get_ranks()[0].get_load(), 14.0)
+
+    def test_lbs_load_predictor_restore_on_failure(self):
+        # Prescribed permutation of wrong length makes balancing fail
+        runtime = Runtime(
+            self.phases, {"name": "LoadOnly"},
+            {"name": "PrescribedPermutation", "parameters": {"permutation": {0: 0}}},
+            self.logger, load_predictor={"name": "LinearTrend"})
+        with self.assertRaises(SystemExit):
+            runtime.execute(3)
+        self.assertEqual(self.phases[3].get_ranks()[0].get_load(), 11.0)
+        with self.assertRaises(SystemExit):
+            runtime.execute_batch([3])
+        self.assertEqual(self.phases[3].get_ranks()[0].get_load(), 11.0)
+
+    def test_lbs_load_predictor_invalid(self):
+        with self.assertRaises(SystemExit):
+            LoadPredictor("Oracle", {}, self.logger)
+        with self.assertRaises(SystemExit):
+            LoadPredictor("ExponentialSmoothing", {"smoothing_factor": 0.0}, self.logger)
+
+
+if __name__ == "__main__":
+    unittest.main()
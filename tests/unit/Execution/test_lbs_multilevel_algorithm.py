@@ -0,0 +1,120 @@
+#
+#@HEADER
+###############################################################################
+#
+#                       test_lbs_multilevel_algorithm.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import logging
+import unittest
+
+from src.lbaf.Model.lbsObject import Object
+from src.lbaf.Model.lbsObjectCommunicator import ObjectCommunicator
+from src.lbaf.Model.lbsRank import Rank
+from src.lbaf.Model.lbsPhase import Phase
+from src.lbaf.Model.lbsWorkModelBase import WorkModelBase
+from src.lbaf.Execution.lbsAlgorithmBase import AlgorithmBase
+from src.lbaf.Execution.lbsMultilevelAlgorithm import MultilevelAlgorithm
+
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger()
+        self.work_model = WorkModelBase.factory("AffineCombination", {"beta": 1.0}, self.logger)
+
+    def build_chain_phase(self, n_objects: int, n_ranks: int, sentinels: tuple = ()) -> Phase:
+        """Create phase with a chain of communicating unit load objects dealt cyclically onto ranks."""
+        objects = [Object(seq_id=i, load=1.0) for i in range(n_objects)]
+        for i, o in enumerate(objects):
+            sent = {objects[i + 1]: 1.0} if i + 1 < n_objects else {}
+            received = {objects[i - 1]: 1.0} if i > 0 else {}
+            o.set_communicator(ObjectCommunicator(i, self.logger, r=received, s=sent))
+        ranks = [Rank(r_id=i, logger=self.logger) for i in range(n_ranks)]
+        for i, o in enumerate(objects):
+            o.set_rank_id(i % n_ranks)
+            if i in sentinels:
+                ranks[i % n_ranks].add_sentinel_object(o)
+            else:
+                ranks[i % n_ranks].add_migratable_object(o)
+        phase = Phase(self.logger, 0)
+        phase.set_ranks(ranks)
+        return phase
+
+    def execute(self, phase: Phase, parameters: dict) -> list:
+        """Execute algorithm on phase and return rebalanced ranks sorted by ID."""
+        algorithm = AlgorithmBase.factory("Multilevel", parameters, self.work_model, self.logger)
+        self.assertIsInstance(algorithm, MultilevelAlgorithm)
+        algorithm.execute(0, {0: phase}, {})
+        return sorted(algorithm.get_rebalanced_phase().get_ranks(), key=lambda r: r.get_id())
+
+    def test_lbs_multilevel_parameters(self):
+        with self.assertRaises(SystemExit):
+            MultilevelAlgorithm(self.work_model, {"load_tolerance": -0.1}, self.logger)
+        with self.assertRaises(SystemExit):
+            MultilevelAlgorithm(self.work_model, {"coarsest_size_per_rank": 0}, self.logger)
+
+    def test_lbs_multilevel_execute(self):
+        # Alternating chain must be cut once into balanced halves
+        ranks = self.execute(self.build_chain_phase(8, 2), {"load_tolerance": 0.0})
+        self.assertEqual([r.get_load() for r in ranks], [4.0, 4.0])
+        for r in ranks:
+            ids = sorted(o.get_id() for o in r.get_objects())
+            self.assertEqual(ids[-1] - ids[0], 3)
+            self.assertEqual(r.get_sent_volume() + r.get_received_volume(), 1.0)
+
+    def test_lbs_multilevel_execute_coarsening(self):
+        # Coarsened chain must be cut into contiguous segments within load tolerance
+        ranks = self.execute(
+            self.build_chain_phase(64, 4), {"load_tolerance": 0.25, "coarsest_size_per_rank": 2})
+        self.assertEqual(sum(r.get_load() for r in ranks), 64.0)
+        self.assertLessEqual(max(r.get_load() for r in ranks), 20.0)
+        self.assertLessEqual(sum(r.get_sent_volume() for r in ranks), 6.0)
+
+    def test_lbs_multilevel_execute_sentinels(self):
+        # Sentinel objects must remain on their ranks
+        ranks = self.execute(self.build_chain_phase(12, 3, sentinels=(1, 5)), {})
+        self.assertEqual({o.get_id() for o in ranks[1].get_sentinel_objects()}, {1})
+        self.assertEqual({o.get_id() for o in ranks[2].get_sentinel_objects()}, {5})
+        self.assertEqual(sum(r.get_load() for r in ranks), 12.0)
+        for r in ranks:
+            for o in r.get_objects():
+                self.assertEqual(o.get_rank_id(), r.get_id())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+#
+#@HEADER
+###############################################################################
+#
+#                    test_lbs_pairwise_transfer_strategy.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import logging
+import random
+import unittest
+
+from src.lbaf.Model.lbsRank import Rank
+from src.lbaf.Model.lbsPhase import Phase
+from src.lbaf.Model.lbsObject import Object
+from src.lbaf.Model.lbsWorkModelBase import WorkModelBase
+from src.lbaf.Execution.lbsCriterionBase import CriterionBase
+from src.lbaf.Execution.lbsTransferStrategyBase import TransferStrategyBase
+from src.lbaf.Execution.lbsPairwiseTransferStrategy import PairwiseTransferStrategy
+
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger()
+
+        # Define work model and criterion
+        self.work_model = WorkModelBase.factory("LoadOnly", {}, self.logger)
+        self.criterion = CriterionBase.factory("Tempered", self.work_model, self.logger)
+
+    def build_phase(self):
+        # Create two overloaded and two empty ranks
+        loads = [[4.0, 3.0, 2.0, 1.0], [2.0, 2.0, 2.0], [], []]
+        o_id, ranks = 0, []
+        for r_id, r_loads in enumerate(loads):
+            objects = set()
+            for l in r_loads:
+                objects.add(Object(seq_id=o_id, load=l))
+                o_id += 1
+            ranks.append(Rank(self.logger, r_id, objects))
+        phase = Phase(self.logger)
+        phase.set_ranks(ranks)
+        self.criterion.set_phase(phase)
+        return phase, {r: set(ranks) - {r} for r in ranks}
+
+    def test_pairwise_transfer_strategy_factory(self):
+        strategy = TransferStrategyBase.factory("Pairwise", {}, self.criterion, logger=self.logger)
+        self.assertIsInstance(strategy, PairwiseTransferStrategy)
+
+    def test_pairwise_transfer_strategy_invalid_parameters(self):
+        for params in ({"n_sub_rounds": 0}, {"n_workers": 0}, {"n_workers": 1.5}):
+            with self.assertRaises(SystemExit):
+                PairwiseTransferStrategy(self.criterion, params, self.logger)
+
+    def test_pairwise_transfer_strategy_execute(self):
+        for n_workers in (1, 2):
+            phase, known_peers = self.build_phase()
+            strategy = PairwiseTransferStrategy(self.criterion, {"n_workers": n_workers}, self.logger)
+            n_ignored, n_transfers, _ = strategy.execute(known_peers, phase, 4.0, 10.0)
+            self.assertEqual(n_ignored, 2)
+            self.assertGreater(n_transfers, 0)
+            self.assertEqual(sum(r.get_load() for r in phase.get_ranks()), 16.0)
+            self.assertLessEqual(max(r.get_load() for r in phase.get_ranks()), 6.0)
+
+    def test_pairwise_transfer_strategy_disjoint_pairs(self):
+        phase, known_peers = self.build_phase()
+        strategy = PairwiseTransferStrategy(self.criterion, {"n_sub_rounds": 1}, self.logger)
+        strategy.execute(known_peers, phase, 4.0, 10.0)
+
+        # Each overloaded rank sent objects to a distinct empty rank
+        ranks = sorted(phase.get_ranks(), key=lambda r: r.get_id())
+        self.assertEqual(ranks[0].get_load(), 5.0)
+        self.assertEqual(ranks[1].get_load(), 4.0)
+        self.assertEqual(sorted(r.get_load() for r in ranks[2:]), [2.0, 5.0])
+
+    def test_pairwise_transfer_strategy_parallel_sub_rounds(self):
+        # Workers replaying earlier sub-rounds must reach the sequential arrangement
+        mappings = []
+        for n_workers in (1, 3):
+            rng = random.Random(7)
+            ranks = [Rank(self.logger, r_id, {
+                Object(seq_id=10 * r_id + i, load=rng.uniform(0.5, 4.0)) for i in range(rng.randint(0, 9))})
+                for r_id in range(12)]
+            phase = Phase(self.logger)
+            phase.set_ranks(ranks)
+            self.criterion.set_phase(phase)
+            strategy = PairwiseTransferStrategy(
+                self.criterion, {"n_workers": n_workers, "n_sub_rounds": 6}, self.logger)
+            strategy.execute({r: set(ranks) - {r} for r in ranks}, phase, 1.0, 10.0)
+            mappings.append({o.get_id(): r.get_id() for r in ranks for o in r.get_objects()})
+        self.assertEqual(mappings[0], mappings[1])
+
+    def test_pairwise_transfer_strategy_shared_transfer_stages(self):
+        # Workers created once must replay transfers of earlier stages
+        mappings = []
+        for n_workers in (1, 3):
+            rng = random.Random(11)
+            ranks = [Rank(self.logger, r_id, {
+                Object(seq_id=10 * r_id + i, load=rng.uniform(0.5, 4.0)) for i in range(rng.randint(0, 9))})
+                for r_id in range(12)]
+            phase = Phase(self.logger)
+            phase.set_ranks(ranks)
+            self.criterion.set_phase(phase)
+            strategy = PairwiseTransferStrategy(
+                self.criterion, {"n_workers": n_workers, "n_sub_rounds": 2}, self.logger)
+            with strategy.transfer_stages(phase):
+                for _ in range(3):
+                    known_peers = {r: set(rng.sample(ranks, 4)) - {r} for r in ranks}
+                    strategy.execute(known_peers, phase, 1.0, 10.0)
+            mappings.append({o.get_id(): r.get_id() for r in ranks for o in r.get_objects()})
+        self.assertEqual(mappings[0], mappings[1])
+
+    def test_pairwise_transfer_strategy_work_model(self):
+        # Transfers must be proposed with respect to work rather than load
+        work_model = WorkModelBase.factory("AffineCombination", {"alpha": 1.0, "beta": 0.0, "gamma": 0.0}, self.logger)
+        criterion = CriterionBase.factory("Tempered", work_model, self.logger)
+        ranks = [
+            Rank(self.logger, 0, {Object(seq_id=i, load=l) for i, l in enumerate((4.0, 2.0, 2.0))}),
+            Rank(self.logger, 1)]
+        ranks[1].set_alpha(2.0)
+        phase = Phase(self.logger)
+        phase.set_ranks(ranks)
+        criterion.set_phase(phase)
+        strategy = PairwiseTransferStrategy(criterion, {"n_sub_rounds": 1}, self.logger)
+        strategy.execute({r: set(ranks) - {r} for r in ranks}, phase, 4.0, 8.0)
+        self.assertEqual(max(work_model.compute(r) for r in ranks), 6.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
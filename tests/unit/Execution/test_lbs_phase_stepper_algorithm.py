@@ -0,0 +1,111 @@
+#
+#@HEADER
+###############################################################################
+#
+#                     test_lbs_phase_stepper_algorithm.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import logging
+import unittest
+
+from src.lbaf.Model.lbsRank import Rank
+from src.lbaf.Model.lbsPhase import Phase
+from src.lbaf.Model.lbsObject import Object
+from src.lbaf.Model.lbsWorkModelBase import WorkModelBase
+from src.lbaf.Execution.lbsAlgorithmBase import AlgorithmBase
+
+
+class SyntheticReader:
+    """Minimal reader populating phases with loads depending on phase index."""
+
+    def populate_phase(self, p_id: int):
+        ranks = []
+        for r_id in range(4):
+            ranks.append(rank := Rank(logging.getLogger(), r_id))
+            for i in range(3):
+                rank.add_migratable_object(o := Object(
+                    seq_id=3 * r_id + i, r_id=r_id, load=float(p_id + 1) * (r_id + i + 1)))
+                o.set_rank_id(r_id)
+        return ranks, {}
+
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger()
+        self.work_model = WorkModelBase.factory("AffineCombination", {}, self.logger)
+        self.reader = SyntheticReader()
+
+    def __phases(self, populated: bool):
+        phases = {}
+        for p_id in range(6):
+            phases[p_id] = Phase(self.logger, p_id, reader=self.reader)
+            if populated or not p_id:
+                phases[p_id].populate_from_log(p_id)
+        return phases
+
+    def __step(self, phases: dict, n_workers: int):
+        statistics = {}
+        algorithm = AlgorithmBase.factory(
+            "PhaseStepper", {"n_workers": n_workers}, self.work_model, self.logger)
+        algorithm.execute(0, phases, statistics)
+        self.assertIsNone(algorithm.get_rebalanced_phase())
+        return statistics
+
+    def test_lbs_phase_stepper_statistics(self):
+        # Statistics of each phase must be appended in phase order
+        statistics = self.__step(self.__phases(True), 1)
+        self.assertEqual(statistics["maximum load"], [(p_id + 1) * 15.0 for p_id in range(6)])
+        self.assertEqual(statistics["total work"], [(p_id + 1) * 42.0 for p_id in range(6)])
+
+        # Parallel and deferred population must produce identical statistics
+        for populated in (True, False):
+            phases = self.__phases(populated)
+            self.assertEqual(self.__step(phases, 3), statistics)
+            self.assertEqual(self.__step(phases, 1), statistics)
+
+            # Deferred phases must not be retained populated
+            self.assertEqual(
+                [p.get_number_of_ranks() for p in phases.values()], [4] + [4 if populated else 0] * 5)
+
+        # Incorrect number of workers must be rejected
+        with self.assertRaises(SystemExit):
+            AlgorithmBase.factory("PhaseStepper", {"n_workers": 0}, self.work_model, self.logger)
+
+
+if __name__ == "__main__":
+    unittest.main()
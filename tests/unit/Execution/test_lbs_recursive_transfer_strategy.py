@@ -42,6 +42,7 @@
 #
 import os
 import sys
+import random
 import logging
 import unittest
 
@@ -138,5 +139,75 @@ class TestConfig(unittest.TestCase):
             self.assertEqual(f"{order_strategy}: {getattr(recursive_strat, order_strategy)(objects, 0)}",
                              f"{order_strategy}: {expected_order_dict[order_strategy]}")
 
+    def test_recursive_transfer_strategy_extended_search(self):
+        # Criterion only accepting transfers of many objects at once
+        class CountingCriterion(CriterionBase):
+            def compute(self, r_src, o_src, r_dst, o_dst=None):
+                return len(o_src) - 1500.0
+
+        # Create rank with more objects than the default recursion limit
+        objects = {Object(seq_id=i, load=1.0) for i in range(3000)}
+        rank_0 = Rank(r_id=0, migratable_objects=objects, logger=self.logger)
+        rank_1 = Rank(r_id=1, logger=self.logger)
+        phase = Phase(self.logger)
+        phase.set_ranks([rank_0, rank_1])
+        criterion = CountingCriterion(self.work_model, self.logger)
+        criterion.set_phase(phase)
+        strategy = RecursiveTransferStrategy(
+            criterion=criterion,
+            parameters={"order_strategy": "element_id", "deterministic_transfer": True},
+            logger=self.logger)
+
+        # Extended search must accumulate objects until criterion is satisfied
+        _, n_transfers, n_rejects = strategy.execute({rank_0: {rank_1}}, phase, 1500.0, None)
+        self.assertEqual(n_transfers, 3000)
+        self.assertEqual(n_rejects, 0)
+        self.assertEqual(rank_1.get_load(), 3000.0)
+
+    def test_recursive_transfer_strategy_extended_search_seeded_order(self):
+        # Criterion only accepting transfers of several objects at once
+        class CountingCriterion(CriterionBase):
+            def compute(self, r_src, o_src, r_dst, o_dst=None):
+                return len(o_src) - 7.0
+
+        # Create ranks and strategy offloading objects by ID order
+        objects = [Object(seq_id=i, load=1.0) for i in range(50)]
+        rank_0 = Rank(r_id=0, migratable_objects=set(objects), logger=self.logger)
+        rank_1 = Rank(r_id=1, logger=self.logger)
+        phase = Phase(self.logger)
+        phase.set_ranks([rank_0, rank_1])
+        criterion = CountingCriterion(self.work_model, self.logger)
+        criterion.set_phase(phase)
+        strategy = RecursiveTransferStrategy(
+            criterion=criterion,
+            parameters={"order_strategy": "element_id", "deterministic_transfer": True},
+            logger=self.logger)
+        random.seed(42)
+        _, n_transfers, n_rejects = strategy.execute({rank_0: {rank_1}}, phase, 25.0, None)
+
+        # Previous list-based selection must pick the same objects under the same seed
+        random.seed(42)
+        srt_rank_obj, transferred, n_old_rejects = objects[:], [], 0
+        while srt_rank_obj:
+            o_src = [srt_rank_obj.pop()]
+            if not srt_rank_obj:
+                n_old_rejects += 1
+                continue
+            pick_list = srt_rank_obj[:]
+            while pick_list and len(o_src) - 7.0 < 0.0:
+                o = random.choice(pick_list)
+                pick_list.remove(o)
+                o_src.append(o)
+            if len(o_src) - 7.0 < 0.0:
+                n_old_rejects += 1
+                continue
+            srt_rank_obj = pick_list
+            transferred += o_src
+        self.assertEqual(n_transfers, len(transferred))
+        self.assertEqual(n_rejects, n_old_rejects)
+        self.assertEqual(
+            sorted(o.get_id() for o in rank_1.get_migratable_objects()),
+            sorted(o.get_id() for o in transferred))
+
 if __name__ == "__main__":
     unittest.main()
@@ -50,6 +50,8 @@ from src.lbaf.Execution.lbsRuntime import Runtime
 from src.lbaf import PROJECT_PATH
 from src.lbaf.IO.lbsVTDataReader import LoadReader
 from src.lbaf.Model.lbsPhase import Phase
+from src.lbaf.Model.lbsRank import Rank
+from src.lbaf.Model.lbsObject import Object
 from src.lbaf.Model.lbsAffineCombinationWorkModel import AffineCombinationWorkModel
 from src.lbaf.IO.lbsStatistics import compute_min_max_arrangements_work
 
@@ -117,5 +119,50 @@ class TestConfig(unittest.TestCase):
         # Add assertions to check if the execute method behaves as expected
         assert rebalanced_phase is not None
 
+
+class TestBatchConfig(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = logging.getLogger()
+
+        # Create phases with all objects initially on rank 0
+        self.phases = {}
+        for p_id in range(3):
+            ranks = [Rank(self.logger, r_id) for r_id in range(4)]
+            for i in range(8):
+                ranks[0].add_migratable_object(o := Object(seq_id=i, load=float(p_id + i + 1)))
+                o.set_rank_id(0)
+            self.phases[p_id] = Phase(self.logger, p_id)
+            self.phases[p_id].set_ranks(ranks)
+
+    def __execute_batch(self, p_ids, phase_increment: int, n_workers: int):
+        runtime = Runtime(self.phases, {"name": "AffineCombination"}, {"name": "Greedy"}, self.logger)
+        rebalanced_phases = runtime.execute_batch(p_ids, phase_increment, n_workers)
+        return {
+            p_id: sorted((r.get_id(), sorted(o.get_id() for o in r.get_objects())) for r in lbp.get_ranks())
+            for p_id, lbp in rebalanced_phases.items()}
+
+    def test_lbs_runtime_execute_batch(self):
+        # All phases must be rebalanced independently
+        mappings = self.__execute_batch(None, 0, 1)
+        self.assertEqual(sorted(mappings), [0, 1, 2])
+        for p_id, mapping in mappings.items():
+            self.assertEqual(sorted(o_id for _, o_ids in mapping for o_id in o_ids), list(range(8)))
+            self.assertTrue(all(o_ids for _, o_ids in mapping))
+
+            # Initial phases must be left unchanged
+            self.assertEqual(self.phases[p_id].get_ranks()[0].get_number_of_migratable_objects(), 8)
+
+        # Parallel execution on a subset of phases must produce identical mappings
+        self.assertEqual(self.__execute_batch([2, 0], 1, 2), {3: mappings[2], 1: mappings[0]})
+
+        # Unavailable phases must be rejected
+        with self.assertRaises(SystemExit):
+            self.__execute_batch([0, 5], 0, 1)
+
+        # Rebalanced phases replacing other phases to be rebalanced must be rejected
+        with self.assertRaises(SystemExit):
+            self.__execute_batch([0, 1], 1, 1)
+
 if __name__ == "__main__":
     unittest.main()
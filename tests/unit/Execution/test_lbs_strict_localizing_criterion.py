@@ -0,0 +1,129 @@
+#
+#@HEADER
+###############################################################################
+#
+#                   test_lbs_strict_localizing_criterion.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import logging
+import unittest
+
+from src.lbaf.Model.lbsRank import Rank
+from src.lbaf.Model.lbsPhase import Phase
+from src.lbaf.Model.lbsLocalPartnersTracker import LocalPartnersTracker
+from src.lbaf.Model.lbsObject import Object
+from src.lbaf.Model.lbsObjectCommunicator import ObjectCommunicator
+from src.lbaf.Model.lbsWorkModelBase import WorkModelBase
+from src.lbaf.Execution.lbsCriterionBase import CriterionBase
+
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger()
+
+        # Create objects communicating along a chain 0 -> 1 -> 2
+        self.objects = [Object(seq_id=i, load=1.0) for i in range(4)]
+        o_0, o_1, o_2, o_3 = self.objects
+        o_0.set_communicator(ObjectCommunicator(i=0, logger=self.logger, s={o_1: 2.0}))
+        o_1.set_communicator(ObjectCommunicator(i=1, logger=self.logger, r={o_0: 2.0}, s={o_2: 1.0}))
+        o_2.set_communicator(ObjectCommunicator(i=2, logger=self.logger, r={o_1: 1.0}))
+
+        # Assign objects 0 and 1 to rank 0, and objects 2 and 3 to rank 1
+        self.rank_0 = Rank(self.logger, 0)
+        self.rank_1 = Rank(self.logger, 1)
+        for o, r in zip(self.objects, (self.rank_0, self.rank_0, self.rank_1, self.rank_1)):
+            r.add_migratable_object(o)
+            o.set_rank_id(r.get_id())
+        self.phase = Phase(self.logger)
+        self.phase.set_ranks([self.rank_0, self.rank_1])
+        self.partners = self.phase.get_tracker(LocalPartnersTracker)
+
+        # Instantiate criterion
+        self.criterion = CriterionBase.factory(
+            "StrictLocalizing",
+            WorkModelBase.factory("LoadOnly", {}, self.logger),
+            self.logger)
+        self.criterion.set_phase(self.phase)
+
+    def test_lbs_strict_localizing_criterion_compute(self):
+        o_0, o_1, o_2, o_3 = self.objects
+        self.assertEqual(self.criterion.compute(self.rank_0, [o_0], self.rank_1), -1.)
+        self.assertEqual(self.criterion.compute(self.rank_0, [o_1], self.rank_1), -1.)
+        self.assertEqual(self.criterion.compute(self.rank_1, [o_2], self.rank_0), 1.)
+        self.assertEqual(self.criterion.compute(self.rank_1, [o_3], self.rank_0), 1.)
+        self.assertEqual(self.criterion.compute(self.rank_1, [o_2, o_3], self.rank_0), 1.)
+
+    def test_lbs_strict_localizing_criterion_after_transfers(self):
+        o_0, o_1, o_2, _ = self.objects
+        self.assertEqual(self.partners.get_number_of_local_partners(o_1), 1)
+
+        # Moving object 2 next to object 1 makes both localized
+        self.phase.transfer_object(self.rank_1, o_2, self.rank_0)
+        self.assertEqual(self.partners.get_number_of_local_partners(o_1), 2)
+        self.assertEqual(self.partners.get_number_of_local_partners(o_2), 1)
+        self.assertEqual(self.criterion.compute(self.rank_0, [o_2], self.rank_1), -1.)
+
+        # Moving object 0 away breaks its only local communication
+        self.phase.transfer_object(self.rank_0, o_0, self.rank_1)
+        self.assertEqual(self.partners.get_number_of_local_partners(o_0), 0)
+        self.assertEqual(self.partners.get_number_of_local_partners(o_1), 1)
+        self.assertEqual(self.criterion.compute(self.rank_1, [o_0], self.rank_0), 1.)
+
+        # Incrementally maintained counts must match a full re-computation
+        counts = {o: self.partners.get_number_of_local_partners(o) for o in self.objects}
+        self.partners.compute_local_partners()
+        self.assertEqual(
+            counts, {o: self.partners.get_number_of_local_partners(o) for o in self.objects})
+
+    def test_lbs_strict_localizing_criterion_self_communication(self):
+        # Object 3 communicating with itself is localized wherever it goes
+        o_3 = self.objects[3]
+        o_3.set_communicator(ObjectCommunicator(i=3, logger=self.logger, r={o_3: 1.0}, s={o_3: 1.0}))
+        self.assertEqual(self.partners.get_number_of_local_partners(o_3), 2)
+        self.phase.transfer_object(self.rank_1, o_3, self.rank_0)
+        self.assertEqual(self.partners.get_number_of_local_partners(o_3), 2)
+
+        # Incrementally maintained counts must match a full re-computation
+        counts = {o: self.partners.get_number_of_local_partners(o) for o in self.objects}
+        self.partners.compute_local_partners()
+        self.assertEqual(
+            counts, {o: self.partners.get_number_of_local_partners(o) for o in self.objects})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+#
+#@HEADER
+###############################################################################
+#
+#                        test_lbs_tempered_criterion.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import logging
+import unittest
+
+from src.lbaf.Model.lbsRank import Rank
+from src.lbaf.Model.lbsPhase import Phase
+from src.lbaf.Model.lbsObject import Object
+from src.lbaf.Model.lbsWorkModelBase import WorkModelBase
+from src.lbaf.Execution.lbsCriterionBase import CriterionBase
+
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger()
+
+        # Create an overloaded rank 0 and an empty rank 1
+        self.objects = [Object(seq_id=i, load=1.0, size=1.0e6) for i in range(4)]
+        self.rank_0 = Rank(self.logger, 0)
+        self.rank_1 = Rank(self.logger, 1)
+        for o in self.objects:
+            self.rank_0.add_migratable_object(o)
+            o.set_rank_id(0)
+        self.phase = Phase(self.logger)
+        self.phase.set_ranks([self.rank_0, self.rank_1])
+
+    def __criterion(self, parameters: dict):
+        criterion = CriterionBase.factory(
+            "Tempered",
+            WorkModelBase.factory("AffineCombination", parameters, self.logger),
+            self.logger)
+        criterion.set_phase(self.phase)
+        return criterion
+
+    def test_lbs_tempered_criterion_compute(self):
+        criterion = self.__criterion({"beta": 0.0, "gamma": 0.0})
+        self.assertEqual(criterion.compute(self.rank_0, self.objects[:1], self.rank_1), 1.0)
+        self.assertEqual(criterion.compute(self.rank_0, self.objects[:2], self.rank_1), 2.0)
+        self.assertEqual(criterion.compute(self.rank_0, self.objects[:3], self.rank_1), 1.0)
+
+        # Evaluating the criterion must leave the arrangement unchanged
+        self.assertEqual(self.rank_0.get_load(), 4.0)
+        self.assertEqual(self.rank_1.get_load(), 0.0)
+
+    def test_lbs_tempered_criterion_migration_cost(self):
+        criterion = self.__criterion({
+            "beta": 0.0, "gamma": 0.0,
+            "migration_cost_per_byte": 1.0e-6,
+            "migration_amortization_phases": 2})
+        self.assertEqual(criterion.compute(self.rank_0, self.objects[:1], self.rank_1), 0.5)
+        self.assertEqual(criterion.compute(self.rank_0, self.objects[:2], self.rank_1), 1.0)
+
+        # Moves whose data movement outweighs the work reduction are rejected
+        self.assertLess(criterion.compute(self.rank_0, self.objects[:3], self.rank_1), 0.0)
+
+    def test_lbs_tempered_criterion_compute_incremental(self):
+        criterion = self.__criterion({
+            "beta": 0.0, "gamma": 0.0,
+            "migration_cost_per_byte": 1.0e-6,
+            "migration_amortization_phases": 2})
+        expected = [criterion.compute(self.rank_0, self.objects[:n], self.rank_1) for n in (2, 3, 4)]
+
+        # Incremental evaluation must match evaluation from scratch
+        criterion.begin_incremental(self.rank_0, self.objects[:1], self.rank_1)
+        self.assertEqual([criterion.compute_incremental(o) for o in self.objects[1:]], expected)
+        criterion.end_incremental()
+
+        # Ending incremental evaluation must restore the arrangement
+        self.assertEqual(self.rank_0.get_load(), 4.0)
+        self.assertEqual(self.rank_1.get_load(), 0.0)
+        self.assertEqual(set(self.rank_0.get_migratable_objects()), set(self.objects))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -82,6 +82,24 @@ class TestConfig(unittest.TestCase):
             transfer_base = TransferStrategyBase(criterion=None, parameters={}, logger=self.logger)
         self.assertEqual(err.exception.code, 1)
 
+    def test_lbs_transfer_strategy_base_prune_overloaded_targets(self):
+        peers = [Rank(r_id=i, logger=self.logger) for i in range(1, 5)]
+        known_peers = {self.rank: {self.rank, *peers}}
+        transfer_strategy = TransferStrategyBase(
+            criterion=self.criterion, parameters={"deterministic_transfer": True}, logger=self.logger)
+        transfer_strategy._initialize_transfer_stage(2.0)
+
+        # All known peers are targets when their loads are not known
+        self.assertEqual(
+            transfer_strategy._get_ranks_to_traverse([self.rank], known_peers),
+            {self.rank: set(peers)})
+
+        # Peers known to be above average or with unknown load are pruned
+        known_loads = {self.rank: {self.rank: 10.0, peers[0]: 1.0, peers[1]: 2.0, peers[2]: 3.0}}
+        self.assertEqual(
+            transfer_strategy._get_ranks_to_traverse([self.rank], known_peers, known_loads),
+            {self.rank: {peers[0], peers[1]}})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -135,7 +135,7 @@ class TestConfig(unittest.TestCase):
 
         with self.assertRaises(SchemaError) as err:
             ConfigurationValidator(config_to_validate=configuration, logger=get_logger()).main()
-        self.assertEqual(err.exception.args[0], "LoadOnly or AffineCombination must be chosen")
+        self.assertEqual(err.exception.args[0], "LoadOnly or AffineCombination or Expression or TopologyAware or Subphase must be chosen")
 
     def test_config_validator_wrong_work_model_parameters_missing(self):
         with open(os.path.join(self.config_dir, "conf_wrong_work_model_parameters_missing.yml"), "rt", encoding="utf-8") as config_file:
@@ -211,6 +211,15 @@ class TestConfig(unittest.TestCase):
             configuration = yaml.safe_load(yaml_str)
         ConfigurationValidator(config_to_validate=configuration, logger=get_logger()).main()
 
+    def test_config_validator_correct_expression_work_model(self):
+        with open(os.path.join(self.config_dir, "conf_correct_expression_work_model.yml"), "rt", encoding="utf-8") as config_file:
+            yaml_str = config_file.read()
+            configuration = yaml.safe_load(yaml_str)
+        ConfigurationValidator(config_to_validate=configuration, logger=get_logger()).main()
+        configuration["work_model"]["parameters"]["node_bounds"] = "yes"
+        with self.assertRaises(SchemaError):
+            ConfigurationValidator(config_to_validate=configuration, logger=get_logger()).main()
+
     def test_config_from_data_min_config(self):
         with open(os.path.join(self.config_dir, "conf_correct_from_data_min_config.yml"), "rt", encoding="utf-8") as config_file:
             yaml_str = config_file.read()
@@ -327,5 +336,16 @@ class TestConfig(unittest.TestCase):
             ConfigurationValidator(config_to_validate=configuration, logger=get_logger()).main()
         self.assertEqual(err.exception.args[0], "Should be of type 'float' and >= 0.0")
 
+    def test_config_validator_correct_batch_phase_ids(self):
+        with open(os.path.join(self.config_dir, "conf_correct_batch_phase_ids.yml"), "rt", encoding="utf-8") as config_file:
+            yaml_str = config_file.read()
+            configuration = yaml.safe_load(yaml_str)
+        ConfigurationValidator(config_to_validate=configuration, logger=get_logger()).main()
+        configuration["algorithm"]["phase_id"] = [0, 1]
+        ConfigurationValidator(config_to_validate=configuration, logger=get_logger()).main()
+        configuration["algorithm"]["phase_id"] = "some"
+        with self.assertRaises(SchemaError):
+            ConfigurationValidator(config_to_validate=configuration, logger=get_logger()).main()
+
 if __name__ == "__main__":
     unittest.main()
@@ -50,6 +50,8 @@ import unittest
 
 import lbaf.IO.lbsStatistics as lbsStatistics
 from src.lbaf.IO.lbsStatistics import Statistics
+from src.lbaf.Model.lbsObject import Object
+from src.lbaf.Model.lbsObjectCommunicator import ObjectCommunicator
 
 
 class TestConfig(unittest.TestCase):
@@ -171,6 +173,87 @@ class TestConfig(unittest.TestCase):
         self.assertAlmostEqual(lbsStats_exp.get_standard_deviation(), expected_standard_deviation)
         self.assertAlmostEqual(lbsStats_exp.get_kurtosis_excess(), expected_kurtosis_excess)
 
+    def test_lbs_stats_compute_min_max_arrangements_work_vectorized(self):
+        # Create objects communicating along a ring
+        objects = tuple(Object(seq_id=i, load=l) for i, l in enumerate([3.0, 1.0, 2.0, 2.0, 0.5]))
+        for i, o in enumerate(objects):
+            o.set_communicator(ObjectCommunicator(
+                i=i, logger=self.logger,
+                r={objects[i - 1]: 1.0 + i},
+                s={objects[(i + 1) % len(objects)]: 2.0 + i}))
+
+        # Results must match those of arrangement enumeration
+        for beta, gamma, n_workers in ((0.0, 0.0, 1), (0.5, 1.0, 1), (1.0, 0.0, 2)):
+            n_a, w_min_max, a_min_max = lbsStatistics.compute_min_max_arrangements_work(
+                objects, 1.0, beta, gamma, 0.0, 3)
+            self.assertEqual(
+                lbsStatistics.compute_min_max_arrangements_work_vectorized(
+                    objects, 1.0, beta, gamma, 0.0, 3, n_workers=n_workers, batch_size=16),
+                (n_a, w_min_max, a_min_max))
+
+    def test_lbs_stats_compute_min_max_arrangement_branch_and_bound(self):
+        # Compare with exhaustive enumeration on small instances
+        rnd.seed(146)
+        for _ in range(20):
+            object_loads = [rnd.choice([0.5, 1.0, 2.0, 3.0, rnd.random()]) for _ in range(rnd.randint(1, 6))]
+            objects = tuple(Object(seq_id=i, load=l) for i, l in enumerate(object_loads))
+            n_ranks = rnd.randint(1, 3)
+            _, w_min_max, _ = lbsStatistics.compute_min_max_arrangements_work(
+                objects, 1.0, 0.0, 0.5, 0.0, n_ranks)
+            _, w_bb, arrangement = lbsStatistics.compute_min_max_arrangement_branch_and_bound(
+                object_loads, [1.0] * n_ranks, [0.0] * n_ranks, 0.5)
+            self.assertAlmostEqual(w_bb, w_min_max)
+            self.assertAlmostEqual(max(lbsStatistics.compute_arrangement_works(
+                objects, arrangement, 1.0, 0.0, 0.5, 0.0).values()), w_min_max)
+
+        # Account for rank speeds and loads of objects that cannot be moved
+        n_nodes, w_bb, arrangement = lbsStatistics.compute_min_max_arrangement_branch_and_bound(
+            [4.0, 3.0, 3.0, 2.0], [1.0, 2.0], [1.0, 0.0], 0.0)
+        self.assertEqual(w_bb, 9.0)
+        self.assertEqual(arrangement, (1, 0, 0, 0))
+        self.assertGreater(n_nodes, 0)
+
+        # Solve larger instances with identical ranks
+        object_loads = [float(rnd.randint(1, 20)) for _ in range(30)]
+        _, w_bb, arrangement = lbsStatistics.compute_min_max_arrangement_branch_and_bound(
+            object_loads, [1.0] * 4, [0.0] * 4, 0.0)
+        self.assertEqual(w_bb, math.ceil(sum(object_loads) / 4))
+        self.assertEqual(len(arrangement), 30)
+
+        # Solve real-valued instances with identical ranks
+        object_loads = [rnd.uniform(0.5, 10.0) for _ in range(10)]
+        objects = tuple(Object(seq_id=i, load=l) for i, l in enumerate(object_loads))
+        _, w_min_max, _ = lbsStatistics.compute_min_max_arrangements_work_vectorized(
+            objects, 1.0, 0.0, 0.0, 0.0, 3)
+        _, w_bb, arrangement = lbsStatistics.compute_min_max_arrangement_branch_and_bound(
+            object_loads, [1.0] * 3, [0.0] * 3, 0.0)
+        self.assertAlmostEqual(w_bb, w_min_max)
+        object_loads = [rnd.uniform(0.5, 10.0) for _ in range(20)]
+        _, w_bb, arrangement = lbsStatistics.compute_min_max_arrangement_branch_and_bound(
+            object_loads, [1.0] * 4, [0.0] * 4, 0.0)
+        _, w_rtol, _ = lbsStatistics.compute_min_max_arrangement_branch_and_bound(
+            object_loads, [1.0] * 4, [0.0] * 4, 0.0, rtol=1e-3)
+        self.assertGreaterEqual(w_bb, sum(object_loads) / 4)
+        self.assertAlmostEqual(w_bb, max(
+            sum(l for l, a in zip(object_loads, arrangement) if a == j) for j in range(4)))
+        self.assertLessEqual(w_bb, w_rtol)
+        self.assertLessEqual(w_rtol, w_bb * (1.0 + 1e-3))
+
+        # Stop without search when initial arrangement reaches lower bound
+        n_nodes, w_bb, _ = lbsStatistics.compute_min_max_arrangement_branch_and_bound(
+            [2.5, 1.5, 1.0, 3.0], [1.0] * 2, [0.0] * 2, 0.0)
+        self.assertEqual(w_bb, 4.0)
+        self.assertEqual(n_nodes, 0)
+
+        # Keep best arrangement found so far when out of nodes
+        object_loads = [rnd.uniform(0.5, 10.0) for _ in range(30)]
+        n_nodes, w_bb, arrangement = lbsStatistics.compute_min_max_arrangement_branch_and_bound(
+            object_loads, [1.0] * 4, [0.0] * 4, 0.0, max_nodes=1000)
+        self.assertEqual(n_nodes, 1000)
+        self.assertEqual(len(arrangement), 30)
+        self.assertAlmostEqual(w_bb, max(
+            sum(l for l, a in zip(object_loads, arrangement) if a == j) for j in range(4)))
+
 def id_test(x):
     return x
 
@@ -41,13 +41,20 @@
 #@HEADER
 #
 import os
+import math
 import logging
 import unittest
 
 from src.lbaf import PROJECT_PATH
 from src.lbaf.Model.lbsRank import Rank
+from src.lbaf.Model.lbsNodeVolumesTracker import NodeVolumesTracker
 from src.lbaf.Model.lbsObject import Object
+from src.lbaf.Model.lbsObjectCommunicator import ObjectCommunicator
+from src.lbaf.Model.lbsNode import Node
+from src.lbaf.Model.lbsPhase import Phase
+from src.lbaf.Model.lbsSubphaseLoadsTracker import SubphaseLoadsTracker
 from src.lbaf.Model.lbsWorkModelBase import WorkModelBase
+from src.lbaf.Execution.lbsCriterionBase import CriterionBase
 
 
 class TestConfig(unittest.TestCase):
@@ -86,5 +93,172 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(affine_combination_work_model.compute(self.rank),
                         self.rank_load + max(self.rank.get_received_volume(), self.rank.get_sent_volume()) + 1.0)
 
+    def test_lbs_expression_work_model(self):
+        expression_params = {"expression": "alpha * load + beta * max(sent_volume, received_volume) + gamma",
+                             "beta": 1.0,
+                             "gamma": 1.0,
+                             "upper_bounds": {"max_memory_usage": 8.0e+9}}
+        expression_work_model = WorkModelBase.factory("Expression", parameters=expression_params, lgr=self.logger)
+        affine_combination_work_model = WorkModelBase.factory(
+            "AffineCombination", parameters={"beta": 1.0, "gamma": 1.0}, lgr=self.logger)
+        self.assertEqual(expression_work_model.get_constants(), {"beta": 1.0, "gamma": 1.0})
+        self.assertEqual(expression_work_model.compute(self.rank),
+                         affine_combination_work_model.compute(self.rank))
+
+        # Vectorized evaluation must match scalar evaluation
+        ranks = [self.rank, Rank(r_id=1, migratable_objects={Object(seq_id=4, load=2.0)}, logger=self.logger)]
+        self.assertEqual(list(expression_work_model.compute_all(ranks)),
+                         [expression_work_model.compute(r) for r in ranks])
+
+    def test_lbs_expression_work_model_shadowing(self):
+        # Named parameters take precedence over rank QOIs of the same name
+        expression_work_model = WorkModelBase.factory(
+            "Expression", parameters={"expression": "alpha * load", "alpha": 2.0, "load": 3.0}, lgr=self.logger)
+        self.assertEqual(expression_work_model.compute(self.rank), 6.0)
+        self.assertEqual(list(expression_work_model.compute_all([self.rank])), [6.0])
+
+        # Functions cannot be shadowed
+        with self.assertRaises(SystemExit):
+            WorkModelBase.factory("Expression", parameters={"expression": "load", "max": 1.0}, lgr=self.logger)
+
+    def test_lbs_expression_work_model_invalid(self):
+        for expression in ("load +", "unknown_qoi * load", "__import__('os')", "load.real", "print(load)"):
+            with self.assertRaises(SystemExit):
+                WorkModelBase.factory("Expression", parameters={"expression": expression}, lgr=self.logger)
+
+    def test_lbs_expression_work_model_undefined(self):
+        expression_work_model = WorkModelBase.factory(
+            "Expression", parameters={"expression": "load / (num_objects - 6)"}, lgr=self.logger)
+        self.assertEqual(expression_work_model.compute(self.rank), math.inf)
+        self.assertEqual(list(expression_work_model.compute_all([self.rank])), [math.inf])
+
+        # Non-real and overflowing results are infinite
+        for expression in (
+                f"(load - {self.rank_load + 2.0}) ** 0.5", f"max((load - {self.rank_load + 2.0}) ** 0.5, 1)",
+                "(-8) ** 0.5 + load", "10 ** 10 ** 10", "(load + 2) ** 10 ** 10"):
+            expression_work_model = WorkModelBase.factory(
+                "Expression", parameters={"expression": expression}, lgr=self.logger)
+            self.assertEqual(expression_work_model.compute(self.rank), math.inf)
+            self.assertEqual(list(expression_work_model.compute_all([self.rank])), [math.inf])
+
+    def test_lbs_topology_aware_work_model(self):
+        # Create 4 ranks on 2 nodes with one object each, communicating along a ring
+        objects = [Object(seq_id=i, load=1.0) for i in range(4)]
+        for i, o in enumerate(objects):
+            o.set_communicator(ObjectCommunicator(
+                i=i, logger=self.logger, s={objects[(i + 1) % 4]: 1.0 + i}, r={objects[(i - 1) % 4]: 1.0 + (i - 1) % 4}))
+        nodes = [Node(self.logger, n_id) for n_id in range(2)]
+        ranks = []
+        for i, o in enumerate(objects):
+            ranks.append(rank := Rank(r_id=i, migratable_objects={o}, logger=self.logger))
+            o.set_rank_id(i)
+            rank.set_node(nodes[i // 2])
+            nodes[i // 2].add_rank(rank)
+        phase = Phase(self.logger)
+        phase.set_ranks(ranks)
+
+        # Rank 1 sends 2.0 off-node to rank 2 and receives 1.0 on-node from rank 0
+        work_model = WorkModelBase.factory(
+            "TopologyAware", parameters={"beta_intra": 1.0, "beta_inter": 10.0, "gamma": 0.0}, lgr=self.logger)
+        self.assertEqual(work_model.compute(ranks[1]), 1.0 + 1.0 + 20.0)
+
+        # Incrementally maintained volumes must match from-scratch ones
+        work_model.set_phase(phase)
+        volumes = phase.get_tracker(NodeVolumesTracker)
+        self.assertEqual(volumes.get_intra_node_volumes(ranks[1]), (0.0, 1.0))
+        self.assertEqual(volumes.get_inter_node_volumes(ranks[1]), (2.0, 0.0))
+        phase.transfer_object(ranks[2], objects[2], ranks[1])
+        phase.transfer_object(ranks[0], objects[0], ranks[3])
+        for rank in ranks:
+            self.assertEqual(
+                (volumes.get_intra_node_volumes(rank), volumes.get_inter_node_volumes(rank)),
+                work_model.compute_node_volumes(rank))
+            self.assertEqual(rank.get_sent_volume(), sum(
+                volumes.get_intra_node_volumes(rank)[:1] + volumes.get_inter_node_volumes(rank)[:1]))
+        self.assertEqual(work_model.compute(ranks[1]), 2.0 + 0.0 + 10.0 * 3.0)
+
+        # Ranks not belonging to bound phase are evaluated from scratch
+        self.assertIsNone(volumes.get_intra_node_volumes(self.rank))
+        self.assertEqual(work_model.compute(self.rank), self.rank_load)
+
+    def test_lbs_topology_aware_work_model_outside_peers(self):
+        # Create 4 ranks on 2 nodes with one object each, communicating along a ring
+        objects = [Object(seq_id=i, load=1.0) for i in range(4)]
+        for i, o in enumerate(objects):
+            o.set_communicator(ObjectCommunicator(
+                i=i, logger=self.logger, s={objects[(i + 1) % 4]: 1.0 + i}, r={objects[(i - 1) % 4]: 1.0 + (i - 1) % 4}))
+        nodes = [Node(self.logger, n_id) for n_id in range(2)]
+        ranks = []
+        for i, o in enumerate(objects):
+            ranks.append(rank := Rank(r_id=i, migratable_objects={o}, logger=self.logger))
+            o.set_rank_id(i)
+            rank.set_node(nodes[i // 2])
+            nodes[i // 2].add_rank(rank)
+
+        # Phase without rank 3, which is the on-node peer of rank 2 and the off-node peer of rank 0
+        phase = Phase(self.logger)
+        phase.set_ranks(ranks[:3])
+        work_model = WorkModelBase.factory(
+            "TopologyAware", parameters={"beta_intra": 1.0, "beta_inter": 10.0, "gamma": 0.0}, lgr=self.logger)
+        work_model.set_phase(phase)
+        volumes = phase.get_tracker(NodeVolumesTracker)
+        self.assertEqual(volumes.get_intra_node_volumes(ranks[2]), (3.0, 0.0))
+        self.assertEqual(volumes.get_inter_node_volumes(ranks[0]), (0.0, 4.0))
+
+        # Incrementally maintained volumes must match from-scratch ones
+        phase.transfer_object(ranks[2], objects[2], ranks[0])
+        phase.transfer_object(ranks[1], objects[1], ranks[2])
+        for rank in ranks[:3]:
+            self.assertEqual(
+                (volumes.get_intra_node_volumes(rank), volumes.get_inter_node_volumes(rank)),
+                work_model.compute_node_volumes(rank))
+
+    def test_lbs_subphase_work_model(self):
+        # Create 2 ranks with objects loaded in alternating subphases
+        subphases = ([{"id": 0, "time": 3.0}, {"id": 1, "time": 1.0}], [{"id": 0, "time": 1.0}, {"id": 1, "time": 3.0}])
+        objects = [Object(seq_id=i, load=4.0, subphases=subphases[i % 2]) for i in range(4)]
+        objects.append(Object(seq_id=4, load=2.0))
+        ranks = [Rank(r_id=0, migratable_objects=set(objects[:2]), logger=self.logger),
+                 Rank(r_id=1, migratable_objects=set(objects[2:]), logger=self.logger)]
+        for r in ranks:
+            for o in r.get_objects():
+                o.set_rank_id(r.get_id())
+        phase = Phase(self.logger)
+        phase.set_ranks(ranks)
+
+        # Unbound ranks are their own critical path
+        work_model = WorkModelBase.factory("Subphase", parameters={}, lgr=self.logger)
+        self.assertEqual(work_model.compute(ranks[1]), 10.0)
+        self.assertEqual(work_model.compute_critical_path(ranks), 10.0)
+        self.assertIsNone(WorkModelBase.factory("LoadOnly", parameters={}, lgr=self.logger).compute_critical_path(ranks))
+
+        # Bound ranks sum their rows of subphase loads
+        work_model.set_phase(phase)
+        subphase_loads = phase.get_tracker(SubphaseLoadsTracker)
+        self.assertEqual(subphase_loads.get_subphase_loads().tolist(), [[4.0, 4.0], [6.0, 4.0]])
+        self.assertEqual(work_model.compute(ranks[0]), 8.0)
+        self.assertEqual(work_model.compute(ranks[1]), 10.0)
+        self.assertEqual(work_model.compute_critical_path(ranks[:1]), 10.0)
+
+        # Grouping objects loaded in the same subphase lengthens the critical path
+        phase.transfer_object(ranks[0], objects[1], ranks[1])
+        phase.transfer_object(ranks[1], objects[2], ranks[0])
+        self.assertEqual(subphase_loads.get_subphase_loads().tolist(), [[6.0, 2.0], [4.0, 6.0]])
+        self.assertEqual(list(work_model.compute_all(ranks)), [8.0, 10.0])
+        self.assertEqual(work_model.compute_critical_path(ranks), 12.0)
+
+        # Maintained subphase maxima must match recomputed ones
+        phase.transfer_object(ranks[1], objects[4], ranks[0])
+        self.assertEqual(subphase_loads.get_subphase_maxima().tolist(), [8.0, 6.0])
+        phase.transfer_object(ranks[0], objects[4], ranks[1])
+        self.assertEqual(subphase_loads.get_subphase_maxima().tolist(), [6.0, 6.0])
+        self.assertIsNone(subphase_loads.get_subphase_row(self.rank))
+
+        # Ranks of bound phase share its critical path in criterion
+        criterion = CriterionBase.factory("Tempered", work_model, self.logger)
+        criterion.set_phase(phase)
+        self.assertEqual(criterion.compute(ranks[0], [objects[2]], ranks[1], [objects[1]]), 2.0)
+
+
 if __name__ == "__main__":
     unittest.main()
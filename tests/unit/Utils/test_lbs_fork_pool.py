@@ -0,0 +1,75 @@
+#
+#@HEADER
+###############################################################################
+#
+#                            test_lbs_fork_pool.py
+#               DARMA/LB-analysis-framework => LB Analysis Framework
+#
+# Copyright 2019-2024 National Technology & Engineering Solutions of Sandia, LLC
+# (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from this
+#   software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# Questions? Contact darma@sandia.gov
+#
+###############################################################################
+#@HEADER
+#
+import unittest
+
+from src.lbaf.Utils.lbsForkPool import fork_pool, get_shared_context
+
+
+def _get_value(key: str):
+    return get_shared_context("test")[key]
+
+
+class TestForkPool(unittest.TestCase):
+    def test_lbs_fork_pool_in_process(self):
+        with fork_pool("test", {"a": 1}, 1) as pool:
+            self.assertIsNone(pool)
+            self.assertEqual(_get_value("a"), 1)
+        with self.assertRaises(KeyError):
+            get_shared_context("test")
+
+    def test_lbs_fork_pool_workers(self):
+        with fork_pool("test", {"a": 2}, 2) as pool:
+            self.assertEqual(pool.map(_get_value, ["a"] * 4), [2] * 4)
+
+    def test_lbs_fork_pool_nested(self):
+        # Enclosing context must be restored on exit, also upon error
+        with fork_pool("test", {"a": 1}, 1):
+            with self.assertRaises(ValueError):
+                with fork_pool("test", {"a": 3}, 1):
+                    self.assertEqual(_get_value("a"), 3)
+                    raise ValueError
+            self.assertEqual(_get_value("a"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()